@@ -1,7 +1,10 @@
 import argparse
 import os
+from functools import partial
 from analyzers.base.analyzer import AnalyzerBase
+from configs.base.github import GITHUB_LINK_HEALTH_PATH
 from configs.base.types import Platform
+from crawlers.base.links import LinkChecker
 
 
 def parse_args():
@@ -13,31 +16,52 @@ def parse_args():
         required=True,
         help="Platform to crawl projects from",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to analyze the reports with",
+    )
+    parser.add_argument(
+        "--check-broken",
+        action="store_true",
+        help="Request the GitHub links of the reports to count the broken ones",
+    )
     return parser.parse_args()
 
 
-def analyzer_instance(platform: str, root_dir: str) -> AnalyzerBase:
+def analyzer_instance(
+    platform: str, root_dir: str, workers: int = 1, check_broken: bool = False
+) -> AnalyzerBase:
     print(f"Creating analyzer for {platform}\n")
     module_path = f"analyzers.{platform.lower()}.analyzer"
     class_name = "Analyzer"
     module = __import__(module_path, fromlist=[class_name])
     analyzer_class = getattr(module, class_name)
-    return analyzer_class(root_dir)
+    link_checker = None
+    if check_broken:
+        link_checker = partial(
+            LinkChecker, GITHUB_LINK_HEALTH_PATH.format(root_dir=root_dir)
+        )
+    return analyzer_class(root_dir, workers, link_checker)
 
 
-def analyzer_factory(platform: str, root_dir: str) -> list[AnalyzerBase]:
+def analyzer_factory(
+    platform: str, root_dir: str, workers: int = 1, check_broken: bool = False
+) -> list[AnalyzerBase]:
     ## initialize the list of types and platforms
     platfroms = [p.value.lower() for p in Platform]
     platform = platform.lower()
     analyzers = []
     if platform == "all":
         for platform in platfroms:
-            analyzer = analyzer_factory(platform, root_dir)
+            analyzer = analyzer_factory(platform, root_dir, workers, check_broken)
             analyzers.append(analyzer[0])
     else:
         if platform not in platfroms:
             raise ValueError(f"Platform must be in {platfroms}")
-        analyzer = analyzer_instance(platform, root_dir)
+        analyzer = analyzer_instance(platform, root_dir, workers, check_broken)
         analyzers.append(analyzer)
     return analyzers
 
@@ -45,6 +69,8 @@ def analyzer_factory(platform: str, root_dir: str) -> list[AnalyzerBase]:
 if __name__ == "__main__":
     root_dir = os.path.dirname(__file__)
     args = parse_args()
-    analyzers = analyzer_factory(args.platform, root_dir)
+    analyzers = analyzer_factory(
+        args.platform, root_dir, args.workers, args.check_broken
+    )
     for analyzer in analyzers:
         analyzer.analyze()
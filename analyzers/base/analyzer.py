@@ -1,15 +1,21 @@
 import os
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from typing import Any, Callable
 from tqdm import tqdm
 
+from configs.base.github import GITHUB_BASE_URL
+from helpers.filename import safe_filename
 from helpers.report import (
     get_all_links_from_report,
     get_languages_from_project_url,
+    get_languages_of_report,
     analyze_links_info,
     create_tqdm_title,
 )
+from configs.base.types import FindingsDetail, Issue, LinkInfo, ReportLink
 
 
 @dataclass
@@ -19,9 +25,18 @@ class AnalyzerConfig:
     report_data_path: str
     analysis_data_path: str
     analysis_error_path: str
+    # processes the reports are analyzed on, 1 analyzes them in this one
+    workers: int = 1
+    # builds the checker the GitHub links of the reports are requested with
+    # (check_all, is_broken, close) to count the broken ones, see analyze.py;
+    # None leaves them unchecked
+    link_checker: Callable[[], Any] | None = None
 
 
 class AnalyzerBase(ABC):
+    # keys of a findings detail after project_name, in the platform's order
+    findings_detail_keys = ("languages", "issues")
+
     def __init__(self, config: AnalyzerConfig):
         self.project_list_path = config.project_list_path.format(
             root_dir=config.root_dir
@@ -39,6 +54,9 @@ class AnalyzerBase(ABC):
         self.analysis_error_dir_path = "/".join(
             self.analysis_error_path.split("/")[0:-1]
         )
+        self.workers = max(1, config.workers)
+        self.link_checker = config.link_checker
+        self.check_broken = self.link_checker is not None
 
         os.makedirs(self.analysis_error_dir_path, exist_ok=True)
         if not os.path.exists(self.project_list_path):
@@ -47,6 +65,13 @@ class AnalyzerBase(ABC):
     def get_project_name_from_path(self, path: str):
         return path.split("/")[-1].split(".json")[0]
 
+    def get_report_name_from_path(self, path: str):
+        return path.split("/")[-1].split(".")[0]
+
+    def get_severity_count_key(self, path: str):
+        """Key of a report's severity count in the analysis."""
+        return self.get_report_name_from_path(path)
+
     def save_analysis_data(self, data: dict):
         with open(self.analysis_data_path, "w") as f:
             json.dump(data, f)
@@ -75,6 +100,29 @@ class AnalyzerBase(ABC):
             raise Exception(f"Project list data not a list: {self.project_list_path}")
         return projects
 
+    def get_report_name_of_project(self, project_name: str) -> str:
+        """
+        Name of the report the report crawler saves project_name to, see
+        ReportCrawlerBase.set_current_project and save_report_data.
+        """
+        root = project_name.replace("/", "\\")
+        return self.get_project_name_from_path(safe_filename(root, ".json"))
+
+    def load_project_index(self) -> dict[str, dict]:
+        """
+        Projects of the project list by the name of their report. A project
+        is also found by its own name, the first of the list wins as with a
+        scan of the list.
+        """
+        projects = self.load_project_list()
+        index = {}
+        for project in projects:
+            index.setdefault(project["project_name"], project)
+        for project in projects:
+            name = self.get_report_name_of_project(project["project_name"])
+            index.setdefault(name, project)
+        return index
+
     def get_overall_projects_info(self):
         projects = self.load_project_list()
         analysis = {
@@ -92,25 +140,127 @@ class AnalyzerBase(ABC):
                 analysis["pdf"] += 1
         return analysis
 
-    def get_links_info_of_reports(self) -> dict[str, dict[str, int]]:
+    def get_links_info_of_report(self, report: dict) -> LinkInfo:
+        links = get_all_links_from_report(report)
+        return analyze_links_info(links, check_broken=False)
+
+    def check_links(
+        self, report_links: dict[str, list[ReportLink]]
+    ) -> dict[str, LinkInfo]:
+        """
+        Links info of the links of each report, counting the broken GitHub
+        links. The links of every report are checked together, each url
+        once, and their health is kept for the next runs.
+        """
+        checker = self.link_checker()
+        try:
+            checker.check_all(
+                link.get("url", "")
+                for links in report_links.values()
+                for link in links
+                if link.get("url", "").startswith(GITHUB_BASE_URL)
+            )
+            return {
+                name: analyze_links_info(links, True, checker.is_broken)
+                for name, links in report_links.items()
+            }
+        finally:
+            checker.close()
+
+    def get_report_visitors(self) -> dict[str, Callable[[dict], Any]]:
+        """
+        Per-report analyses by name, each is called with the loaded JSON of
+        every report. Platforms provide the severity and issues ones.
+        """
+        return {
+            # with check_broken the links are counted after every report is
+            # read, see check_links
+            "links": (
+                get_all_links_from_report
+                if self.check_broken
+                else self.get_links_info_of_report
+            ),
+            "severity_count": self.get_severity_count_of_report,
+            # before issues, the issues of some platforms are annotated in place
+            "languages": get_languages_of_report,
+            "issues": self.get_issues_of_report,
+        }
+
+    def analyze_report(self, file_path: str) -> tuple[dict[str, Any], list[str]]:
         """
-        Each report contains a list of links.
-        This function will analyze the links in each report.
+        Results of every visitor on the report at file_path, and the errors
+        of the visitors that failed on it (or of loading it).
         """
-        # get all file under self.report_data_dir_path
-        reports_links_info = {}
-        report_file_paths = self.get_reports_file_paths()
-        title = create_tqdm_title("Links info of reports")
-        for file_path in tqdm(report_file_paths, desc=title):
-            report_name = file_path.split("/")[-1].split(".")[0]
+        try:
+            report = self.load_json_file(file_path)
+        except Exception as e:
+            return {}, [f"Error in {file_path}: {e}"]
+
+        results, errors = {}, []
+        for name, visit in self.get_report_visitors().items():
             try:
-                report = self.load_json_file(file_path)
-                links = get_all_links_from_report(report)
-                info = analyze_links_info(links, check_broken=False)
-                reports_links_info[report_name] = info
+                results[name] = visit(report)
             except Exception as e:
-                self.save_analysis_error(f"Error in {file_path}: {e}")
-        return reports_links_info
+                errors.append(f"Error in {file_path}: {e}")
+        return results, errors
+
+    def analyze_reports(
+        self,
+    ) -> tuple[dict[str, LinkInfo], dict[str, dict], list[FindingsDetail]]:
+        """
+        One pass over the reports: each is loaded once and handed to every
+        visitor of get_report_visitors, their results are merged into the
+        links info, severity count and findings details of the reports.
+
+        With more than one worker the reports are sharded across a process
+        pool; the partial results are merged in the order of the report
+        paths, so the analysis is the same whatever the number of workers.
+
+        A report that cannot be loaded, or that a visitor fails on, is
+        logged to the analysis errors and left out of that visitor's part.
+        """
+        file_paths = sorted(self.get_reports_file_paths())
+        links_info, severity_count, findings_details = {}, {}, []
+        title = create_tqdm_title("Reports")
+        executor = None
+        if self.workers > 1 and len(file_paths) > 1:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            chunksize = max(1, len(file_paths) // (self.workers * 8))
+            outcomes = executor.map(
+                self.analyze_report, file_paths, chunksize=chunksize
+            )
+        else:
+            outcomes = map(self.analyze_report, file_paths)
+
+        try:
+            for file_path, (results, errors) in tqdm(
+                zip(file_paths, outcomes), total=len(file_paths), desc=title
+            ):
+                for error in errors:
+                    self.save_analysis_error(error)
+                if "links" in results:
+                    links_info[self.get_report_name_from_path(file_path)] = results[
+                        "links"
+                    ]
+                if "severity_count" in results:
+                    severity_count[self.get_severity_count_key(file_path)] = results[
+                        "severity_count"
+                    ]
+                if all(key in results for key in self.findings_detail_keys):
+                    detail = {
+                        "project_name": self.get_project_name_from_path(file_path)
+                    }
+                    for key in self.findings_detail_keys:
+                        detail[key] = results[key]
+                    findings_details.append(detail)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        if self.check_broken:
+            links_info = self.check_links(links_info)
+        self.add_timestamps(findings_details)
+        return links_info, severity_count, findings_details
 
     def get_languages_of_projects(self) -> dict[str, int]:
         languages = {}
@@ -123,6 +273,19 @@ class AnalyzerBase(ABC):
             languages[projects_name] = project_languages
         return languages
 
+    @abstractmethod
+    def get_severity_count_of_report(self, report_data: dict) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    def get_issues_of_report(self, report_data: dict) -> list[Issue]:
+        pass
+
+    @abstractmethod
+    def add_timestamps(self, findings_details: list[FindingsDetail]):
+        """Set the timestamp of each findings detail from the project list."""
+        pass
+
     @abstractmethod
     def analyze(self):
         pass
@@ -0,0 +1,36 @@
+# light crawl profile of Chrome sessions: the DOM is read as soon as it is
+# parsed (the crawlers wait for the elements they need), and resources no
+# crawler reads are never downloaded
+PAGE_LOAD_STRATEGY = "eager"
+BLOCKED_URL_PATTERNS = [
+    # images, fonts and media
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.avif",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    # analytics, tag managers, chat widgets and video embeds
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*segment.com*",
+    "*mixpanel.com*",
+    "*intercom.io*",
+    "*intercomcdn.com*",
+    # not HubSpot: the OpenZeppelin blog is hosted on it
+    "*facebook.net*",
+    "*youtube.com*",
+    "*vimeo.com*",
+]
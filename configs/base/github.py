@@ -1,6 +1,47 @@
+from configs.base.types import language_candidates
+
 GITHUB_BASE_URL = "https://github.com"
 GITHUB_BASE__API_URL = "https://api.github.com/repos"
 GITHUB_URL_PATTERN = (
     GITHUB_BASE_URL
-    + r"/(?P<username>[^/]+)/(?P<repo>[^/]+)(?:(?:/blob|/tree)/(?P<branch>[^/]+)/(?P<path>[^#]*))?(?:#L(?P<start_line>\d+)(?:-L(?P<end_line>\d+))?)?(?:/issues/(?P<issue_number>\d+))?$"
+    + r"/(?P<username>[^/]+)/(?P<repo>[^/]+)(?:(?:/blob|/tree)/(?P<branch>[^/]+)(?:/(?P<path>[^#]*))?)?(?:#L(?P<start_line>\d+)(?:-L(?P<end_line>\d+))?)?(?:/(?P<issues>issues)(?:/(?P<issue_number>\d+))?)?$"
 )
+# conditional-request cache of API responses, shared by every platform
+GITHUB_CACHE_DIR_PATH = "{root_dir}/data/github/cache"
+# API urls pinned to a commit sha never change and are not revalidated
+GITHUB_IMMUTABLE_REF_PATTERN = r"[?&]ref=[0-9a-f]{40}(?:&|$)"
+# links to a file or tree at a commit sha, fetched once and kept
+GITHUB_PINNED_URL_PATTERN = r"/(?:blob|tree)/[0-9a-f]{40}(?:/|$)"
+# repository files keyed by git blob sha, shared by every platform
+GITHUB_BLOB_DIR_PATH = "{root_dir}/data/github/blobs"
+# bare mirrors files and repositories are read from with --git-mirror
+GITHUB_MIRROR_DIR_PATH = "{root_dir}/data/github/mirrors"
+# seconds a clone or fetch of a mirror, and any other git command on it, may
+# take before the repository falls back to the API
+GITHUB_MIRROR_CLONE_TIMEOUT = 900
+GITHUB_MIRROR_GIT_TIMEOUT = 120
+GITHUB_CLONE_URL = GITHUB_BASE_URL + "/{repo}.git"
+# files of a repository that are fetched: sources of the languages counted in
+# the analysis, up to the size cap in bytes
+GITHUB_REPO_FILE_EXTENSIONS = tuple(
+    pattern.replace("\\b", "").replace("\\", "") for pattern in language_candidates
+)
+GITHUB_REPO_MAX_FILE_SIZE = 1_000_000
+# issues of a repository cited at least this often are listed in bulk, a page
+# holds up to GITHUB_PAGE_SIZE of them
+GITHUB_BULK_ISSUE_THRESHOLD = 5
+GITHUB_PAGE_SIZE = 100
+# requests per hour of a token until the first response tells, and the
+# requests a token may send at once before the spread rate applies
+GITHUB_RATE_LIMIT = 5000
+GITHUB_RATE_BURST = 100
+# seconds an API request may stall, and retries of one that failed to
+# connect or answered 5xx
+GITHUB_REQUEST_TIMEOUT = 30
+GITHUB_REQUEST_RETRIES = 3
+# health of the GitHub links cited by reports (analyze.py --check-broken),
+# rechecked once older than the ttl in seconds
+GITHUB_LINK_HEALTH_PATH = "{root_dir}/data/github/links.json"
+GITHUB_LINK_HEALTH_TTL = 7 * 24 * 3600
+GITHUB_LINK_CHECK_CONCURRENCY = 16
+GITHUB_LINK_CHECK_TIMEOUT = 15
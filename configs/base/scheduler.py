@@ -0,0 +1,11 @@
+# politeness limits of the hosts crawled, per host unless HOST_POLICIES
+# overrides them
+HOST_REQUEST_RATE = 1.0  # requests per second
+HOST_MAX_CONCURRENCY = 4  # requests in flight
+HOST_JITTER = 0.25  # +/- fraction of the interval between two requests
+HOST_SLOW_RESPONSE = 5.0  # seconds, slower responses back off like a 5xx
+HOST_MAX_INTERVAL = 60.0  # seconds between requests at most when backing off
+HOST_POLICIES = {
+    # link checks of the analyzers, HEAD requests of cited files and issues
+    "github.com": {"rate": 10.0, "concurrency": 16},
+}
@@ -1,4 +1,5 @@
 from enum import Enum
+from dataclasses import dataclass
 from typing import TypedDict
 
 
@@ -25,6 +26,29 @@ class CrawlerType(Enum):
     Repo = "repo"
 
 
+@dataclass
+class CrawlSettings:
+    """Run-time options of a crawl, set from the crawl.py arguments."""
+
+    # number of browser sessions a report crawler runs projects on
+    pool_size: int = 1
+    # rebuild reports from the raw page cache, nothing is fetched
+    offline: bool = False
+    # only crawl projects that are new or changed since the manifest entry
+    incremental: bool = False
+    # skip the units the last run's journal records as done
+    resume: bool = False
+    # number of GitHub requests a repo crawler keeps in flight
+    concurrency: int = 4
+    # bulk issue lists also fetch the comments of every issue
+    issue_comments: bool = False
+    # read cited files and repositories from local git mirrors
+    git_mirror: bool = False
+    # load report and project pages fully, without the light profile
+    # (eager page load, blocked media and third-party hosts)
+    full_load: bool = False
+
+
 # ================================
 # type alias
 ProjectName = str
@@ -1,3 +1,4 @@
 CODE4RENA_URL = "https://code4rena.com/reports"
 PROJECT_LIST_PATH = "{root_dir}/data/code4rena/projects.json"
+PROJECT_JOURNAL_PATH = "{root_dir}/data/code4rena/journal/project.jsonl"
 MAX_RETRIES = 3
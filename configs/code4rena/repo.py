@@ -1 +1,2 @@
 GITHUB_REPO_DATA_DIR_PATH = "{root_dir}/data/code4rena/repos"
+REPO_JOURNAL_PATH = "{root_dir}/data/code4rena/journal/repo.jsonl"
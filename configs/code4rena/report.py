@@ -1,2 +1,5 @@
 REPORT_DATA_PATH = "{root_dir}/data/code4rena/reports/{name}"
 REPORT_ERROR_LOG_PATH = "{root_dir}/data/code4rena/errors/{name}.txt"
+REPORT_RAW_DATA_PATH = "{root_dir}/data/code4rena/raw"
+REPORT_MANIFEST_PATH = "{root_dir}/data/code4rena/manifest.json"
+REPORT_JOURNAL_PATH = "{root_dir}/data/code4rena/journal/report.jsonl"
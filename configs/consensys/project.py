@@ -1,3 +1,4 @@
 CONSENSYS_URL = "https://consensys.io/diligence/audits/"
 PROJECT_LIST_PATH = "{root_dir}/data/consensys/projects.json"
+PROJECT_JOURNAL_PATH = "{root_dir}/data/consensys/journal/project.jsonl"
 MAX_RETRIES = 3
@@ -1 +1,2 @@
 GITHUB_REPO_DATA_DIR_PATH = "{root_dir}/data/consensys/repos"
+REPO_JOURNAL_PATH = "{root_dir}/data/consensys/journal/repo.jsonl"
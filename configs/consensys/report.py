@@ -1,2 +1,5 @@
 REPORT_DATA_PATH = "{root_dir}/data/consensys/reports/{name}"
 REPORT_ERROR_LOG_PATH = "{root_dir}/data/consensys/errors/{name}.txt"
+REPORT_RAW_DATA_PATH = "{root_dir}/data/consensys/raw"
+REPORT_MANIFEST_PATH = "{root_dir}/data/consensys/manifest.json"
+REPORT_JOURNAL_PATH = "{root_dir}/data/consensys/journal/report.jsonl"
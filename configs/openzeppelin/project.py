@@ -1,4 +1,5 @@
 OPENZEPPELIN_URL = "https://blog.openzeppelin.com/tag/security-audits"
 PROJECT_LIST_PATH = "{root_dir}/data/openzeppelin/projects.json"
+PROJECT_JOURNAL_PATH = "{root_dir}/data/openzeppelin/journal/project.jsonl"
 MAX_RETRIES = 3
 PAGE_NUM = 19
@@ -1,3 +1,6 @@
 REPORT_DATA_PATH = "{root_dir}/data/openzeppelin/reports/{name}"
 REPORT_ERROR_LOG_PATH = "{root_dir}/data/openzeppelin/errors/{name}.txt"
+REPORT_RAW_DATA_PATH = "{root_dir}/data/openzeppelin/raw"
+REPORT_MANIFEST_PATH = "{root_dir}/data/openzeppelin/manifest.json"
+REPORT_JOURNAL_PATH = "{root_dir}/data/openzeppelin/journal/report.jsonl"
 REPORT_CONTAINER_CLASS = "blog-post-wrapper"
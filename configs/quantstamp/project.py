@@ -1,7 +1,10 @@
 QUANTSTAMP_URL = "https://certificate.quantstamp.com"
 PROJECT_LIST_PATH = "{root_dir}/data/quantstamp/projects.json"
+PROJECT_JOURNAL_PATH = "{root_dir}/data/quantstamp/journal/project.jsonl"
 TABLE_CONTAINER_XPATH = "/html/body/div[1]/div/div[3]"
 MAX_RETRIES = 3
+# seconds a scroll waits for new rows
+SCROLL_TIMEOUT = 2
 
 PROJECT_LIST_COLUMNS = [
     "PROJECT NAME",
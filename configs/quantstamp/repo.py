@@ -1 +1,2 @@
 GITHUB_REPO_DATA_DIR_PATH = "{root_dir}/data/quantstamp/repos"
+REPO_JOURNAL_PATH = "{root_dir}/data/quantstamp/journal/repo.jsonl"
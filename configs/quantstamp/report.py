@@ -3,6 +3,9 @@ from enum import Enum
 
 REPORT_DATA_PATH = "{root_dir}/data/quantstamp/reports/{name}"
 REPORT_ERROR_LOG_PATH = "{root_dir}/data/quantstamp/errors/{name}.txt"
+REPORT_RAW_DATA_PATH = "{root_dir}/data/quantstamp/raw"
+REPORT_MANIFEST_PATH = "{root_dir}/data/quantstamp/manifest.json"
+REPORT_JOURNAL_PATH = "{root_dir}/data/quantstamp/journal/report.jsonl"
 # data storage
 REPORT_SECTION_XPATH = "/html/body/div/div/div/div[2]/section[{number}]"
 REPORT_CONTAINER_XPATH = "/html/body/div/div/div/div[2]"
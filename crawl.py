@@ -3,8 +3,9 @@ import argparse
 import threading
 import dotenv
 from enum import Enum
-from configs.base.types import Platform, CrawlerType
+from configs.base.types import Platform, CrawlerType, CrawlSettings
 from crawlers.base.report import ReportCrawlerBase
+from crawlers.base.scheduler import host_scheduler
 
 
 def parse_args():
@@ -23,12 +24,67 @@ def parse_args():
         required=True,
         help="Platform to crawler projects from",
     )
+    parser.add_argument(
+        "-n",
+        "--pool-size",
+        type=int,
+        default=1,
+        help="Number of browser sessions a report crawler runs projects on",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of concurrent GitHub requests of a repo crawler",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Rebuild reports from the raw page cache without fetching",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only crawl reports that are new or changed since the last crawl",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the units the journal of the last run records as done",
+    )
+    parser.add_argument(
+        "--issue-comments",
+        action="store_true",
+        help="Also fetch the comments of issues a repo crawler lists in bulk",
+    )
+    parser.add_argument(
+        "--git-mirror",
+        action="store_true",
+        help="Read cited files and repositories from local git mirrors",
+    )
+    parser.add_argument(
+        "--full-load",
+        action="store_true",
+        help="Load every resource of a page instead of the light profile",
+    )
+    parser.add_argument(
+        "--request-rate",
+        type=float,
+        default=None,
+        help="Requests per second sent to each crawled host",
+    )
 
     return parser.parse_args()
 
 
 def crawler_instance(
-    type: str, platform: str, options: list, root_dir: str, token: str | None = None
+    type: str,
+    platform: str,
+    options: list,
+    root_dir: str,
+    token: str | None = None,
+    settings: CrawlSettings | None = None,
 ):
     print(f"Creating {type.capitalize()}Crawler for {platform}")
     module_path = f"crawlers.{platform.lower()}.{type}"
@@ -38,14 +94,19 @@ def crawler_instance(
 
     # if type is repo, pass token as first argument
     if type == "repo":
-        return crawler_class(token, root_dir)
+        return crawler_class(token, root_dir, settings)
 
-    # if type is report, pass options as first argument
-    return crawler_class(options, root_dir)
+    # project and report crawlers take the browser options first
+    return crawler_class(options, root_dir, settings)
 
 
 def crawler_factory(
-    type: str, platform: str, options: list, root_dir: str, token: str | None = None
+    type: str,
+    platform: str,
+    options: list,
+    root_dir: str,
+    token: str | None = None,
+    settings: CrawlSettings | None = None,
 ) -> list[ReportCrawlerBase]:
     ## initialize the list of types and platforms
     types = [m.value.lower() for m in CrawlerType]
@@ -59,13 +120,17 @@ def crawler_factory(
 
     if platform == "all":
         for platform in platfroms:
-            crawler = crawler_factory(type, platform, options, root_dir)
+            crawler = crawler_factory(
+                type, platform, options, root_dir, token, settings
+            )
             crawlers.append(crawler[0])
     else:
         # Using platform + type to determine which crawler to run
         if platform not in platfroms:
             raise ValueError(f"Platform must be in {platfroms}")
-        crawler = crawler_instance(type, platform, options, root_dir, token)
+        crawler = crawler_instance(
+            type, platform, options, root_dir, token, settings
+        )
         crawlers.append(crawler)
     return crawlers
 
@@ -79,12 +144,29 @@ if __name__ == "__main__":
     # initialize the root directory, and github access token
     root_dir = os.path.dirname(__file__)
     dotenv.load_dotenv(dotenv_path=".env.local")
-    token = os.getenv(key="GITHUB_ACCESS_TOKEN")
+    # several tokens in GITHUB_ACCESS_TOKENS are rotated, separated by commas
+    token = os.getenv(key="GITHUB_ACCESS_TOKENS") or os.getenv(
+        key="GITHUB_ACCESS_TOKEN"
+    )
 
     # parse the arguments
     args = parse_args()
     options = ["--headless", "--no-sandbox", "--disable-dev-shm-usage"]
-    crawlers = crawler_factory(args.type, args.platform, options, root_dir, token)
+    settings = CrawlSettings(
+        pool_size=args.pool_size,
+        concurrency=args.concurrency,
+        offline=args.offline,
+        incremental=args.incremental,
+        resume=args.resume,
+        issue_comments=args.issue_comments,
+        git_mirror=args.git_mirror,
+        full_load=args.full_load,
+    )
+    if args.request_rate:
+        host_scheduler.set_rate(args.request_rate)
+    crawlers = crawler_factory(
+        args.type, args.platform, options, root_dir, token, settings
+    )
 
     ## Run crawlers in parallel
     threads = []
@@ -93,5 +175,12 @@ if __name__ == "__main__":
         threads.append(thread)
         thread.start()
 
-    for thread in threads:
-        thread.join()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        # quit every pooled browser session before leaving
+        for crawler in crawlers:
+            if isinstance(crawler, ReportCrawlerBase):
+                crawler.quit()
+        raise
@@ -0,0 +1,41 @@
+import os
+import gzip
+import hashlib
+
+from .cache import _write_atomic
+
+
+def git_blob_sha(content: bytes) -> str:
+    """The sha git (and the GitHub API) names content by."""
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content).hexdigest()
+
+
+class BlobStore:
+    """
+    Repository files keyed by git blob sha, gzipped under
+    <blob_dir>/<sha[:2]>/<sha[2:4]>/<sha>.gz.
+
+    A file is stored once whatever commit, path or report it comes from,
+    and is found with a single open from its sha.
+    """
+
+    def __init__(self, blob_dir: str):
+        self.blob_dir = blob_dir
+
+    def path(self, sha: str) -> str:
+        return os.path.join(self.blob_dir, sha[:2], sha[2:4], f"{sha}.gz")
+
+    def has(self, sha: str) -> bool:
+        return os.path.exists(self.path(sha))
+
+    def put(self, content: bytes, sha: str | None = None) -> str:
+        sha = sha or git_blob_sha(content)
+        path = self.path(sha)
+        if not os.path.exists(path):
+            _write_atomic(path, gzip.compress(content, mtime=0))
+        return sha
+
+    def get(self, sha: str) -> bytes:
+        with gzip.open(self.path(sha), "rb") as f:
+            return f.read()
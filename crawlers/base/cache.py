@@ -0,0 +1,103 @@
+import os
+import gzip
+import json
+import hashlib
+import tempfile
+from datetime import datetime, timezone
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: str, data: bytes):
+    # concurrent workers may write the same object, never expose a partial file
+    dir_path = os.path.dirname(path)
+    os.makedirs(dir_path, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dir_path, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class RawPageCache:
+    """
+    Content-addressed store of fetched report pages.
+
+    Layout under raw_dir:
+        objects/<sha[:2]>/<sha>.html.gz   gzipped page body, keyed by sha256
+        objects/<sha[:2]>/<sha>.json.gz   gzipped DOM serialized in Chrome
+                                          (SERIALIZE_SCRIPT), if any
+        urls/<sha256(url)>.json           url, final_url, fetched_at,
+                                          headers and sha256 of the body
+                                          (and tree_sha256 of the DOM)
+    Identical bodies are stored once, a re-fetch only rewrites the record.
+    """
+
+    def __init__(self, raw_dir: str):
+        self.raw_dir = raw_dir
+        self.objects_dir = os.path.join(raw_dir, "objects")
+        self.urls_dir = os.path.join(raw_dir, "urls")
+
+    def _object_path(self, sha: str, ext: str = ".html.gz") -> str:
+        return os.path.join(self.objects_dir, sha[:2], f"{sha}{ext}")
+
+    def _put_object(self, data: bytes, ext: str) -> str:
+        sha = _sha256(data)
+        object_path = self._object_path(sha, ext)
+        if not os.path.exists(object_path):
+            _write_atomic(object_path, gzip.compress(data, mtime=0))
+        return sha
+
+    def _record_path(self, url: str) -> str:
+        return os.path.join(self.urls_dir, f"{_sha256(url.encode())}.json")
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        final_url: str = "",
+        headers: dict | None = None,
+        tree: dict | None = None,
+    ) -> dict:
+        record = {
+            "url": url,
+            "final_url": final_url or url,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "headers": dict(headers or {}),
+            "sha256": self._put_object(body.encode("utf-8"), ".html.gz"),
+        }
+        if tree is not None:
+            data = json.dumps(tree).encode("utf-8")
+            record["tree_sha256"] = self._put_object(data, ".json.gz")
+        _write_atomic(
+            self._record_path(url), json.dumps(record, indent=4).encode("utf-8")
+        )
+        return record
+
+    def get_record(self, url: str) -> dict | None:
+        try:
+            with open(self._record_path(url), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def get(self, url: str) -> tuple[dict, str] | None:
+        """Return the record and body last stored for url, None if not cached."""
+        record = self.get_record(url)
+        if record is None:
+            return None
+        with gzip.open(self._object_path(record["sha256"]), "rb") as f:
+            return record, f.read().decode("utf-8")
+
+    def get_tree(self, url: str) -> dict | None:
+        """Return the serialized DOM last stored for url, None if there is none."""
+        record = self.get_record(url)
+        if record is None or "tree_sha256" not in record:
+            return None
+        with gzip.open(self._object_path(record["tree_sha256"], ".json.gz"), "rb") as f:
+            return json.loads(f.read())
@@ -0,0 +1,50 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .scheduler import host_scheduler
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/125.0 Safari/537.36"
+)
+
+
+class HttpFetcher:
+    """
+    Browserless backend for server-rendered report pages.
+
+    One requests.Session with a connection pool of size keeps connections
+    alive across projects; load_page parses responses into the same
+    snapshot tree Selenium crawlers get.
+    """
+
+    def __init__(self, size: int = 1, timeout: int = 30, retries: int = 3):
+        self.size = max(1, size)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=self.size,
+            pool_maxsize=self.size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # the last answer is returned, its Retry-After paces the host
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, headers: dict | None = None) -> requests.Response:
+        with host_scheduler.request(url) as slot:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            slot.record(response)
+        response.raise_for_status()
+        return response
+
+    def close(self):
+        self.session.close()
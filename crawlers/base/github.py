@@ -1,22 +1,101 @@
 import base64
 import re
 import requests
-from github import Github
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Iterable, Iterator
+from urllib.parse import unquote, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from configs.base.github import (
     GITHUB_BASE_URL,
     GITHUB_BASE__API_URL,
     GITHUB_URL_PATTERN,
+    GITHUB_IMMUTABLE_REF_PATTERN,
+    GITHUB_REPO_FILE_EXTENSIONS,
+    GITHUB_REPO_MAX_FILE_SIZE,
+    GITHUB_PAGE_SIZE,
+    GITHUB_REQUEST_RETRIES,
+    GITHUB_REQUEST_TIMEOUT,
 )
+from .blob_store import BlobStore
+from .github_cache import GitHubApiCache
+from .mirror import GitMirror, MirrorError
+from .rate_limit import governor_for
+
+
+def canonical_github_url(url: str) -> str | None:
+    """
+    One url per GitHub resource, None if url is not on github.com.
+
+    Query and fragment select nothing the crawler fetches (tracking params,
+    ?plain=1, #L line anchors) and are dropped with a trailing slash, owner
+    and repository are lowercased like GitHub resolves them. The blob or
+    tree segment is kept as linked.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if host != "github.com" or len(segments) < 2:
+        return None
+
+    owner, repo = segments[0].lower(), segments[1].lower().removesuffix(".git")
+    repo_url = f"{GITHUB_BASE_URL}/{owner}/{repo}"
+    rest = segments[2:]
+    if rest in (["tree"], ["blob"]):
+        return repo_url
+    return "/".join([repo_url] + rest)
 
 
 class GitHubCrawler:
-    def __init__(self, token: str):
+    def __init__(
+        self,
+        token: str,
+        blob_dir: str,
+        concurrency: int = 1,
+        cache_dir: str | None = None,
+        issue_comments: bool = False,
+        mirror_dir: str | None = None,
+    ):
+        # several tokens may be given separated by commas, requests rotate
+        # over them through the rate governor shared in the process
         self.token = token
+        self.tokens = [t.strip() for t in (token or "").split(",") if t.strip()]
+        self.governor = governor_for(self.tokens)
         self.base_url = GITHUB_BASE_URL
         self.base_api_url = GITHUB_BASE__API_URL
-        self.headers = {"Authorization": f"token {token}"}
         self.url_pattern = GITHUB_URL_PATTERN
 
+        # one keep-alive session shared by the link and the blob fetch threads
+        self.concurrency = max(1, concurrency)
+        self.session = requests.Session()
+        # throttled answers (403 / 429) are left to the rate governor
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=2 * self.concurrency,
+            max_retries=Retry(
+                total=GITHUB_REQUEST_RETRIES,
+                backoff_factor=1,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.blob_executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        # files of a repository that fetch_repository downloads
+        self.file_extensions = GITHUB_REPO_FILE_EXTENSIONS
+        self.max_file_size = GITHUB_REPO_MAX_FILE_SIZE
+
+        # responses are revalidated with conditional requests when cached
+        self.cache = GitHubApiCache(cache_dir) if cache_dir else None
+        # file contents are kept here, fetched data only holds their sha
+        self.blobs = BlobStore(blob_dir)
+        # issue lists also fetch every comment of the repository's issues
+        self.issue_comments = issue_comments
+        # files and repositories are read from local clones when given,
+        # the API is left for issues and repositories that cannot be cloned
+        self.mirror = GitMirror(mirror_dir) if mirror_dir else None
+
     def parse_url(self, url: str) -> dict:
         if not url.startswith(self.base_url):
             raise ValueError("Not a GitHub URL")
@@ -35,6 +114,8 @@ class GitHubCrawler:
         # Determine the resource type based on captured groups
         if components["issue_number"]:
             resource_type = "issue"
+        elif components["issues"]:
+            resource_type = "issues"
         elif "blob" in url:
             resource_type = "file"
         else:
@@ -71,49 +152,171 @@ class GitHubCrawler:
 
         return None  # Return None if type does not require a specific API URL
 
-    def parse_file_content(self, response: dict, type: str):
+    def parse_file_content(self, response: dict, type: str, repo_api_url: str = ""):
         data = {}
         if type == "file":
-            data["content"] = base64.b64decode(response["content"]).decode("utf-8")
+            data["path"] = response["path"]
+            if "content" in response:
+                content = base64.b64decode(response["content"])
+                data["sha"] = self.blobs.put(content, response["sha"])
+                data["size"] = len(content)
+            else:
+                # served from the cache, which keeps the sha of the content
+                sha = response["sha"]
+                if not self.blobs.has(sha) and not self.fetch_blob(repo_api_url, sha):
+                    raise ValueError("Failed to fetch data")
+                data["sha"] = sha
+                data["size"] = response["size"]
             data["type"] = type
         else:
             data = response
             data["type"] = type
         return data
 
-    def fetch_repository(self, repo: str):
+    def fetch_repository(self, repo: str, ref: str | None = None):
+        """
+        List the whole tree of repo at ref (default branch if None) in one
+        request and fetch the source files among it concurrently, files
+        already in the blob store are not fetched. Returns the blob sha of
+        every file by path.
+        """
         print(f"Fetching repository {repo}")
-        g = Github(self.token)
-        repo = g.get_repo(repo)
-        contents = repo.get_contents("")
-
-        all_files = {}
-
-        while contents:
-            file_content = contents.pop(0)
-            if not file_content.path.endswith(".sol"):
-                continue
-            if file_content.type == "dir":
-                contents.extend(repo.get_contents(file_content.path))
-            elif file_content.type == "file":
-                # Optionally decode content if you want the file's content
-                data = base64.b64decode(file_content.content).decode("utf-8")
-                all_files[file_content.path] = data
-                print(f"Fetched {file_content.path}")
-
-        return all_files
+        repo_api_url = f"{self.base_api_url}/{repo}"
+        if ref is None:
+            ref = self.get_json(repo_api_url)["default_branch"]
+        tree = self.get_json(f"{repo_api_url}/git/trees/{ref}?recursive=1")
+        if tree.get("truncated"):
+            print(f"[WARN] Tree of {repo} is truncated, some files are missing")
+
+        files = [
+            entry
+            for entry in tree["tree"]
+            if entry["type"] == "blob"
+            and entry["path"].endswith(self.file_extensions)
+            and entry.get("size", 0) <= self.max_file_size
+        ]
+        missing = [entry for entry in files if not self.blobs.has(entry["sha"])]
+        fetched = set(
+            self.blob_executor.map(
+                lambda entry: self.fetch_blob(repo_api_url, entry["sha"]), missing
+            )
+        )
+
+        all_files = {
+            entry["path"]: entry["sha"]
+            for entry in files
+            if entry["sha"] in fetched or self.blobs.has(entry["sha"])
+        }
+        print(f"Fetched {len(missing)} of {len(all_files)} files of {repo}")
+        return {"ref": ref, "files": all_files}
+
+    def fetch_from_mirror(self, parsed_url: dict) -> dict:
+        """fetch_data of a file or repository url read from its mirror."""
+        repo = f"{parsed_url['username']}/{parsed_url['repository']}"
+        ref = parsed_url.get("branch")
+        if parsed_url["type"] == "file":
+            path = unquote(parsed_url["file_path"])
+            sha, content = self.mirror.read_file(repo, ref, path)
+            return {
+                "path": path,
+                "sha": self.blobs.put(content, sha),
+                "size": len(content),
+                "type": "file",
+            }
+
+        if ref is None:
+            ref = self.mirror.default_branch(repo)
+        files = [
+            entry
+            for entry in self.mirror.list_files(repo, ref)
+            if entry["path"].endswith(self.file_extensions)
+            and entry["size"] <= self.max_file_size
+        ]
+        missing = [entry["sha"] for entry in files if not self.blobs.has(entry["sha"])]
+        for sha, content in self.mirror.read_blobs(repo, missing).items():
+            self.blobs.put(content, sha)
+        return {
+            "ref": ref,
+            "files": {entry["path"]: entry["sha"] for entry in files},
+            "type": "repository",
+        }
+
+    def get_pages(self, api_url: str) -> Iterator[list]:
+        """Every page of a listing endpoint, the last one is not full."""
+        page = 1
+        while True:
+            items = self.get_json(f"{api_url}&per_page={GITHUB_PAGE_SIZE}&page={page}")
+            yield items
+            if len(items) < GITHUB_PAGE_SIZE:
+                return
+            page += 1
+
+    def count_issue_pages(self, repo: str) -> int:
+        """
+        Pages fetch_issues requests for repo: issues and pull requests share
+        one numbering and are both listed, the newest number bounds them.
+        """
+        newest = self.get_json(f"{self.base_api_url}/{repo}/issues?state=all&per_page=1")
+        count = newest[0]["number"] if newest else 0
+        return -(-count // GITHUB_PAGE_SIZE)
+
+    def fetch_issues(self, repo: str) -> dict[int, dict]:
+        """
+        Every issue of repo (labels included) by number, listed 100 per
+        request, with its comments in "comment_list" if issue_comments.
+        """
+        print(f"Fetching issues of {repo}")
+        repo_api_url = f"{self.base_api_url}/{repo}"
+        issues = {}
+        for page in self.get_pages(f"{repo_api_url}/issues?state=all"):
+            for issue in page:
+                issues[issue["number"]] = issue
+
+        if self.issue_comments:
+            for issue in issues.values():
+                issue["comment_list"] = []
+            for page in self.get_pages(f"{repo_api_url}/issues/comments?sort=created"):
+                for comment in page:
+                    number = int(comment["issue_url"].rsplit("/", 1)[-1])
+                    if number in issues:
+                        issues[number]["comment_list"].append(comment)
+        return issues
+
+    def fetch_blob(self, repo_api_url: str, sha: str) -> str | None:
+        """Store blob sha of the repository, return sha or None on failure."""
+        try:
+            blob = self.get_json(f"{repo_api_url}/git/blobs/{sha}", cache=False)
+            return self.blobs.put(base64.b64decode(blob["content"]), sha)
+        except (ValueError, KeyError):
+            return None
 
     def fetch_data(self, url: str) -> dict | None:
 
         # If the URL is a repository URL, fetch all files in the repository
         parsed_url = self.parse_url(url)
+        if self.mirror is not None and parsed_url["type"] in ("file", "repository"):
+            try:
+                return self.fetch_from_mirror(parsed_url)
+            except MirrorError as e:
+                print(f"[WARN] {url} not in mirror, using the API: {e}")
+
         if parsed_url["type"] == "repository":
             res = self.fetch_repository(
-                f"{parsed_url['username']}/{parsed_url['repository']}"
+                f"{parsed_url['username']}/{parsed_url['repository']}",
+                parsed_url.get("branch"),
             )
             res["type"] = "repository"
             return res
 
+        # An issue list url fetches every issue of the repository
+        if parsed_url["type"] == "issues":
+            return {
+                "issues": self.fetch_issues(
+                    f"{parsed_url['username']}/{parsed_url['repository']}"
+                ),
+                "type": "issues",
+            }
+
         # Create the API URL
         # Parse the URL in order to make api request
         api_url = self.create_request_url(parsed_url)
@@ -121,9 +324,92 @@ class GitHubCrawler:
             raise ValueError("Invalid URL")
 
         # Fetch data from the API
-        response = requests.get(api_url, headers=self.headers)
+        response = self.get_json(api_url)
+
+        # parse the response
+        repo_api_url = (
+            f"{self.base_api_url}/{parsed_url['username']}/{parsed_url['repository']}"
+        )
+        return self.parse_file_content(response, parsed_url["type"], repo_api_url)
+
+    def get_json(self, api_url: str, cache: bool = True):
+        """
+        GET api_url through the cache: urls pinned to a commit sha are served
+        from it as is, others are revalidated and a 304 returns the cached body.
+        Bodies kept elsewhere (blobs) skip the cache, and a cached contents
+        response is kept without its base64 content.
+        """
+        cache = self.cache if cache else None
+        entry = cache.get(api_url) if cache else None
+        if entry is not None and re.search(GITHUB_IMMUTABLE_REF_PATTERN, api_url):
+            return entry["body"]
+
+        headers = GitHubApiCache.conditional_headers(entry) if entry else {}
+        response = self.request(api_url, headers)
+        if response.status_code == 304 and entry is not None:
+            return entry["body"]
         if response.status_code != 200:
             raise ValueError("Failed to fetch data")
 
-        # parse the response
-        return self.parse_file_content(response.json(), parsed_url["type"])
+        body = response.json()
+        if cache is not None:
+            # file contents are kept in the blob store, the cache only needs
+            # their sha
+            cached = body
+            if isinstance(body, dict) and "content" in body:
+                cached = {key: value for key, value in body.items() if key != "content"}
+            cache.put(
+                api_url,
+                cached,
+                response.headers.get("ETag", ""),
+                response.headers.get("Last-Modified", ""),
+            )
+        return body
+
+    def request(self, api_url: str, headers: dict) -> requests.Response:
+        """GET api_url within the rate limit, waiting out throttled responses."""
+        while True:
+            token = self.governor.acquire()
+            auth = {"Authorization": f"token {token}"} if token else {}
+            response = self.session.get(
+                api_url, headers={**headers, **auth}, timeout=GITHUB_REQUEST_TIMEOUT
+            )
+            if not self.governor.update(token, response):
+                return response
+
+    def fetch_many(
+        self, jobs: Iterable[tuple[Any, str]]
+    ) -> Iterator[tuple[Any, dict | None]]:
+        """
+        Fetch the url of each (key, url) job on concurrency threads and yield
+        (key, data) in completion order, data is None when the fetch failed.
+
+        Jobs are pulled lazily, at most twice concurrency are in flight.
+        """
+        jobs = iter(jobs)
+        in_flight = {}
+
+        def fetch(url: str) -> dict | None:
+            try:
+                return self.fetch_data(url)
+            except Exception as e:
+                print(f"[WARN] Failed to fetch {url}: {e!r}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+
+            def submit_next() -> bool:
+                for key, url in jobs:
+                    in_flight[executor.submit(fetch, url)] = key
+                    return True
+                return False
+
+            for _ in range(self.concurrency * 2):
+                if not submit_next():
+                    break
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = in_flight.pop(future)
+                    submit_next()
+                    yield key, future.result()
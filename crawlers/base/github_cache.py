@@ -0,0 +1,51 @@
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime, timezone
+
+from .cache import _write_atomic
+
+
+class GitHubApiCache:
+    """
+    On-disk cache of GitHub API responses keyed by API url.
+
+    Each entry keeps the ETag / Last-Modified validators next to the JSON
+    body, so the next request for the url is conditional and a 304 is
+    served from here without counting against the rate limit.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def get(self, url: str) -> dict | None:
+        try:
+            with gzip.open(self._path(url), "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+
+    def put(self, url: str, body, etag: str = "", last_modified: str = ""):
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "body": body,
+        }
+        data = json.dumps(entry).encode("utf-8")
+        _write_atomic(self._path(url), gzip.compress(data, mtime=0))
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
@@ -0,0 +1,104 @@
+import os
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+STARTED = "started"
+DONE = "done"
+FAILED = "failed"
+# intentionally not crawled (e.g. reports only published as pdf), final
+# like DONE
+SKIPPED = "skipped"
+
+
+class CrawlJournal:
+    """
+    Append-only log of the units (projects, reports, repos) of one crawl.
+
+    Every start, completion, skip and failure is fsync'd before the unit
+    goes on, so after a crash the journal tells exactly which units
+    finished. With resume the previous log is replayed and done or skipped
+    units are skipped; failed and interrupted (started, never finished)
+    units run again. Without resume the journal starts over.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        self.status: dict[str, str] = {}
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if resume and os.path.exists(path):
+            self._replay()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _replay(self):
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            # drop a torn write of the line being appended at the crash
+            complete = data.rfind(b"\n") + 1
+            if complete < len(data):
+                f.truncate(complete)
+        for line in data[:complete].decode("utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self.status[record["unit"]] = record["status"]
+
+    def _append(self, unit: str, status: str, error: str = "", reason: str = ""):
+        record = {
+            "unit": unit,
+            "status": status,
+            "at": datetime.now(timezone.utc).isoformat(),
+        }
+        if error:
+            record["error"] = error
+        if reason:
+            record["reason"] = reason
+        with self._lock:
+            self.status[unit] = status
+            if self._file.closed:
+                # the crawl was stopped, workers still winding down
+                return
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def is_done(self, unit: str) -> bool:
+        with self._lock:
+            return self.status.get(unit) in (DONE, SKIPPED)
+
+    def interrupted(self) -> list[str]:
+        """Units a previous run started but never finished."""
+        with self._lock:
+            return [unit for unit, status in self.status.items() if status == STARTED]
+
+    def start(self, unit: str):
+        self._append(unit, STARTED)
+
+    def done(self, unit: str):
+        self._append(unit, DONE)
+
+    def skip(self, unit: str, reason: str = ""):
+        self._append(unit, SKIPPED, reason=reason)
+
+    def fail(self, unit: str, error: str = ""):
+        self._append(unit, FAILED, error)
+
+    @contextmanager
+    def unit(self, unit: str):
+        """Journal the block as unit: done if it returns, failed if it raises."""
+        self.start(unit)
+        try:
+            yield
+        except BaseException as e:
+            self.fail(unit, repr(e))
+            raise
+        self.done(unit)
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
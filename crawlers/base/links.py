@@ -0,0 +1,162 @@
+import os
+import json
+import time
+from typing import Iterable
+from urllib.parse import urldefrag
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tqdm import tqdm
+
+from configs.base.github import (
+    GITHUB_LINK_CHECK_CONCURRENCY,
+    GITHUB_LINK_CHECK_TIMEOUT,
+    GITHUB_LINK_HEALTH_TTL,
+)
+from helpers.report import create_tqdm_title
+from .cache import _write_atomic
+from .fetch import USER_AGENT
+from .scheduler import host_scheduler
+
+# a HEAD answer with these statuses is final, others are asked again with GET
+CONCLUSIVE_HEAD_STATUSES = (200, 404, 410)
+# answers that tell nothing of the link (throttled, forbidden to the
+# crawler, server errors), like an unreachable host its health is unknown
+UNKNOWN_STATUSES = (403, 429)
+
+
+def is_known(status: int) -> bool:
+    return status not in UNKNOWN_STATUSES and status < 500
+
+# checked links between two saves of the health file
+SAVE_EVERY = 500
+
+
+class LinkChecker:
+    """
+    Health of the links cited by reports, kept at health_path.
+
+    check_all deduplicates the urls (ignoring #fragments) and requests
+    every one not checked within ttl seconds on concurrency threads that
+    share one pooled session, paced per host by host_scheduler. A HEAD
+    request is sent first, a GET only when its answer is not conclusive.
+    As with is_vaild_github_url a link is healthy when it answers 200, and
+    broken when it gives any other definite answer (404, 410, ...).
+
+    A link that could not be reached, or answered 403, 429 or 5xx after
+    the retries, is unknown: it is not counted as broken, not saved, and
+    checked again on the next run. Known statuses are saved with the time
+    they were checked, so a rerun only requests the expired ones. Without
+    a health_path nothing is saved.
+    """
+
+    def __init__(
+        self,
+        health_path: str = "",
+        ttl: float = GITHUB_LINK_HEALTH_TTL,
+        concurrency: int = GITHUB_LINK_CHECK_CONCURRENCY,
+        timeout: float = GITHUB_LINK_CHECK_TIMEOUT,
+    ):
+        self.health_path = health_path
+        self.ttl = ttl
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        # url -> {"status": int, "checked_at": float}
+        self.health: dict[str, dict] = {}
+        if health_path and os.path.exists(health_path):
+            with open(health_path, "r") as f:
+                self.health = json.load(f)
+        # links of this run whose health could not be told
+        self.unknown: set[str] = set()
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency,
+            pool_maxsize=self.concurrency,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504),
+                # the last answer is returned, its Retry-After paces the host
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def is_fresh(self, url: str, now: float) -> bool:
+        entry = self.health.get(url)
+        return (
+            entry is not None
+            and is_known(entry["status"])
+            and now - entry["checked_at"] < self.ttl
+        )
+
+    def request_status(self, url: str) -> int:
+        with host_scheduler.request(url) as slot:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=self.timeout
+            )
+            slot.record(response)
+        if response.status_code in CONCLUSIVE_HEAD_STATUSES:
+            return response.status_code
+
+        # the body is not read, the connection goes back to the pool on close
+        with host_scheduler.request(url) as slot:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                slot.record(response)
+        return response.status_code
+
+    def check_all(self, urls: Iterable[str]):
+        """Request every url of urls whose health is unknown or expired."""
+        now = time.time()
+        urls = {urldefrag(url).url for url in urls} - self.unknown
+        pending = sorted(url for url in urls if not self.is_fresh(url, now))
+        if not pending:
+            return
+
+        title = create_tqdm_title("Link health")
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self.request_status, url): url for url in pending
+            }
+            for count, future in enumerate(
+                tqdm(as_completed(futures), total=len(futures), desc=title), 1
+            ):
+                url = futures[future]
+                try:
+                    status = future.result()
+                except requests.exceptions.RequestException:
+                    status = None
+                if status is None or not is_known(status):
+                    self.unknown.add(url)
+                    self.health.pop(url, None)
+                    continue
+                self.health[url] = {"status": status, "checked_at": time.time()}
+                if count % SAVE_EVERY == 0:
+                    self.save()
+        self.save()
+        if self.unknown:
+            print(
+                f"[WARN] {len(self.unknown)} links could not be checked, "
+                "they are not counted as broken"
+            )
+
+    def is_broken(self, url: str) -> bool:
+        url = urldefrag(url).url
+        entry = self.health.get(url)
+        if url not in self.unknown and (entry is None or not is_known(entry["status"])):
+            self.check_all([url])
+        if url in self.unknown:
+            return False
+        return self.health[url]["status"] != 200
+
+    def save(self):
+        if self.health_path:
+            _write_atomic(self.health_path, json.dumps(self.health).encode())
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,34 @@
+import os
+import json
+import threading
+
+from .cache import _write_atomic
+
+
+class CrawlManifest:
+    """
+    Fingerprint of the last successful report crawl of every project.
+
+    Entries are keyed by project name and hold report_url, crawled_at,
+    content_hash (sha256 of the parsed page), source_hash (sha256 of the
+    page as served, before any rendering) and the etag / last_modified
+    validators when the host sends them.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.entries = json.load(f)
+
+    def get(self, project_name: str) -> dict | None:
+        with self._lock:
+            return self.entries.get(project_name)
+
+    def update(self, project_name: str, entry: dict):
+        with self._lock:
+            self.entries[project_name] = entry
+            data = json.dumps(self.entries, indent=4, sort_keys=True)
+            _write_atomic(self.path, data.encode("utf-8"))
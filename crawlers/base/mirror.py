@@ -0,0 +1,178 @@
+import os
+import re
+import shutil
+import threading
+import subprocess
+
+from configs.base.github import (
+    GITHUB_CLONE_URL,
+    GITHUB_MIRROR_CLONE_TIMEOUT,
+    GITHUB_MIRROR_GIT_TIMEOUT,
+)
+
+
+class MirrorError(Exception):
+    """The repository or the object asked for is not in the mirror."""
+
+
+class GitMirror:
+    """
+    Local bare mirrors of GitHub repositories under
+    <mirror_dir>/<owner>/<repo>.git, read with git plumbing.
+
+    A repository is cloned on first use and fetched at most once per run:
+    before a branch (or the default branch) is first resolved, since it may
+    have moved, and for a commit sha only when it is not found. A
+    repository that cannot be cloned, or a git command that times out,
+    raises MirrorError so the caller falls back to the API. clone_url
+    formats owner/repo into the url to clone from.
+    """
+
+    def __init__(self, mirror_dir: str, clone_url: str = GITHUB_CLONE_URL):
+        self.mirror_dir = mirror_dir
+        self.clone_url = clone_url
+        self._lock = threading.Lock()
+        self._repo_locks: dict[str, threading.Lock] = {}
+        self._fetched: set[str] = set()
+        self._failed: set[str] = set()
+
+    def path(self, repo: str) -> str:
+        return os.path.join(self.mirror_dir, f"{repo}.git")
+
+    def git(
+        self,
+        repo: str,
+        *args: str,
+        input: bytes | None = None,
+        timeout: float = GITHUB_MIRROR_GIT_TIMEOUT,
+    ) -> bytes:
+        try:
+            result = subprocess.run(
+                ["git", "--git-dir", self.path(repo), *args],
+                input=input,
+                capture_output=True,
+                timeout=timeout,
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
+        except subprocess.TimeoutExpired:
+            raise MirrorError(f"git {args[0]} of {repo} timed out")
+        if result.returncode != 0:
+            raise MirrorError(result.stderr.decode(errors="replace").strip())
+        return result.stdout
+
+    def _repo_lock(self, repo: str) -> threading.Lock:
+        with self._lock:
+            return self._repo_locks.setdefault(repo, threading.Lock())
+
+    def ensure(self, repo: str):
+        """Clone repo into the mirror unless it is there."""
+        with self._repo_lock(repo):
+            if repo in self._failed:
+                raise MirrorError(f"{repo} could not be cloned")
+            if os.path.exists(self.path(repo)):
+                return
+            print(f"Cloning {repo}")
+            # cloned aside, a clone killed halfway is never taken for a mirror
+            partial_path = f"{self.path(repo)}.partial"
+            shutil.rmtree(partial_path, ignore_errors=True)
+            try:
+                result = subprocess.run(
+                    [
+                        "git",
+                        "clone",
+                        "--mirror",
+                        "--quiet",
+                        self.clone_url.format(repo=repo),
+                        partial_path,
+                    ],
+                    capture_output=True,
+                    timeout=GITHUB_MIRROR_CLONE_TIMEOUT,
+                    env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                )
+                error = result.stderr.decode(errors="replace").strip()
+            except subprocess.TimeoutExpired:
+                result, error = None, f"clone of {repo} timed out"
+            if result is None or result.returncode != 0:
+                shutil.rmtree(partial_path, ignore_errors=True)
+                self._failed.add(repo)
+                raise MirrorError(error)
+            os.rename(partial_path, self.path(repo))
+            self._fetched.add(repo)
+
+    def fetch(self, repo: str) -> bool:
+        """Fetch repo unless it was cloned or fetched on this run."""
+        with self._repo_lock(repo):
+            if repo in self._fetched:
+                return False
+            self._fetched.add(repo)
+            self.git(
+                repo,
+                "fetch",
+                "--quiet",
+                "--prune",
+                "origin",
+                timeout=GITHUB_MIRROR_CLONE_TIMEOUT,
+            )
+            return True
+
+    def resolve(self, repo: str, ref: str | None) -> str:
+        """The commit sha of ref (the default branch if None) in repo."""
+        self.ensure(repo)
+        if ref is None or not re.fullmatch(r"[0-9a-f]{40}", ref):
+            # branches move, read them as of this run
+            self.fetch(repo)
+        args = ("rev-parse", "--verify", f"{ref or 'HEAD'}^{{commit}}")
+        try:
+            return self.git(repo, *args).decode().strip()
+        except MirrorError:
+            # a commit pushed after the clone
+            if not self.fetch(repo):
+                raise
+            return self.git(repo, *args).decode().strip()
+
+    def default_branch(self, repo: str) -> str:
+        self.ensure(repo)
+        self.fetch(repo)
+        return self.git(repo, "symbolic-ref", "--short", "HEAD").decode().strip()
+
+    def read_file(self, repo: str, ref: str | None, path: str) -> tuple[str, bytes]:
+        """Blob sha and content of path at ref."""
+        commit = self.resolve(repo, ref)
+        sha = self.git(repo, "rev-parse", f"{commit}:{path}").decode().strip()
+        return sha, self.git(repo, "cat-file", "blob", sha)
+
+    def list_files(self, repo: str, ref: str | None) -> list[dict]:
+        """Every file of the tree at ref with its path, blob sha and size."""
+        commit = self.resolve(repo, ref)
+        files = []
+        for line in self.git(repo, "ls-tree", "-r", "-l", "-z", commit).split(b"\0"):
+            if not line:
+                continue
+            meta, path = line.split(b"\t", 1)
+            _, type, sha, size = meta.split()
+            if type == b"blob":
+                files.append(
+                    {"path": path.decode(), "sha": sha.decode(), "size": int(size)}
+                )
+        return files
+
+    def read_blobs(self, repo: str, shas: list[str]) -> dict[str, bytes]:
+        """Content of each blob of repo, read in one cat-file --batch."""
+        if not shas:
+            return {}
+        output = self.git(
+            repo, "cat-file", "--batch", input="\n".join(shas).encode() + b"\n"
+        )
+        blobs, offset = {}, 0
+        for _ in shas:
+            end = output.index(b"\n", offset)
+            header = output[offset:end].split()
+            offset = end + 1
+            if len(header) != 3:
+                # "<sha> missing"
+                continue
+            sha, _, size = header
+            blobs[sha.decode()] = output[offset : offset + int(size)]
+            # the content is followed by a newline
+            offset += int(size) + 1
+        return blobs
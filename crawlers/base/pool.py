@@ -0,0 +1,162 @@
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import InvalidSessionIdException
+
+from configs.base.browser import BLOCKED_URL_PATTERNS, PAGE_LOAD_STRATEGY
+
+# per-thread crawl state of pooled workers, keyed by crawler id
+_worker = threading.local()
+
+
+class WorkerAttribute:
+    """
+    Instance attribute private to the pool worker that sets it.
+
+    Inside worker_scope() reads and writes go to the worker's own state, so
+    concurrent projects never share current_project_* values; reads fall
+    back to the value set outside any worker (e.g. during __init__).
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        state = _worker_state(obj)
+        if state is not None and self.name in state:
+            return state[self.name]
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value):
+        state = _worker_state(obj)
+        if state is not None:
+            state[self.name] = value
+        else:
+            obj.__dict__[self.name] = value
+
+
+def _worker_state(obj) -> dict | None:
+    states = getattr(_worker, "states", None)
+    return states.get(id(obj)) if states else None
+
+
+def start_chrome(options: Options, light: bool = True) -> webdriver.Chrome:
+    """
+    Start a Chrome session, with the light profile the page load strategy
+    is eager and BLOCKED_URL_PATTERNS are never requested.
+    """
+    if light:
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+    driver = webdriver.Chrome(options=options)
+    if light:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}
+        )
+    return driver
+
+
+@contextmanager
+def worker_scope(obj):
+    """Give the current thread its own WorkerAttribute values of obj."""
+    if not hasattr(_worker, "states"):
+        _worker.states = {}
+    _worker.states[id(obj)] = {}
+    try:
+        yield
+    finally:
+        del _worker.states[id(obj)]
+
+
+class DriverPool:
+    """
+    Bounded pool of Chrome sessions.
+
+    Sessions are started lazily up to size (see start_chrome for light)
+    and handed out with session(); close() quits every session and is
+    also registered to run at exit.
+    """
+
+    def __init__(self, options: Options, size: int = 1, light: bool = True):
+        self.options = options
+        self.size = max(1, size)
+        self.light = light
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._sessions: list[webdriver.Chrome] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def start(self) -> webdriver.Chrome:
+        """Start the first session eagerly so a broken setup fails fast."""
+        driver = self._create()
+        self._idle.put(driver)
+        return driver
+
+    def _create(self) -> webdriver.Chrome:
+        driver = start_chrome(self.options, self.light)
+        with self._lock:
+            self._sessions.append(driver)
+        return driver
+
+    def acquire(self) -> webdriver.Chrome:
+        if self._closed:
+            raise RuntimeError("Driver pool is closed.")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_grow = len(self._sessions) < self.size
+        if can_grow:
+            return self._create()
+        return self._idle.get()
+
+    def release(self, driver: webdriver.Chrome):
+        if not self._closed:
+            self._idle.put(driver)
+
+    def discard(self, driver: webdriver.Chrome):
+        """Drop a dead session, the next acquire() starts a fresh one."""
+        with self._lock:
+            if driver in self._sessions:
+                self._sessions.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @contextmanager
+    def session(self):
+        driver = self.acquire()
+        alive = True
+        try:
+            yield driver
+        except InvalidSessionIdException:
+            alive = False
+            raise
+        finally:
+            if alive:
+                self.release(driver)
+            else:
+                self.discard(driver)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            sessions, self._sessions = self._sessions, []
+        for driver in sessions:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"[WARN] Failed to quit a pooled session: {e}")
@@ -0,0 +1,128 @@
+import time
+import threading
+
+import requests
+
+from configs.base.github import GITHUB_RATE_LIMIT, GITHUB_RATE_BURST
+
+
+class _TokenBudget:
+    """Rate limit state of one access token, refilled as a token bucket."""
+
+    def __init__(self, token: str):
+        self.token = token
+        # GitHub's view, updated from the X-RateLimit headers of each response
+        self.remaining = GITHUB_RATE_LIMIT
+        self.reset_at = time.time() + 3600
+        # requests that may be sent right now
+        self.bucket = float(GITHUB_RATE_BURST)
+        self.refilled_at = time.monotonic()
+        # no request before this time (Retry-After, exhausted quota)
+        self.paused_until = 0.0
+
+    def rate(self, now: float) -> float:
+        """Requests per second that spread remaining until the reset."""
+        return self.remaining / max(1.0, self.reset_at - now)
+
+    def refill(self, now: float):
+        if now >= self.reset_at:
+            # a new window, the next response tells the actual quota
+            self.remaining = GITHUB_RATE_LIMIT
+            self.reset_at = now + 3600
+        elapsed = time.monotonic() - self.refilled_at
+        self.refilled_at += elapsed
+        self.bucket = min(GITHUB_RATE_BURST, self.bucket + elapsed * self.rate(now))
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a request can be sent with this token."""
+        if self.paused_until > now:
+            return self.paused_until - now
+        if self.bucket >= 1:
+            return 0.0
+        # an exhausted quota is restored at the reset, see refill
+        wait = (1 - self.bucket) / max(self.rate(now), 1e-3)
+        return min(wait, self.reset_at - now)
+
+
+class RateGovernor:
+    """
+    Process-wide budget of GitHub API requests.
+
+    Every crawler sharing the tokens shares one governor (governor_for), so
+    the repo crawlers main.py runs in parallel split the quota instead of
+    exhausting it together. Each token's budget is a token bucket refilled
+    at the rate that spends X-RateLimit-Remaining evenly until
+    X-RateLimit-Reset; acquire hands out the token with a request to
+    spare and blocks while none has. A throttled response (403 / 429 with
+    Retry-After or no remaining requests) pauses the token until it may
+    be used again, the request is sent again instead of being dropped.
+    """
+
+    def __init__(self, tokens: list[str]):
+        if not tokens:
+            tokens = [""]
+        self._budgets = {token: _TokenBudget(token) for token in tokens}
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """Block until a request may be sent, return the token to send it with."""
+        while True:
+            with self._lock:
+                now = time.time()
+                for budget in self._budgets.values():
+                    budget.refill(now)
+                budget = min(self._budgets.values(), key=lambda b: b.wait_time(now))
+                wait = budget.wait_time(now)
+                if wait == 0:
+                    budget.bucket -= 1
+                    return budget.token
+            if wait > 5:
+                print(f"[INFO] GitHub rate limit reached, pausing {wait:.0f}s")
+            time.sleep(wait)
+
+    def update(self, token: str, response: requests.Response) -> bool:
+        """
+        Record the rate limit headers of response sent with token, return
+        True if it was throttled and must be sent again.
+        """
+        headers = response.headers
+        throttled = response.status_code == 429 or (
+            response.status_code == 403
+            and (
+                "Retry-After" in headers
+                or headers.get("X-RateLimit-Remaining") == "0"
+            )
+        )
+        with self._lock:
+            budget = self._budgets[token]
+            now = time.time()
+            if "X-RateLimit-Remaining" in headers:
+                budget.remaining = int(headers["X-RateLimit-Remaining"])
+            if "X-RateLimit-Reset" in headers:
+                budget.reset_at = float(headers["X-RateLimit-Reset"])
+            if not throttled:
+                return False
+
+            if "Retry-After" in headers:
+                pause = now + float(headers["Retry-After"])
+            elif budget.remaining == 0:
+                pause = budget.reset_at
+            else:
+                # secondary limit without a hint, GitHub asks for a minute
+                pause = now + 60
+            budget.paused_until = max(budget.paused_until, pause)
+            budget.bucket = 0.0
+            return True
+
+
+_governors: dict[tuple[str, ...], RateGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def governor_for(tokens: list[str]) -> RateGovernor:
+    """The governor shared by every crawler of this process using tokens."""
+    key = tuple(sorted(tokens))
+    with _governors_lock:
+        if key not in _governors:
+            _governors[key] = RateGovernor(list(tokens))
+        return _governors[key]
@@ -1,11 +1,21 @@
 import os
+import re
 import json
-import base64
+import hashlib
 from dataclasses import dataclass
 
-from .github import GitHubCrawler
+from .cache import _write_atomic
+from .github import GitHubCrawler, canonical_github_url
+from configs.base.github import (
+    GITHUB_BLOB_DIR_PATH,
+    GITHUB_BULK_ISSUE_THRESHOLD,
+    GITHUB_CACHE_DIR_PATH,
+    GITHUB_MIRROR_DIR_PATH,
+    GITHUB_PINNED_URL_PATTERN,
+)
+from .journal import CrawlJournal
 from helpers.report import get_all_links_from_report
-from configs.base.types import ReportFile, ReportLink
+from configs.base.types import CrawlSettings, ReportFile, ReportLink
 
 
 @dataclass
@@ -14,19 +24,56 @@ class RepoCrawlerBaseConfig:
     root_dir: str
     report_dir_path: str
     repo_data_dir_path: str
+    # per-report progress of the crawl, see CrawlJournal
+    journal_path: str = ""
 
 
 class RepoCrawlerBase:
-    def __init__(self, config: RepoCrawlerBaseConfig):
+    """
+    Fetch the GitHub resources the reports link to.
+
+    Links are canonicalized (canonical_github_url) so every resource is
+    fetched and stored once under resources/, however many reports cite
+    it; references/<report>.json keep each report's links to the
+    resources and index.json maps both ways. File contents go to the
+    shared blob store, resources only name their blob sha, and
+    snippets/<report>.json hold the lines each #L link cites.
+    """
+
+    def __init__(
+        self, config: RepoCrawlerBaseConfig, settings: CrawlSettings | None = None
+    ):
+        self.settings = settings or CrawlSettings()
         self.token = config.token
         self.root_dir = config.root_dir
         self.report_dir_path = config.report_dir_path
         self.repo_data_dir_path = config.repo_data_dir_path
-        self.github_crawler = GitHubCrawler(self.token)
+        self.github_crawler = GitHubCrawler(
+            self.token,
+            GITHUB_BLOB_DIR_PATH.format(root_dir=self.root_dir),
+            self.settings.concurrency,
+            GITHUB_CACHE_DIR_PATH.format(root_dir=self.root_dir),
+            self.settings.issue_comments,
+            GITHUB_MIRROR_DIR_PATH.format(root_dir=self.root_dir)
+            if self.settings.git_mirror
+            else None,
+        )
         self.report_files: list[ReportFile] | None = None
 
         if not os.path.exists(self.repo_data_dir_path):
             os.makedirs(self.repo_data_dir_path, exist_ok=True)
+        self.resource_dir_path = os.path.join(self.repo_data_dir_path, "resources")
+        self.reference_dir_path = os.path.join(
+            self.repo_data_dir_path, "references"
+        )
+        self.snippet_dir_path = os.path.join(self.repo_data_dir_path, "snippets")
+        self.index_path = os.path.join(self.repo_data_dir_path, "index.json")
+
+        self.journal: CrawlJournal | None = None
+        if config.journal_path:
+            self.journal = CrawlJournal(
+                config.journal_path, resume=self.settings.resume
+            )
 
     def load_report_files(self):
         # walk dir and load reports
@@ -44,42 +91,321 @@ class RepoCrawlerBase:
     def extract_links(self, json_data: dict | list) -> list[str]:
         return get_all_links_from_report(json_data)
 
+    def load_report_links(self, report_file: ReportFile) -> list[ReportLink]:
+        content = self.load_report_content(report_file)
+        return self.extract_links(content)
+
     def get_github_repo_data(self, url: str) -> dict | str | None:
         try:
             return self.github_crawler.fetch_data(url)
         except Exception as e:
+            print(f"[WARN] Failed to fetch {url}: {e!r}")
             return None
 
     def load_report_content(self, report_file: ReportFile):
         with open(report_file["file_path"], "r") as file:
             return json.load(file)
 
-    def save_github_repo_data(
-        self, report_name: str, report_link: ReportLink, data: dict | str
-    ):
-        data["report_name"] = report_name
-        data["report_link_url"] = report_link["url"]
-        data["report_link_hypertext"] = report_link["hypertext"]
-        data_file_name = base64.b64encode(report_link["url"].encode()).decode()
-        storage_dir_path = os.path.join(
-            self.repo_data_dir_path, report_name.replace(" ", "_")
+    def resource_path(self, resource_url: str) -> str:
+        key = hashlib.sha256(resource_url.encode()).hexdigest()
+        return os.path.join(self.resource_dir_path, key[:2], f"{key}.json")
+
+    def has_resource(self, resource_url: str) -> bool:
+        return os.path.exists(self.resource_path(resource_url))
+
+    def needs_fetch(self, resource_url: str) -> bool:
+        """
+        Whether to fetch resource_url on this run: files and trees pinned to
+        a commit sha never change and are kept once saved, anything else
+        (branches, issues) is fetched again, revalidated by the API cache.
+        """
+        pinned = re.search(GITHUB_PINNED_URL_PATTERN, resource_url)
+        return not (pinned and self.has_resource(resource_url))
+
+    def save_github_repo_data(self, resource_url: str, data: dict | str):
+        data["url"] = resource_url
+        content = json.dumps(data, indent=4).encode("utf-8")
+        _write_atomic(self.resource_path(resource_url), content)
+
+    def reference_path(self, report_name: str) -> str:
+        return os.path.join(
+            self.reference_dir_path, f"{report_name.replace(' ', '_')}.json"
         )
-        if not os.path.exists(storage_dir_path):
-            os.makedirs(storage_dir_path, exist_ok=True)
-        storage_fil_path = os.path.join(storage_dir_path, f"{data_file_name}.json")
-        with open(storage_fil_path, "w") as file:
-            json.dump(data, file, indent=4)
 
-    def crawl(self, report_file: ReportFile):
-        content = self.load_report_content(report_file)
-        report_name = report_file["report_name"]
-        links = self.extract_links(content)
+    def save_references(self, report_name: str, references: list[dict]):
+        content = json.dumps(references, indent=4).encode("utf-8")
+        _write_atomic(self.reference_path(report_name), content)
+
+    def snippet_path(self, report_name: str) -> str:
+        return os.path.join(
+            self.snippet_dir_path, f"{report_name.replace(' ', '_')}.json"
+        )
+
+    def get_snippets(self, references: list[dict]) -> list[dict]:
+        """
+        The lines each reference with a #L range cites, with the path and
+        ref of the file they are in; references to resources that could
+        not be fetched have none.
+        """
+        snippets, files = [], {}
+        for reference in references:
+            if reference["start_line"] is None:
+                continue
+            resource_url = reference["resource"]
+            if resource_url not in files:
+                data = self.load_resource(resource_url)
+                files[resource_url] = None
+                if data is not None and data.get("type") == "file":
+                    content = self.github_crawler.blobs.get(data["sha"])
+                    parsed_url = self.github_crawler.parse_url(resource_url)
+                    files[resource_url] = (
+                        data,
+                        parsed_url.get("branch"),
+                        content.decode("utf-8", errors="replace").splitlines(),
+                    )
+            if files[resource_url] is None:
+                continue
+            data, ref, lines = files[resource_url]
+            snippets.append(
+                {
+                    "url": reference["url"],
+                    "path": data["path"],
+                    "ref": ref,
+                    "blob": data["sha"],
+                    "start_line": reference["start_line"],
+                    "end_line": reference["end_line"],
+                    "lines": lines[
+                        reference["start_line"] - 1 : reference["end_line"]
+                    ],
+                }
+            )
+        return snippets
+
+    def save_snippets(self, report_name: str, references: list[dict]):
+        snippets = self.get_snippets(references)
+        content = json.dumps(snippets, indent=4).encode("utf-8")
+        _write_atomic(self.snippet_path(report_name), content)
+
+    def get_references(self, links: list[ReportLink]) -> list[dict]:
+        """
+        The report's links to GitHub, each with the resource it cites and
+        the line range of a #L anchor. Links to what the crawler cannot
+        fetch (pull requests, commits, pdf files, ...) are left out.
+        """
+        references = []
         for link in links:
-            data = self.get_github_repo_data(link["url"])
-            if data is not None:
-                self.save_github_repo_data(report_name, link, data)
+            url = link.get("url", "")
+            resource_url = canonical_github_url(url)
+            # a link to a whole issue list cites no issue, fetching it would
+            # list every issue of the repository
+            if resource_url is None or resource_url.endswith("/issues"):
+                continue
+            try:
+                self.github_crawler.parse_url(resource_url)
+            except ValueError:
+                continue
+            lines = re.search(r"#L(\d+)(?:-L(\d+))?$", url)
+            start_line = int(lines.group(1)) if lines else None
+            end_line = int(lines.group(2) or lines.group(1)) if lines else None
+            references.append(
+                {
+                    "url": url,
+                    "hypertext": link.get("hypertext", ""),
+                    "resource": resource_url,
+                    "start_line": start_line,
+                    "end_line": end_line,
+                }
+            )
+        return references
+
+    def crawl(self, report_file: ReportFile):
+        self.crawl_reports([report_file])
 
     def crawl_all(self):
         self.report_files = self.load_report_files()
-        for report_file in self.report_files:
-            self.crawl(report_file)
+        self.crawl_reports(self.report_files)
+        self.save_index()
+        if self.journal is not None:
+            self.journal.close()
+
+    def crawl_reports(self, report_files: list[ReportFile]):
+        """
+        Fetch the resources the reports cite on one concurrent stream, each
+        distinct resource once per run (see needs_fetch).
+
+        Issues of a repository the reports cite at least
+        GITHUB_BULK_ISSUE_THRESHOLD times, and more often than its issue
+        list has pages (a findings repository), are not fetched one by one:
+        the issue list is fetched in pages and every cited issue is saved
+        from it.
+        """
+        pending: dict[str, list[dict]] = {}
+        for report_file in report_files:
+            report_name = report_file["report_name"]
+            if self.journal is not None:
+                if self.journal.is_done(report_name):
+                    continue
+                self.journal.start(report_name)
+            try:
+                links = self.load_report_links(report_file)
+                references = self.get_references(links)
+                self.save_references(report_name, references)
+            except Exception as e:
+                print(f"[WARN] Failed to read {report_file['file_path']}: {e!r}")
+                if self.journal is not None:
+                    self.journal.fail(report_name, repr(e))
+                continue
+            pending[report_name] = references
+
+        # missing issues per repository, the issue list url of the repository
+        missing_issues: dict[str, set[str]] = {}
+        for references in pending.values():
+            for reference in references:
+                resource_url = reference["resource"]
+                issue = re.match(r"(.+/issues)/\d+$", resource_url)
+                if issue and self.needs_fetch(resource_url):
+                    missing_issues.setdefault(issue.group(1), set()).add(resource_url)
+        bulk_issues = {}
+        for list_url, issue_urls in missing_issues.items():
+            if len(issue_urls) < GITHUB_BULK_ISSUE_THRESHOLD:
+                continue
+            pages = self.count_issue_pages(list_url)
+            if pages is None or len(issue_urls) <= pages:
+                continue
+            for issue_url in issue_urls:
+                bulk_issues[issue_url] = list_url
+
+        # reports waiting on each job in flight, and the number of jobs each
+        # report still waits on; a report is done at zero
+        waiting: dict[str, list[str]] = {}
+        remaining: dict[str, int] = {}
+        # jobs finished on this run, later reports citing them do not wait
+        fetched: set[str] = set()
+
+        def report_done(report_name: str):
+            self.save_snippets(report_name, pending[report_name])
+            if self.journal is None:
+                return
+            # a fetch that failed (or an issue missing from its bulk list)
+            # left its resource unsaved, resume crawls the report again
+            missing = [
+                resource_url
+                for resource_url in dict.fromkeys(
+                    r["resource"] for r in pending[report_name]
+                )
+                if not self.has_resource(resource_url)
+            ]
+            if missing:
+                self.journal.fail(
+                    report_name, f"{len(missing)} resources not fetched: {missing[0]}"
+                )
+            else:
+                self.journal.done(report_name)
+
+        def jobs():
+            for report_name, references in pending.items():
+                remaining[report_name] = 0
+                job_urls = dict.fromkeys(
+                    bulk_issues.get(r["resource"], r["resource"]) for r in references
+                )
+                # jobs of the report may finish before the generator resumes,
+                # the loop below is then the one to call report_done
+                waits = False
+                for job_url in job_urls:
+                    if job_url in waiting:
+                        waiting[job_url].append(report_name)
+                        remaining[report_name] += 1
+                        waits = True
+                    elif job_url not in fetched and self.needs_fetch(job_url):
+                        waiting[job_url] = [report_name]
+                        remaining[report_name] += 1
+                        waits = True
+                        yield job_url, job_url
+                if not waits:
+                    report_done(report_name)
+
+        for job_url, data in self.github_crawler.fetch_many(jobs()):
+            if data is not None and data["type"] == "issues":
+                self.save_issues(
+                    job_url, data["issues"], missing_issues.get(job_url, set())
+                )
+            elif data is not None:
+                self.save_github_repo_data(job_url, data)
+            fetched.add(job_url)
+            for report_name in waiting.pop(job_url):
+                remaining[report_name] -= 1
+                if remaining[report_name] == 0:
+                    report_done(report_name)
+
+    def count_issue_pages(self, list_url: str) -> int | None:
+        """Pages of the issue list at list_url, None if it cannot be told."""
+        try:
+            parsed_url = self.github_crawler.parse_url(list_url)
+            return self.github_crawler.count_issue_pages(
+                f"{parsed_url['username']}/{parsed_url['repository']}"
+            )
+        except Exception as e:
+            print(f"[WARN] Failed to count the issues of {list_url}: {e!r}")
+            return None
+
+    def save_issues(
+        self, list_url: str, issues: dict[int, dict], cited_urls: set[str]
+    ):
+        """
+        Save the cited issues of a bulk issue list, each as its own resource
+        as if it was fetched alone, and the list as the numbers it held.
+        Cited issues missing from the list are fetched one by one on the
+        next run.
+        """
+        for number, issue in issues.items():
+            issue_url = f"{list_url}/{number}"
+            if issue_url not in cited_urls:
+                continue
+            issue["type"] = "issue"
+            self.save_github_repo_data(issue_url, issue)
+        self.save_github_repo_data(
+            list_url, {"issues": sorted(issues), "type": "issues"}
+        )
+
+    def load_resource(self, resource_url: str) -> dict | None:
+        try:
+            with open(self.resource_path(resource_url), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_index(self):
+        """
+        index.json: every report's references with the blob of a cited file,
+        and for every cited resource its stored file (None if it could not
+        be fetched) and the reports citing it.
+        """
+        reports, resources = {}, {}
+        if os.path.exists(self.reference_dir_path):
+            for file in sorted(os.listdir(self.reference_dir_path)):
+                with open(os.path.join(self.reference_dir_path, file), "r") as f:
+                    references = json.load(f)
+                report_name = file.removesuffix(".json")
+                reports[report_name] = references
+                for reference in references:
+                    resource_url = reference["resource"]
+                    if resource_url not in resources:
+                        data = self.load_resource(resource_url)
+                        path = self.resource_path(resource_url)
+                        resources[resource_url] = {
+                            "file": os.path.relpath(path, self.repo_data_dir_path)
+                            if data is not None
+                            else None,
+                            "blob": data["sha"]
+                            if data and data.get("type") == "file"
+                            else None,
+                            "reports": [],
+                        }
+                    reference["blob"] = resources[resource_url]["blob"]
+                    cited_by = resources[resource_url]["reports"]
+                    if report_name not in cited_by:
+                        cited_by.append(report_name)
+
+        index = {"reports": reports, "resources": resources}
+        content = json.dumps(index, indent=4).encode("utf-8")
+        _write_atomic(self.index_path, content)
@@ -1,32 +1,36 @@
 import os
 import json
+import hashlib
+import threading
 from abc import ABC, abstractmethod
-from selenium import webdriver
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
-import re            # ← ADD THIS
 from pathlib import Path
 
 
+from configs.base.types import CrawlSettings
+from helpers.filename import safe_filename
 from helpers.selenium import get_title_tag
+from helpers.snapshot import (
+    SERIALIZE_SCRIPT,
+    SnapshotElement,
+    parse_page_source,
+    snapshot_from_tree,
+)
+from .cache import RawPageCache
+from .fetch import HttpFetcher
+from .journal import CrawlJournal
+from .manifest import CrawlManifest
+from .pool import DriverPool, WorkerAttribute, worker_scope
+from .scheduler import host_scheduler
 
 
-INVALID_FS_CHARS = r'[<>:"/\\|?*]'
-
-def _safe_filename(stem: str, ext: str) -> str:
-    # replace invalid characters with ' - '
-    stem = re.sub(INVALID_FS_CHARS, " - ", stem)
-    # collapse whitespace and trim trailing space/dot (Windows limitation)
-    stem = re.sub(r"\s+", " ", stem).strip(" .")
-    # keep it reasonably short
-    if len(stem) > 200:
-        stem = stem[:200].rstrip()
-    return f"{stem}{ext}"
-
 @dataclass
 class ReportCrawlerConfig:
     root_dir: str
@@ -36,20 +40,84 @@ class ReportCrawlerConfig:
     title_tag: str
     subtitle_tag: str
     smtitle_tag: str
+    # serialize the rendered page once per report instead of querying the
+    # driver, see serialize_page
+    snapshot: bool = False
+    # content-addressed cache of every fetched page, see RawPageCache
+    raw_data_path: str = ""
+    # fingerprints of the last crawl of each project, see CrawlManifest
+    manifest_path: str = ""
+    # per-project progress of the crawl, see CrawlJournal
+    journal_path: str = ""
 
 
 class ReportCrawlerBase(ABC):
-    def __init__(self, options: list[str], config: ReportCrawlerConfig):
-        # Initialize WebDriver
+    # state of the project a worker is crawling, private to each pool worker
+    driver = WorkerAttribute()
+    document = WorkerAttribute()
+    current_project_report_path = WorkerAttribute()
+    current_project_name = WorkerAttribute()
+    title_tag = WorkerAttribute()
+    subtitle_tag = WorkerAttribute()
+    smtitle_tag = WorkerAttribute()
+    project_key = WorkerAttribute()
+    fingerprint = WorkerAttribute()
+    report_saved = WorkerAttribute()
+    report_unchanged = WorkerAttribute()
+    report_skipped = WorkerAttribute()
+    probed = WorkerAttribute()
+
+    # crawlers of server-rendered report sites set this to False, their
+    # pages are then fetched over HTTP and Chrome is never started
+    requires_javascript = True
+    # Chrome-rendered sites whose server already sends the report content
+    # (pre-rendered pages) set this to True, --incremental then probes them
+    # over HTTP before they are rendered
+    prerendered = False
+    # pages are read once parsed (eager load), load_page also waits for this
+    # locator of the report content the page renders
+    content_locator: tuple[str, str] | None = None
+
+    def __init__(
+        self,
+        options: list[str],
+        config: ReportCrawlerConfig,
+        settings: CrawlSettings | None = None,
+    ):
+        self.settings = settings or CrawlSettings()
+        self.stopped = threading.Event()
+
+        # Initialize the fetch backend: a WebDriver pool whose first session
+        # is started right away, or a pooled HTTP session
         self.options = Options()
         for option in options:
             self.options.add_argument(option)
 
-        try:
-            self.driver = webdriver.Chrome(options=self.options)
-        except Exception as e:
-            print(e)
-            exit(1)
+        self.pool: DriverPool | None = None
+        self.fetcher: HttpFetcher | None = None
+        self.driver = None
+        if self.settings.offline:
+            # pages come from the raw cache only
+            pass
+        elif self.requires_javascript:
+            self.pool = DriverPool(
+                self.options, self.settings.pool_size, not self.settings.full_load
+            )
+            try:
+                self.driver = self.pool.start()
+            except Exception as e:
+                print(e)
+                exit(1)
+        else:
+            self.fetcher = HttpFetcher(self.settings.pool_size)
+
+        # conditional requests of the unchanged check, see is_unchanged
+        self.prober: HttpFetcher | None = None
+        if self.settings.incremental and not self.settings.offline:
+            if self.fetcher is not None:
+                self.prober = self.fetcher
+            elif self.prerendered:
+                self.prober = HttpFetcher(self.settings.pool_size)
 
         # Report directory path of project
         self.project_list_path = config.project_list_path.format(
@@ -62,6 +130,33 @@ class ReportCrawlerBase(ABC):
             root_dir=config.root_dir, name="{name}"
         )
         self.error_dir_path = self.error_file_path.split("{name}")[0]
+        self.raw_cache: RawPageCache | None = None
+        if config.raw_data_path:
+            self.raw_cache = RawPageCache(
+                config.raw_data_path.format(root_dir=config.root_dir)
+            )
+        if self.settings.offline and self.raw_cache is None:
+            raise ValueError("Offline mode needs a raw page cache.")
+
+        # the manifest is only written by crawls that fetch pages
+        self.manifest: CrawlManifest | None = None
+        if config.manifest_path and not self.settings.offline:
+            self.manifest = CrawlManifest(
+                config.manifest_path.format(root_dir=config.root_dir)
+            )
+        self.project_key = ""
+        self.fingerprint: dict | None = None
+        self.probed = None
+        self.report_saved = False
+        self.report_unchanged = False
+        self.report_skipped = ""
+
+        self.journal: CrawlJournal | None = None
+        if config.journal_path:
+            self.journal = CrawlJournal(
+                config.journal_path.format(root_dir=config.root_dir),
+                resume=self.settings.resume,
+            )
 
         # Current project for the crawler
         self.current_project_report_path = ""
@@ -70,6 +165,10 @@ class ReportCrawlerBase(ABC):
         self.subtitle_tag = config.subtitle_tag
         self.smtitle_tag = config.smtitle_tag
 
+        # Parsed page_source of the current report, see load_page
+        self.snapshot = config.snapshot
+        self.document: SnapshotElement | None = None
+
         # Check if the file exists, if not, raise an error
         if not os.path.exists(self.project_list_path):
             raise FileNotFoundError(f"{self.project_list_path} not found.")
@@ -88,13 +187,14 @@ class ReportCrawlerBase(ABC):
     def save_report_data(self, data: dict):
         dir_path, base = os.path.split(self.current_project_report_path)
         root, ext = os.path.splitext(base)
-        safe_base = _safe_filename(root, ext or ".json")
+        safe_base = safe_filename(root, ext or ".json")
         safe_report_path = os.path.join(dir_path, safe_base)
 
         os.makedirs(dir_path, exist_ok=True)
         with open(safe_report_path, "w") as f:
             json.dump(data, f, indent=4)
         self.current_project_report_path = safe_report_path
+        self.record_crawl(safe_report_path)
 
 
     def log_error(self, project_name: str, exc: Exception):
@@ -104,7 +204,7 @@ class ReportCrawlerBase(ABC):
         When an exception is raised during crawling, this helper writes
         a concise message to a per-project error file inside the
         configured error directory. The filename is sanitized via
-        ``_safe_filename`` to avoid invalid filesystem characters.
+        ``safe_filename`` to avoid invalid filesystem characters.
 
         Parameters
         ----------
@@ -120,7 +220,7 @@ class ReportCrawlerBase(ABC):
             os.makedirs(self.error_dir_path, exist_ok=True)
 
             # Create a safe filename for the error log based on the project name
-            error_file = _safe_filename(project_name, ".txt")
+            error_file = safe_filename(project_name, ".txt")
             error_file_path = os.path.join(self.error_dir_path, error_file)
 
             # Append the exception details to the error log file
@@ -144,13 +244,296 @@ class ReportCrawlerBase(ABC):
         self.smtitle_tag = "h4" if self.title_tag == "h2" else "h5"
 
     def load_page(self, url, main_tag="main", timeout=10):
-        # Navigate to the website
-        self.driver.get(url)
+        self.document = None
+        if self.settings.offline:
+            document = self.load_cached_page(url)
+        elif self.fetcher is not None:
+            # static page: parse the response, main_tag must be in it; the
+            # unchanged check may already have downloaded it
+            probed_url, response = self.probed or ("", None)
+            self.probed = None
+            if response is None or probed_url != url:
+                response = self.fetcher.get(url)
+            self.set_validators(response)
+            self.cache_page(url, response.text, response.url, response.headers)
+            document = parse_page_source(response.text, response.url)
+        else:
+            document = None
+
+        if document is not None:
+            document.find_element(By.TAG_NAME, main_tag)
+            self.document = document
+            return
+
+        # Navigate to the website, paced by the host's politeness limits;
+        # the scheduler times the navigation only
+        with host_scheduler.request(url):
+            self.driver.get(url)
 
         # wait until the page is loaded
         WebDriverWait(self.driver, timeout).until(
             EC.presence_of_element_located((By.TAG_NAME, main_tag))
         )
+        if self.content_locator is not None:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located(self.content_locator)
+            )
+
+        # grab the rendered page once, the report is then parsed in-process
+        if self.snapshot:
+            self.serialize_page(url)
+        else:
+            self.cache_page(url, self.driver.page_source, self.driver.current_url)
+
+    def serialize_page(self, url: str | None = None) -> SnapshotElement:
+        """
+        Snapshot of the driver's page, caching it as the raw page of url if
+        given. The rendered DOM is serialized by one script, so the snapshot
+        follows the styles Chrome computed like WebElement.text. The
+        serialized DOM is cached with the page, offline crawls rebuild the
+        same snapshot.
+        """
+        serialized = self.driver.execute_script(SERIALIZE_SCRIPT)
+        if url is not None:
+            self.cache_page(
+                url, self.driver.page_source, self.driver.current_url, tree=serialized
+            )
+        self.document = snapshot_from_tree(serialized)
+        return self.document
+
+    def cache_page(
+        self, url: str, page_source: str, final_url: str = "", headers=None, tree=None
+    ):
+        if self.raw_cache is not None:
+            self.raw_cache.put(url, page_source, final_url, headers, tree)
+        if self.fingerprint is not None:
+            content = page_source.encode("utf-8")
+            self.fingerprint["content_hash"] = hashlib.sha256(content).hexdigest()
+
+    def set_validators(self, response):
+        """Fill the fingerprint from the response the page was served with."""
+        if self.fingerprint is None:
+            return
+        self.fingerprint.update(
+            etag=response.headers.get("ETag", ""),
+            last_modified=response.headers.get("Last-Modified", ""),
+            source_hash=hashlib.sha256(response.content).hexdigest(),
+        )
+
+    def probe_page(self, url: str, entry: dict) -> bool:
+        """
+        Conditionally request url as served and return whether it changed
+        since the crawl of the manifest entry. Only meaningful for static and
+        pre-rendered pages, a client-rendered page is served as the same app
+        shell. A changed page is kept for load_page to parse.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        response = self.prober.get(url, headers)
+        if response.status_code == 304:
+            for key in ("etag", "last_modified", "source_hash"):
+                self.fingerprint[key] = entry.get(key, "")
+            return False
+
+        self.set_validators(response)
+        if self.prober is self.fetcher:
+            self.probed = (url, response)
+        return self.fingerprint["source_hash"] != entry.get("source_hash")
+
+    def begin_fingerprint(self, project: dict):
+        report_url = project.get("report_link") or project.get("url") or ""
+        # manifest and journal key of the project
+        self.project_key = (
+            project.get("project_name") or project.get("name") or report_url
+        )
+        self.fingerprint = None
+        self.probed = None
+        if self.manifest is None:
+            return
+        self.fingerprint = {
+            "report_url": report_url,
+            "content_hash": "",
+            "source_hash": "",
+            "etag": "",
+            "last_modified": "",
+        }
+
+    def manifest_entry(self) -> dict | None:
+        """
+        Manifest entry of the current project if it is for the same report
+        url and the report it saved is still on disk.
+        """
+        if self.fingerprint is None or not self.project_key:
+            return None
+        entry = self.manifest.get(self.project_key)
+        if entry is None or entry.get("report_url") != self.fingerprint["report_url"]:
+            return None
+        if not os.path.exists(entry.get("report_path", "")):
+            return None
+        return entry
+
+    def is_unchanged(self) -> bool:
+        """
+        Whether the current project's static or pre-rendered report page is
+        as of its manifest entry, decided before crawling it. A project
+        without an entry is probed too so the validators of its page are
+        recorded. Other Chrome-rendered reports are compared once rendered,
+        see is_render_unchanged.
+        """
+        if self.prober is None or self.fingerprint is None:
+            return False
+        entry = self.manifest_entry()
+        try:
+            return not self.probe_page(self.fingerprint["report_url"], entry or {})
+        except Exception as e:
+            print(f"[WARN] Failed to probe {self.project_key}: {e!r}")
+            return False
+
+    def is_render_unchanged(self) -> bool:
+        """
+        With --incremental, whether the page load_page just rendered has the
+        content_hash of the manifest entry; the crawl of the project then
+        stops there and keeps its saved report.
+        """
+        if not self.settings.incremental or not self.requires_javascript:
+            return False
+        entry = self.manifest_entry()
+        if entry is None or not self.fingerprint["content_hash"]:
+            return False
+        if entry.get("content_hash") != self.fingerprint["content_hash"]:
+            return False
+        print(f"Skipping {self.project_key}, unchanged since last crawl.")
+        self.report_unchanged = True
+        return True
+
+    def skip_project(self, reason: str):
+        """Leave the current project out on purpose, it is journaled as skipped."""
+        print(f"Skipping {self.project_key} ({reason}).")
+        self.report_skipped = reason
+
+    def record_crawl(self, report_path: str):
+        """Store the fingerprint of the report just saved in the manifest."""
+        self.report_saved = True
+        if self.fingerprint is None or not self.project_key:
+            return
+        entry = dict(
+            self.fingerprint,
+            report_path=report_path,
+            crawled_at=datetime.now(timezone.utc).isoformat(),
+        )
+        self.manifest.update(self.project_key, entry)
+
+    def load_cached_page(self, url: str) -> SnapshotElement:
+        cached = self.raw_cache.get(url)
+        if cached is None:
+            raise FileNotFoundError(f"{url} is not in the raw page cache.")
+        record, page_source = cached
+        # pages serialized in Chrome are rebuilt from that tree, as they
+        # were read live
+        tree = self.raw_cache.get_tree(url)
+        if tree is not None:
+            return snapshot_from_tree(tree)
+        return parse_page_source(page_source, record["final_url"])
+
+    def find_element(self, by: str, value: str) -> WebElement | SnapshotElement:
+        if self.document is not None:
+            return self.document.find_element(by, value)
+        return self.driver.find_element(by, value)
+
+    def find_elements(
+        self, by: str, value: str
+    ) -> list[WebElement] | list[SnapshotElement]:
+        if self.document is not None:
+            return self.document.find_elements(by, value)
+        return self.driver.find_elements(by, value)
+
+    def crawl_projects(self, project_list: list[dict]):
+        """
+        Fan projects out to the pooled sessions, each worker crawls with its
+        own driver and current project state.
+        """
+        if self.journal is not None and self.journal.interrupted():
+            print(
+                "Resuming, unfinished in the last run: "
+                + ", ".join(self.journal.interrupted())
+            )
+
+        workers = max(1, self.settings.pool_size)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._crawl_in_worker, project)
+                for project in project_list
+            ]
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if not self.stopped.is_set():
+                            print(f"[WARN] Worker failed: {e!r}")
+            except KeyboardInterrupt:
+                self.quit()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+    def _crawl_in_worker(self, project: dict):
+        if self.stopped.is_set():
+            return
+        with worker_scope(self):
+            self.begin_fingerprint(project)
+            unit = self.project_key
+            if self.journal is not None and self.journal.is_done(unit):
+                return
+            if self.settings.incremental and self.is_unchanged():
+                print(f"Skipping {self.project_key}, unchanged since last crawl.")
+                if self.journal is not None:
+                    self.journal.done(unit)
+                return
+
+            self.report_saved = False
+            self.report_unchanged = False
+            self.report_skipped = ""
+            if self.journal is not None:
+                self.journal.start(unit)
+            try:
+                if self.pool is None:
+                    self.crawl_project(project)
+                else:
+                    with self.pool.session() as driver:
+                        self.driver = driver
+                        self.crawl_project(project)
+            except BaseException as e:
+                if self.journal is not None:
+                    self.journal.fail(unit, repr(e))
+                raise
+            if self.journal is None:
+                return
+            # crawl_project logs its own errors, a saved report is success
+            if self.report_saved or self.report_unchanged:
+                self.journal.done(unit)
+            elif self.report_skipped:
+                self.journal.skip(unit, self.report_skipped)
+            else:
+                self.journal.fail(unit, "no report saved")
+
+    def quit(self):
+        """Stop handing out projects and quit every pooled session."""
+        self.stopped.set()
+        if self.pool is not None:
+            self.pool.close()
+        if self.fetcher is not None:
+            self.fetcher.close()
+        if self.prober is not None and self.prober is not self.fetcher:
+            self.prober.close()
+        if self.journal is not None:
+            self.journal.close()
+
+    @abstractmethod
+    def crawl_project(self, project: dict):
+        pass
 
     @abstractmethod
     def crawl_all(self):
@@ -0,0 +1,131 @@
+import time
+import random
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from configs.base.scheduler import (
+    HOST_JITTER,
+    HOST_MAX_CONCURRENCY,
+    HOST_MAX_INTERVAL,
+    HOST_POLICIES,
+    HOST_REQUEST_RATE,
+    HOST_SLOW_RESPONSE,
+)
+
+
+class _HostState:
+    def __init__(self, rate: float, concurrency: int):
+        self.base_interval = 1 / rate
+        self.interval = self.base_interval
+        self.next_at = 0.0
+        self.slots = threading.Semaphore(concurrency)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds a Retry-After header (delay or HTTP date) asks to wait."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RequestSlot:
+    """A scheduled request, tell the scheduler how it went with status."""
+
+    def __init__(self):
+        self.status: int | None = None
+        self.retry_after: float | None = None
+
+    def record(self, response):
+        """Take status and Retry-After from the response of the request."""
+        self.status = response.status_code
+        self.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+class HostScheduler:
+    """
+    Process-wide politeness limits of every crawled host.
+
+    Each host gets requests at HOST_REQUEST_RATE, jittered by HOST_JITTER,
+    and at most HOST_MAX_CONCURRENCY at once (HOST_POLICIES overrides
+    both). A 429 or 5xx response, or one slower than HOST_SLOW_RESPONSE,
+    doubles the interval up to HOST_MAX_INTERVAL (or waits Retry-After);
+    every good response shrinks it back towards the configured rate.
+    """
+
+    def __init__(self):
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+        self.rate = HOST_REQUEST_RATE
+
+    def set_rate(self, rate: float):
+        """Default rate of the hosts without a policy of their own."""
+        with self._lock:
+            self.rate = rate
+            for host, state in self._hosts.items():
+                if host not in HOST_POLICIES:
+                    state.base_interval = state.interval = 1 / rate
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            if host not in self._hosts:
+                policy = HOST_POLICIES.get(host, {})
+                self._hosts[host] = _HostState(
+                    policy.get("rate", self.rate),
+                    policy.get("concurrency", HOST_MAX_CONCURRENCY),
+                )
+            return self._hosts[host]
+
+    @contextmanager
+    def request(self, url: str):
+        """
+        Wait for the turn of url's host, the block sends the request. Its
+        duration is the response time, waits for the page to render belong
+        after the block.
+        """
+        state = self._state(urlsplit(url).netloc.lower())
+        with state.slots:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, state.next_at)
+                jitter = random.uniform(-HOST_JITTER, HOST_JITTER)
+                state.next_at = start + state.interval * (1 + jitter)
+            if start > now:
+                time.sleep(start - now)
+
+            slot = RequestSlot()
+            began = time.monotonic()
+            try:
+                yield slot
+            except Exception:
+                self._back_off(state, slot)
+                raise
+            elapsed = time.monotonic() - began
+            status = slot.status or 200
+            if status == 429 or status >= 500 or elapsed > HOST_SLOW_RESPONSE:
+                self._back_off(state, slot)
+            else:
+                with self._lock:
+                    state.interval = max(state.base_interval, state.interval * 0.9)
+
+    def _back_off(self, state: _HostState, slot: RequestSlot):
+        with self._lock:
+            state.interval = min(HOST_MAX_INTERVAL, state.interval * 2)
+            wait = slot.retry_after if slot.retry_after is not None else state.interval
+            state.next_at = max(state.next_at, time.monotonic() + wait)
+
+
+# the scheduler every crawler of the process goes through
+host_scheduler = HostScheduler()
@@ -1,6 +1,5 @@
 import json
 from typing import List
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,12 +8,22 @@ from selenium.common.exceptions import NoSuchElementException
 from configs.code4rena.project import (
     CODE4RENA_URL,
     PROJECT_LIST_PATH,
+    PROJECT_JOURNAL_PATH,
     MAX_RETRIES,
 )
+from configs.base.types import CrawlSettings
+from ..base.journal import CrawlJournal
+from ..base.pool import start_chrome
+from ..base.scheduler import host_scheduler
 
 
 class ProjectCrawler:
-    def __init__(self, options: List[str] = [], root_dir: str = ""):
+    def __init__(
+        self,
+        options: List[str] = [],
+        root_dir: str = "",
+        settings: CrawlSettings | None = None,
+    ):
         # Initialize headless Chrome options
         self.options = Options()
         for option in options:
@@ -24,17 +33,23 @@ class ProjectCrawler:
         self.data_path = PROJECT_LIST_PATH.format(root_dir=root_dir)
         self.url = CODE4RENA_URL
         self.max_retries = MAX_RETRIES
+        settings = settings or CrawlSettings()
+        self.journal = CrawlJournal(
+            PROJECT_JOURNAL_PATH.format(root_dir=root_dir), resume=settings.resume
+        )
 
         # Initialize WebDriver
-        self.driver = webdriver.Chrome(options=self.options)
+        self.driver = start_chrome(self.options, not settings.full_load)
 
-    def load_page(self, url):
-        # Navigate to the website
-        self.driver.get(url)
+    def load_page(self, url, locator=(By.TAG_NAME, "main")):
+        # Navigate to the website, paced by the host's politeness limits
+        with host_scheduler.request(url):
+            self.driver.get(url)
 
-        # wait until the page is loaded
+        # pages are read once parsed (eager load), wait until the
+        # element read next is rendered
         WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "main"))
+            EC.presence_of_element_located(locator)
         )
 
     def write_project_to_file(self, project_list: dict):
@@ -45,7 +60,7 @@ class ProjectCrawler:
         if self.driver is None:
             return
         projects = []
-        self.load_page(self.url)
+        self.load_page(self.url, (By.CLASS_NAME, "report-tile"))
         project_list = self.driver.find_elements(By.CLASS_NAME, "report-tile")
         for project in project_list:
             try:
@@ -73,7 +88,13 @@ class ProjectCrawler:
         self.driver.quit()
 
     def crawl_all(self):
-        try:
-            self.crawl()
-        except Exception as e:
-            print(e)
+        if self.journal.is_done("projects"):
+            print("Project list is already crawled.")
+            self.driver.quit()
+        else:
+            try:
+                with self.journal.unit("projects"):
+                    self.crawl()
+            except Exception as e:
+                print(e)
+        self.journal.close()
@@ -1,7 +1,5 @@
 import json
-import time
 from typing import List
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,12 +9,22 @@ from selenium.common.exceptions import NoSuchElementException
 from configs.consensys.project import (
     CONSENSYS_URL,
     PROJECT_LIST_PATH,
+    PROJECT_JOURNAL_PATH,
     MAX_RETRIES,
 )
+from configs.base.types import CrawlSettings
+from ..base.journal import CrawlJournal
+from ..base.pool import start_chrome
+from ..base.scheduler import host_scheduler
 
 
 class ProjectCrawler:
-    def __init__(self, options: List[str] = [], root_dir: str = ""):
+    def __init__(
+        self,
+        options: List[str] = [],
+        root_dir: str = "",
+        settings: CrawlSettings | None = None,
+    ):
         # Initialize headless Chrome options
         self.options = Options()
         for option in options:
@@ -26,21 +34,27 @@ class ProjectCrawler:
         self.data_path = PROJECT_LIST_PATH.format(root_dir=root_dir)
         self.url = CONSENSYS_URL
         self.max_retries = MAX_RETRIES
+        settings = settings or CrawlSettings()
+        self.journal = CrawlJournal(
+            PROJECT_JOURNAL_PATH.format(root_dir=root_dir), resume=settings.resume
+        )
 
         # Initialize WebDriver
-        self.driver = webdriver.Chrome(options=self.options)
+        self.driver = start_chrome(self.options, not settings.full_load)
 
-    def load_page(self, url):
-        # Navigate to the website
-        self.driver.get(url)
+    def load_page(self, url, locator=(By.TAG_NAME, "main")):
+        # Navigate to the website, paced by the host's politeness limits
+        with host_scheduler.request(url):
+            self.driver.get(url)
 
-        # wait until the page is loaded
+        # pages are read once parsed (eager load), wait until the
+        # element read next is rendered
         WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "main"))
+            EC.presence_of_element_located(locator)
         )
 
     def get_meta_data(self, link: str) -> str:
-        self.load_page(link)
+        self.load_page(link, (By.CLASS_NAME, "tags-wrapper"))
         res = self.driver.find_element(By.CLASS_NAME, "tags-wrapper")
         try:
             date = res.text.split("\n")[2].strip()
@@ -72,7 +86,7 @@ class ProjectCrawler:
             return
         projects = []
         try:
-            self.load_page(self.url)
+            self.load_page(self.url, (By.CSS_SELECTOR, "tbody tr"))
             tbody = self.driver.find_element(By.TAG_NAME, "tbody")
             trs = tbody.find_elements(By.TAG_NAME, "tr")
             for tr in trs:
@@ -89,14 +103,15 @@ class ProjectCrawler:
             # find the div by xpath
         except NoSuchElementException as e:
             print(e)
-        finally:
-            time.sleep(1)
         self.write_project_to_file(projects)
 
     def crawl_all(self):
         try:
-            self.crawl()
+            if not self.journal.is_done("projects"):
+                with self.journal.unit("projects"):
+                    self.crawl()
             # self.get_meta_data_for_projects(self.url)
         except Exception as e:
             print(e)
+        self.journal.close()
         self.driver.quit()
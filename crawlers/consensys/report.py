@@ -8,7 +8,11 @@ from configs.consensys.project import PROJECT_LIST_PATH
 from configs.consensys.report import (
     REPORT_DATA_PATH,
     REPORT_ERROR_LOG_PATH,
+    REPORT_RAW_DATA_PATH,
+    REPORT_MANIFEST_PATH,
+    REPORT_JOURNAL_PATH,
 )
+from configs.base.types import CrawlSettings
 from ..base.report import ReportCrawlerBase, ReportCrawlerConfig
 from helpers.selenium import (
     extract_links,
@@ -21,17 +25,28 @@ from helpers.selenium import (
 
 
 class ReportCrawler(ReportCrawlerBase):
-    def __init__(self, options: list[str], root_dir: str = ""):
+    # reports are server-rendered, fetched without a browser
+    requires_javascript = False
+
+    def __init__(
+        self,
+        options: list[str],
+        root_dir: str = "",
+        settings: CrawlSettings | None = None,
+    ):
         config = ReportCrawlerConfig(
             root_dir=root_dir,
             project_list_path=PROJECT_LIST_PATH,
             report_data_path=REPORT_DATA_PATH,
             error_file_path=REPORT_ERROR_LOG_PATH,
+            raw_data_path=REPORT_RAW_DATA_PATH,
+            manifest_path=REPORT_MANIFEST_PATH,
+            journal_path=REPORT_JOURNAL_PATH,
             title_tag="h2",
             subtitle_tag="h3",
             smtitle_tag="h4",
         )
-        super().__init__(options, config)
+        super().__init__(options, config, settings)
 
     def __split(
         self, section: WebElement | list[WebElement], title_tag: str
@@ -46,7 +61,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_list, section_tmp = [], []
 
         # if elements is a single element, get elements in the section
-        if isinstance(elements, WebElement):
+        if not isinstance(elements, list):
             elements = section.find_elements(By.XPATH, "./*")
 
         for element in elements:
@@ -181,23 +196,29 @@ class ReportCrawler(ReportCrawlerBase):
     def crawl(self, project_url: str, project_name: str):
         self.set_current_project(project_name)
         self.load_page(project_url)
-        report = self.driver.find_element(By.CLASS_NAME, "dili-navigator-content")
+        report = self.find_element(By.CLASS_NAME, "dili-navigator-content")
         section_list = self.__split(report, self.title_tag)
         details = {"details": []}
         for section in section_list:
             details["details"].append(self.handle_section(section))
         self.save_report_data(details)
 
+    def crawl_project(self, project: dict):
+        try:
+            project_name = project["project_name"]
+            project_url = project["report_link"]
+            print(f"Crawling {project_name}...")
+            if "github" in project_url:
+                self.skip_project("report hosted on github")
+                return
+            if project_url.endswith(".pdf"):
+                self.skip_project("pdf")
+                return
+            self.crawl(project_url, project_name)
+        except Exception as e:
+            self.log_error(project_name, e)
+
     def crawl_all(self):
         project_list = self.load_project_list()
-        for project in project_list:
-            try:
-                project_name = project["project_name"]
-                project_url = project["report_link"]
-                print(f"Crawling {project_name}...")
-                if "github" not in project_url and not project_url.endswith(".pdf"):
-                    self.crawl(project_url, project_name)
-            except Exception as e:
-                self.log_error(project_name, e)
-
-        self.driver.quit()
+        self.crawl_projects(project_list)
+        self.quit()
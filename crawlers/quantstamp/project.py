@@ -1,22 +1,32 @@
 import json
 from typing import List
-from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
-from time import sleep
+from selenium.common.exceptions import TimeoutException
 from configs.quantstamp.project import (
     QUANTSTAMP_URL,
     TABLE_CONTAINER_XPATH,
     PROJECT_LIST_PATH,
+    PROJECT_JOURNAL_PATH,
     MAX_RETRIES,
+    SCROLL_TIMEOUT,
 )
+from configs.base.types import CrawlSettings
+from ..base.journal import CrawlJournal
+from ..base.pool import start_chrome
+from ..base.scheduler import host_scheduler
 
 
 class ProjectCrawler:
-    def __init__(self, options: List[str] = [], root_dir: str = ""):
+    def __init__(
+        self,
+        options: List[str] = [],
+        root_dir: str = "",
+        settings: CrawlSettings | None = None,
+    ):
         # Initialize headless Chrome options
         self.options = Options()
         for option in options:
@@ -26,13 +36,18 @@ class ProjectCrawler:
         self.data_path = PROJECT_LIST_PATH.format(root_dir=root_dir)
         self.url = QUANTSTAMP_URL
         self.max_retries = MAX_RETRIES
+        settings = settings or CrawlSettings()
+        self.journal = CrawlJournal(
+            PROJECT_JOURNAL_PATH.format(root_dir=root_dir), resume=settings.resume
+        )
 
         # Initialize WebDriver
-        self.driver = webdriver.Chrome(options=self.options)
+        self.driver = start_chrome(self.options, not settings.full_load)
 
     def load_page(self, url):
-        # Navigate to the website
-        self.driver.get(url)
+        # Navigate to the website, paced by the host's politeness limits
+        with host_scheduler.request(url):
+            self.driver.get(url)
 
         # wait until the page is loaded
         WebDriverWait(self.driver, 10).until(
@@ -42,10 +57,20 @@ class ProjectCrawler:
     def scroll_to_bottom(self, div: WebElement):
         cnt, retry = 0, 0
         script = "arguments[0].scrollTop = arguments[0].scrollHeight"
+        count_rows = lambda driver: len(div.find_elements(By.TAG_NAME, "tr"))
         while True:
-            self.driver.execute_script(script, div)
-            sleep(1)
-            total = len(div.find_elements(By.TAG_NAME, "tr"))
+            # each scroll loads the next rows from the host, wait for them
+            # rather than a fixed time; the host slot only covers the scroll
+            # that issues the request, not the wait
+            with host_scheduler.request(self.url):
+                self.driver.execute_script(script, div)
+            try:
+                WebDriverWait(self.driver, SCROLL_TIMEOUT).until(
+                    lambda driver: count_rows(driver) != cnt
+                )
+            except TimeoutException:
+                pass
+            total = count_rows(self.driver)
             if total != cnt:
                 cnt, retry = total, 0
             elif retry >= self.max_retries:
@@ -83,14 +108,18 @@ class ProjectCrawler:
         if self.driver is None:
             return
         try:
-            self.load_page(self.url)
-            # find the div by xpath
-            div = self.driver.find_element(By.XPATH, TABLE_CONTAINER_XPATH)
-            self.scroll_to_bottom(div)
-            table = div.find_element(By.TAG_NAME, "table")
-            tbody = table.find_element(By.TAG_NAME, "tbody")
-            trs = tbody.find_elements(By.TAG_NAME, "tr")
-            self.write_to_file(trs)
+            if self.journal.is_done("projects"):
+                return
+            with self.journal.unit("projects"):
+                self.load_page(self.url)
+                # find the div by xpath
+                div = self.driver.find_element(By.XPATH, TABLE_CONTAINER_XPATH)
+                self.scroll_to_bottom(div)
+                table = div.find_element(By.TAG_NAME, "table")
+                tbody = table.find_element(By.TAG_NAME, "tbody")
+                trs = tbody.find_elements(By.TAG_NAME, "tr")
+                self.write_to_file(trs)
 
         finally:
+            self.journal.close()
             self.driver.quit()
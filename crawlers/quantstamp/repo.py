@@ -1,10 +1,13 @@
 from ..base.repo import RepoCrawlerBase, RepoCrawlerBaseConfig
 from configs.quantstamp.report import REPORT_DATA_PATH
-from configs.quantstamp.repo import GITHUB_REPO_DATA_DIR_PATH
+from configs.quantstamp.repo import GITHUB_REPO_DATA_DIR_PATH, REPO_JOURNAL_PATH
+from configs.base.types import CrawlSettings
 
 
 class RepoCrawler(RepoCrawlerBase):
-    def __init__(self, token: str, root_dir: str):
+    def __init__(
+        self, token: str, root_dir: str, settings: CrawlSettings | None = None
+    ):
         config = RepoCrawlerBaseConfig(
             token=token,
             root_dir=root_dir,
@@ -12,5 +15,6 @@ class RepoCrawler(RepoCrawlerBase):
                 root_dir=root_dir
             ),
             repo_data_dir_path=GITHUB_REPO_DATA_DIR_PATH.format(root_dir=root_dir),
+            journal_path=REPO_JOURNAL_PATH.format(root_dir=root_dir),
         )
-        super().__init__(config)
+        super().__init__(config, settings)
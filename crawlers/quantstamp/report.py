@@ -3,7 +3,6 @@
 import json
 import os
 import re
-import time
 from typing import List, Dict, Any
 
 from selenium.webdriver.common.by import By
@@ -17,10 +16,16 @@ from configs.quantstamp.report import (
     REPORT_CONTAINER_XPATH,
     REPORT_DATA_PATH,         # kept for compatibility with the base
     REPORT_ERROR_LOG_PATH,    # kept for compatibility with the base
+    REPORT_RAW_DATA_PATH,
+    REPORT_MANIFEST_PATH,
+    REPORT_JOURNAL_PATH,
     SUMMARY_OF_FINGINDS_COLUMNS,
 )
 
+from configs.base.types import CrawlSettings
 from ..base.report import ReportCrawlerBase, ReportCrawlerConfig
+from ..base.pool import WorkerAttribute
+from ..base.scheduler import host_scheduler
 
 # Optional fallbacks from your repo (keep if you already have them)
 from .helper import (
@@ -37,27 +42,13 @@ from helpers.selenium import (
     extract_h4,
     extract_nested_list,
 )
+from helpers.filename import slug_filename
+from helpers.snapshot import parse_page_source
 
 # -----------------------------------------------------------------------------
 # Utilities
 # -----------------------------------------------------------------------------
 
-WINDOWS_RESERVED = {
-    "CON", "PRN", "AUX", "NUL",
-    "COM1", "COM2", "COM3",
-    "LPT1", "LPT2", "LPT3"
-}
-
-def safe_filename(name: str, maxlen: int = 120, repl: str = "_") -> str:
-    """Windows-safe slug for filenames/folders."""
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1F]+', repl, name)
-    name = re.sub(r"\s+", " ", name).strip().rstrip(".")
-    if name.upper() in WINDOWS_RESERVED:
-        name = f"_{name}"
-    name = re.sub(r"[^\w\- ]+", repl, name).replace(" ", "_")
-    return name[:maxlen].rstrip("_")
-
-
 def _grab_sections_from_text(container_text: str) -> Dict[str, Any]:
     """
     Robustly extract Description / Recommendation / Update / Files affected
@@ -113,17 +104,30 @@ class ReportCrawler(ReportCrawlerBase):
       - Optional sections handled leniently (no crashes).
     """
 
-    def __init__(self, options: List[str], root_dir: str = ""):
+    # per-project tracking, private to each pool worker
+    current_project_name_raw = WorkerAttribute()
+    current_project_name_safe = WorkerAttribute()
+    current_project_dir = WorkerAttribute()
+
+    def __init__(
+        self,
+        options: List[str],
+        root_dir: str = "",
+        settings: CrawlSettings | None = None,
+    ):
         config = ReportCrawlerConfig(
             root_dir=root_dir,
             project_list_path=PROJECT_LIST_PATH,
             report_data_path=REPORT_DATA_PATH,       # base compatibility (not used for output name)
             error_file_path=REPORT_ERROR_LOG_PATH,   # base compatibility
+            raw_data_path=REPORT_RAW_DATA_PATH,
+            manifest_path=REPORT_MANIFEST_PATH,
+            journal_path=REPORT_JOURNAL_PATH,
             title_tag="",
             subtitle_tag="",
             smtitle_tag="",
         )
-        super().__init__(options, config)
+        super().__init__(options, config, settings)
         # important: define root_dir for this subclass before using it
         self.config = config
         self.root_dir = root_dir or getattr(config, "root_dir", "") or os.getcwd()
@@ -150,8 +154,19 @@ class ReportCrawler(ReportCrawlerBase):
         REPORT_CONTAINER_XPATH often fails.  Instead, we wait for the
         executive-summary section to be present on the page.  This id is
         consistent across new reports.
+
+        The rendered page is serialized once (serialize_page) and every
+        handler reads from that document instead of querying the driver;
+        offline, the cached page is parsed instead.
         """
-        self.driver.get(url)
+        self.document = None
+        if self.settings.offline:
+            self.document = self.load_cached_page(url)
+            return
+
+        with host_scheduler.request(url):
+            self.driver.get(url)
+
         try:
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.ID, "executive-summary"))
@@ -161,20 +176,23 @@ class ReportCrawler(ReportCrawlerBase):
             WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.XPATH, REPORT_CONTAINER_XPATH))
             )
+        # every section in one script call, the handlers read the snapshot
+        self.serialize_page(url)
 
     # ---------------- I/O helpers ----------------
 
     def _begin_project(self, project_name: str):
         self.current_project_name_raw  = project_name
-        self.current_project_name_safe = safe_filename(project_name)
+        self.current_project_name_safe = slug_filename(project_name)
         self.current_project_dir = os.path.join(self.vendor_root, "sections", self.current_project_name_safe)
         os.makedirs(self.current_project_dir, exist_ok=True)
 
     def _write_json(self, project_name: str, data: dict):
-        out_path = os.path.join(self.reports_dir, f"{safe_filename(project_name)}.json")
+        out_path = os.path.join(self.reports_dir, f"{slug_filename(project_name)}.json")
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
         with open(out_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        self.record_crawl(out_path)
         print(f"✓ wrote {os.path.relpath(out_path, self.root_dir)}")
 
     def _log_error(self, section_id_or_name: str, error_msg: str):
@@ -210,7 +228,7 @@ class ReportCrawler(ReportCrawlerBase):
             section_id = "executive-summary"
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             # Extract a free‑form description at the top
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
@@ -260,7 +278,7 @@ class ReportCrawler(ReportCrawlerBase):
             section_id = "operational-considerations"
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             # description: first paragraph(s) until the list begins
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
@@ -299,7 +317,7 @@ class ReportCrawler(ReportCrawlerBase):
             section_id = "key-actors-and-capabilities"
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -347,10 +365,10 @@ class ReportCrawler(ReportCrawlerBase):
             # Auditor suggestions may not have an id on the container.  Try
             # locating via id first; if that fails, find the H1 heading.
             try:
-                section = self.driver.find_element(By.ID, section_id)
+                section = self.find_element(By.ID, section_id)
             except NoSuchElementException:
                 # locate the h1 heading and take its parent section
-                h1 = self.driver.find_element(By.XPATH, f"//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'), 'auditor suggestions')]")
+                h1 = self.find_element(By.XPATH, f"//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'), 'auditor suggestions')]")
                 section = h1.find_element(By.XPATH, "ancestor::section")
 
             res["links"] = extract_links(section)
@@ -421,7 +439,7 @@ class ReportCrawler(ReportCrawlerBase):
             section_id = "about-quantstamp"
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -445,7 +463,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.SUMMARY_OF_FINDINGS.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -476,7 +494,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.ASSESSMENT_BREAKDOWN.value
         res = {"title": section_id, "codes": [], "issues": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -512,7 +530,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.SCOPE.value
         res = {"title": section_id, "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -535,10 +553,14 @@ class ReportCrawler(ReportCrawlerBase):
 
     # ---------------- Findings helpers ----------------
 
-    def _collect_finding_anchor_hrefs(self) -> List[str]:
+    def _collect_finding_anchor_hrefs(self, root=None) -> List[str]:
+        """
+        root: the element (or snapshot) to search, defaults to the live page.
+        """
+        root = root or self.driver
         hrefs: List[str] = []
         try:
-            anchors = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='#findings-qs']")
+            anchors = root.find_elements(By.CSS_SELECTOR, "a[href*='#findings-qs']")
             for a in anchors:
                 href = a.get_attribute("href")
                 if href and "#findings-qs" in href:
@@ -548,14 +570,15 @@ class ReportCrawler(ReportCrawlerBase):
         # de-dupe preserving order
         return list(dict.fromkeys(hrefs))
 
-    def _extract_severity_status_from_summary_table(self) -> Dict[str, Dict[str, str]]:
+    def _extract_severity_status_from_summary_table(self, root=None) -> Dict[str, Dict[str, str]]:
         """
         Build a map { 'YIELD-1': {'severity': 'High', 'status': 'Fixed'}, ... }
         from the on-page summary table.
         """
+        root = root or self.driver
         id2meta: Dict[str, Dict[str, str]] = {}
         try:
-            table = self.driver.find_element(
+            table = root.find_element(
                 By.XPATH, "//table[.//th[contains(.,'Severity')] and .//th[contains(.,'ID')]]"
             )
             rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
@@ -579,12 +602,27 @@ class ReportCrawler(ReportCrawlerBase):
             pass
         return id2meta
 
+    def _collect_finding_containers(self, document) -> Dict[str, Any]:
+        """
+        Map every rendered finding block of the snapshot by its id,
+        e.g. { 'findings-qs3': <element>, ... }.
+        """
+        containers: Dict[str, Any] = {}
+        for container in document.find_elements(By.CSS_SELECTOR, "[id^='findings-qs']"):
+            containers.setdefault(container.get_attribute("id"), container)
+        return containers
+
     def _extract_finding_from_anchor(self, href: str, id2meta: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
         """
         Visit an anchor like ...#findings-qs3 and extract the long body.
+        Only used for blocks missing from the loaded document.
         """
+        if self.driver is None:
+            raise ValueError(f"{href} is not rendered in the cached page.")
         # Navigate to the specific finding
-        self.driver.get(href)
+        with host_scheduler.request(href):
+            self.driver.get(href)
+
         WebDriverWait(self.driver, 20).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "[id^='findings-qs']"))
         )
@@ -592,7 +630,12 @@ class ReportCrawler(ReportCrawlerBase):
         # IMPORTANT: use the exact fragment id so we don't pick the first block
         frag = href.rsplit("#", 1)[-1]  # e.g., "findings-qs3"
         container = self.driver.find_element(By.ID, frag)
+        return self._extract_finding_from_container(container, href, id2meta)
 
+    def _extract_finding_from_container(self, container, href: str, id2meta: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Extract the long body of one finding block (live or snapshot element).
+        """
         # Title, e.g., "YIELD-1  Staker Address Update Does Not Transfer Staker's Balance"
         title_text = ""
         try:
@@ -648,12 +691,18 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.FINDINGS.value
         res = {"title": section_id, "links": [], "index": [], "details": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            # one page_source read, every finding block is parsed from it
+            document = self.document
+            if document is None:
+                document = parse_page_source(
+                    self.driver.page_source, self.driver.current_url
+                )
+            section = document.find_element(By.ID, section_id)
             res["links"] = extract_links(section)
 
             # Build index (nice to have)
             try:
-                anchors = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='#findings-qs']")
+                anchors = document.find_elements(By.CSS_SELECTOR, "a[href*='#findings-qs']")
                 seen = set()
                 for a in anchors:
                     href = a.get_attribute("href")
@@ -664,14 +713,28 @@ class ReportCrawler(ReportCrawlerBase):
             except Exception:
                 pass
 
-            # Authoritative: visit each anchor and extract long body
-            id2meta = self._extract_severity_status_from_summary_table()
-            anchor_hrefs = self._collect_finding_anchor_hrefs()
+            # Authoritative: the block each anchor points to, plus blocks no
+            # anchor links to, all taken from the loaded document
+            id2meta = self._extract_severity_status_from_summary_table(document)
+            anchor_hrefs = self._collect_finding_anchor_hrefs(document)
+            containers = self._collect_finding_containers(document)
+            linked = {href.rsplit("#", 1)[-1] for href in anchor_hrefs}
+            page_url = document.base_url.split("#", 1)[0]
+            anchor_hrefs += [
+                f"{page_url}#{frag}"
+                for frag in containers
+                if frag not in linked and re.fullmatch(r"findings-qs\d+", frag)
+            ]
             seen_ids = set()
 
             for href in anchor_hrefs:
+                container = containers.get(href.rsplit("#", 1)[-1])
                 try:
-                    item = self._extract_finding_from_anchor(href, id2meta)
+                    if container is not None and container.text.strip():
+                        item = self._extract_finding_from_container(container, href, id2meta)
+                    else:
+                        # not rendered yet (lazy block): load its anchor
+                        item = self._extract_finding_from_anchor(href, id2meta)
                     fid = item.get("id") or ""
                     if fid:
                         if fid in seen_ids:
@@ -682,8 +745,6 @@ class ReportCrawler(ReportCrawlerBase):
                 except Exception as e:
                     self.record_error(f"{section_id}-anchor", f"{href} -> {e!r}")
                     continue
-                finally:
-                    time.sleep(0.2)
 
             # Fallback (if no anchors at all): try simple cards on the page
             if not res["details"]:
@@ -757,7 +818,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.DEFINITIONS.value
         res = {"title": section_id, "details": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             lis = extract_tags_in_webelement(section, "li")
             for li in lis:
                 try:
@@ -781,7 +842,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.APPENDIX.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
 
@@ -809,7 +870,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.TOOLSET.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["description"] = extract_description(section)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -838,7 +899,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.AUTOMATED_ANALYSIS.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
 
@@ -866,7 +927,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.TEST_SUITE_RESULTS.value
         res = {"title": section_id, "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
 
             contents = section.find_elements(By.XPATH, "./*/*[not(self::pre)]") or []
             codes_inline = section.find_elements(By.XPATH, ".//code[not(ancestor::pre)]")
@@ -888,7 +949,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.CODE_COVERAGE.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
 
@@ -927,7 +988,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.CHANGELOG.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["details"] = extract_tags(section, "li")
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
@@ -944,7 +1005,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.ADHERENCE_TO_BEST_PRACTICES.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
 
@@ -967,7 +1028,7 @@ class ReportCrawler(ReportCrawlerBase):
         section_id = REPORT_SECTION_ID.CODE_DOCUMENTATION.value
         res = {"title": section_id, "details": [], "codes": [], "links": []}
         try:
-            section = self.driver.find_element(By.ID, section_id)
+            section = self.find_element(By.ID, section_id)
             res["codes"] = extract_codes(section)
             res["links"] = extract_links(section)
 
@@ -989,6 +1050,8 @@ class ReportCrawler(ReportCrawlerBase):
     def crawl(self, url: str, project_name: str):
         self._begin_project(project_name)
         self.load_page(url)
+        if self.is_render_unchanged():
+            return
 
         details = {
             "project_name": self.current_project_name_raw,
@@ -1007,28 +1070,27 @@ class ReportCrawler(ReportCrawlerBase):
                     details["data"].append(data)
                 except Exception as e:
                     self.record_error(section, str(e))
-                time.sleep(0.25)
 
         self._write_json(self.current_project_name_raw, details)
 
+    def crawl_project(self, project: dict) -> None:
+        project_name = project.get("project_name") or project.get("name") or ""
+        report_url   = project.get("report_link") or project.get("url") or ""
+        if not project_name or not report_url:
+            return
+        if report_url.lower().endswith(".pdf"):
+            self.skip_project("pdf")
+            return
+
+        try:
+            self.crawl(report_url, project_name)
+        except Exception as e:
+            self._begin_project(project_name)
+            self.record_error("crawl_all", f"{project_name}: {e!r}")
+
     def crawl_all(self) -> None:
-        if self.driver is None:
+        if self.driver is None and not self.settings.offline:
             raise ValueError("Driver is not initialized.")
         project_list = self.load_project_list()
-
-        for project in project_list:
-            project_name = project.get("project_name") or project.get("name") or ""
-            report_url   = project.get("report_link") or project.get("url") or ""
-            if not project_name or not report_url:
-                continue
-            if report_url.lower().endswith(".pdf"):
-                print(f"Skipping {project_name} (pdf).")
-                continue
-
-            try:
-                self.crawl(report_url, project_name)
-            except Exception as e:
-                self._begin_project(project_name)
-                self.record_error("crawl_all", f"{project_name}: {e!r}")
-
-        self.driver.quit()
+        self.crawl_projects(project_list)
+        self.quit()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 months = {
     "january": "01",
     "february": "02",
@@ -16,8 +18,10 @@ months = {
 
 ## Date Convertors
 ## Map different date formats to a common format, if failed, return original date
+## Results are cached per date string, projects share few distinct dates
 
 
+@lru_cache(maxsize=None)
 def code4rena_date_convertor(date: str) -> str:
     """
     Example:
@@ -31,6 +35,7 @@ def code4rena_date_convertor(date: str) -> str:
         return date
 
 
+@lru_cache(maxsize=None)
 def consensys_date_convertor(date: str) -> str:
     """
     Example:
@@ -44,6 +49,7 @@ def consensys_date_convertor(date: str) -> str:
         return date
 
 
+@lru_cache(maxsize=None)
 def openzeppelin_date_convertor(date: str) -> str:
     """
     Example:
@@ -57,6 +63,7 @@ def openzeppelin_date_convertor(date: str) -> str:
         return date
 
 
+@lru_cache(maxsize=None)
 def quantstamp_date_convertor(date: str) -> str:
     """
     Example:
@@ -0,0 +1,33 @@
+import re
+
+## File names the report crawlers save projects under, also used by the
+## analyzers to find the project of a report
+
+INVALID_FS_CHARS = r'[<>:"/\\|?*]'
+
+WINDOWS_RESERVED = {
+    "CON", "PRN", "AUX", "NUL",
+    "COM1", "COM2", "COM3",
+    "LPT1", "LPT2", "LPT3"
+}
+
+
+def safe_filename(stem: str, ext: str) -> str:
+    # replace invalid characters with ' - '
+    stem = re.sub(INVALID_FS_CHARS, " - ", stem)
+    # collapse whitespace and trim trailing space/dot (Windows limitation)
+    stem = re.sub(r"\s+", " ", stem).strip(" .")
+    # keep it reasonably short
+    if len(stem) > 200:
+        stem = stem[:200].rstrip()
+    return f"{stem}{ext}"
+
+
+def slug_filename(name: str, maxlen: int = 120, repl: str = "_") -> str:
+    """Windows-safe slug for filenames/folders."""
+    name = re.sub(r'[<>:"/\\|?*\x00-\x1F]+', repl, name)
+    name = re.sub(r"\s+", " ", name).strip().rstrip(".")
+    if name.upper() in WINDOWS_RESERVED:
+        name = f"_{name}"
+    name = re.sub(r"[^\w\- ]+", repl, name).replace(" ", "_")
+    return name[:maxlen].rstrip("_")
@@ -1,7 +1,22 @@
 import re
 import requests
+from collections import Counter
+from typing import Callable
 from configs.base.types import ReportLink, init_link_info, LinkInfo, language_candidates
 
+# language of each file extension of language_candidates (r"\.sol\b" -> "sol"),
+# all matched at once by one alternation behind the dot: an extension is
+# followed by a non-word character, so at most one can match at a dot
+_LANGUAGE_EXTENSIONS = {
+    pattern.replace("\\b", "").replace("\\", "")[1:]: lang_name
+    for pattern, lang_name in language_candidates.items()
+}
+_LANGUAGE_PATTERN = re.compile(
+    r"\.(" + "|".join(map(re.escape, _LANGUAGE_EXTENSIONS)) + r")\b"
+)
+_URL_PATTERN = re.compile(r"https?://[^\s]+")
+_GITHUB_FILE_PATTERN = re.compile(r"github\.com/.+/.+/blob/.+/(.+)#")
+
 
 def get_all_links_from_report(json_data: dict | list) -> list[ReportLink]:
     links = []
@@ -24,20 +39,26 @@ def get_all_links_from_report(json_data: dict | list) -> list[ReportLink]:
 
 def is_vaild_github_url(url: str):
     try:
-        response = requests.get(url)
+        response = requests.get(url, timeout=30)
         return response.status_code == 200
     except requests.exceptions.RequestException:
         return False
 
 
 def analyze_links_info(
-    links: list[ReportLink], check_broken: bool = False
+    links: list[ReportLink],
+    check_broken: bool = False,
+    is_broken: Callable[[str], bool] | None = None,
 ) -> dict[str, int]:
     """
     links: list of ReportLink
     check_broken: boolean to check if the link is broken, default is False
+    is_broken: tells if a GitHub link is broken, a request per link with
+    is_vaild_github_url by default, see LinkChecker
     """
     github_url_base = "https://github.com"
+    if is_broken is None:
+        is_broken = lambda url: not is_vaild_github_url(url)
     info: LinkInfo = init_link_info(len(links))
     for link in links:
         url = link.get("url", "")
@@ -45,7 +66,7 @@ def analyze_links_info(
         # Check if the URL is a GitHub link
         if url.startswith(github_url_base):
             info["github"] += 1
-            if check_broken and not is_vaild_github_url(url):
+            if check_broken and is_broken(url):
                 info["github_broken"] += 1
             elif "issues/" in url:
                 info["github_issue"] += 1
@@ -96,28 +117,38 @@ def get_languages_from_project_url(url: str) -> dict[str, int]:
 def get_languages_of_report(report: dict) -> dict[str, int]:
     """
     Match the language pattern in the issue content.
-    """
-    languages = {}
-
-    # Convert issue to string
-    report_str = str(report)
-
-    # Extract URLs from the report
-    urls = re.findall(r"https?://[^\s]+", report_str)
 
-    # Search for each file extension using regular expressions
-    for pattern, lang_name in language_candidates.items():
-        # Check file extensions in the URLs
-        for url in urls:
-            file_path = extract_file_path_from_url(url)
-            if re.search(pattern, file_path):
-                languages[lang_name] = languages.get(lang_name, 0) + 1
-
-        # Check file extensions in the report content
-        matches = re.findall(pattern, report_str)
-        languages[lang_name] = languages.get(lang_name, 0) + len(matches)
-
-    return languages
+    Counts, per language, the file extensions in the report plus the urls
+    whose GitHub file path has the extension. The strings of the report are
+    scanned once for every extension, rather than str(report) once per
+    language; the counts are those of that scan.
+    """
+    texts = []
+    stack = [report]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str):
+            texts.append(value)
+
+    # "\0" is no word character, an extension ends at the end of its string
+    counts = Counter(_LANGUAGE_PATTERN.findall("\0".join(texts)))
+
+    # urls were read from str(report) up to the next space: a newline, escaped
+    # in its repr, does not end one
+    url_texts = " ".join(repr(text) for text in texts if "://" in text)
+    for url in _URL_PATTERN.findall(url_texts):
+        file_path = extract_file_path_from_url(url)
+        counts.update(set(_LANGUAGE_PATTERN.findall(file_path)))
+
+    return {
+        lang_name: counts[extension]
+        for extension, lang_name in _LANGUAGE_EXTENSIONS.items()
+    }
 
 
 def create_tqdm_title(title: str) -> str:
@@ -128,7 +159,7 @@ def extract_file_path_from_url(url: str) -> str:
     """
     Extract the file path from a GitHub URL.
     """
-    match = re.search(r"github\.com/.+/.+/blob/.+/(.+)#", url)
+    match = _GITHUB_FILE_PATTERN.search(url)
     if match:
         return match.group(1)
     return ""
@@ -0,0 +1,611 @@
+"""
+In-process HTML tree mimicking the part of selenium's WebElement API the
+crawlers use (find_element(s), text, tag_name, get_attribute).
+
+A page is fetched once through ``driver.page_source`` and parsed here, so
+the section split and every extract_* helper run without a WebDriver
+round-trip per call.  ``text`` follows the rules of WebDriver's
+getVisibleText atom (block elements start new lines, whitespace collapses
+outside <pre>, table cells are space separated) so the extracted strings
+match what the live elements return.  A tree serialized in the browser by
+``SERIALIZE_SCRIPT`` carries the computed display, white-space and
+text-transform of every element, which then replace the tag-based rules.
+"""
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+from helpers.xpath import evaluate_xpath
+
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}
+
+# tags rendered with a block-level (or table-row / list-item) display
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "caption", "center",
+    "dd", "details", "dialog", "dir", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hgroup", "hr", "html", "legend", "li", "listing", "main",
+    "menu", "nav", "ol", "optgroup", "option", "p", "plaintext", "pre",
+    "section", "summary", "table", "tbody", "tfoot", "thead", "tr", "ul", "xmp",
+}
+TABLE_CELL_TAGS = {"td", "th"}
+PRE_TAGS = {"pre", "textarea", "listing", "plaintext", "xmp"}
+HIDDEN_TAGS = {
+    "head", "script", "style", "template", "noscript", "title", "meta",
+    "link", "base",
+}
+
+# start tag -> open tags it implicitly closes, and the tags stopping the search
+IMPLIED_END = {
+    "li": ({"li"}, {"ul", "ol", "menu"}),
+    "dt": ({"dt", "dd"}, {"dl"}),
+    "dd": ({"dt", "dd"}, {"dl"}),
+    "tr": ({"tr", "td", "th"}, {"table", "thead", "tbody", "tfoot"}),
+    "td": ({"td", "th"}, {"tr", "table"}),
+    "th": ({"td", "th"}, {"tr", "table"}),
+    "thead": ({"tbody", "tfoot", "tr", "td", "th"}, {"table"}),
+    "tbody": ({"thead", "tbody", "tfoot", "tr", "td", "th"}, {"table"}),
+    "tfoot": ({"thead", "tbody", "tr", "td", "th"}, {"table"}),
+    "option": ({"option"}, {"select", "datalist", "optgroup"}),
+}
+# block tags closing an open <p>
+P_CLOSERS = BLOCK_TAGS - {"li", "dd", "dt", "tr", "tbody", "thead", "tfoot",
+                          "caption", "option", "optgroup", "body", "html"}
+P_SCOPE_BOUNDARY = {"td", "th", "table", "button", "li", "dd", "dt", "body"}
+
+_COLLAPSIBLE = re.compile("[ \f\t\v\u2028\u2029]+")
+_PRESERVED = re.compile("[ \f\t\v\u2028\u2029]")
+_ZERO_WIDTH = re.compile("[\u200b\u200e\u200f]")
+# words text-transform: capitalize starts with an upper case letter, as in
+# WebDriver's getVisibleText
+_WORD_START = re.compile(r"(^|\s)(\S)")
+
+
+class SnapshotText:
+    """A text node of the snapshot tree."""
+
+    __slots__ = ("data", "parent", "order")
+
+    def __init__(self, data: str, parent: "SnapshotElement", order: int):
+        self.data = data
+        self.parent = parent
+        self.order = order
+
+
+class SnapshotElement:
+    """
+    An element of a parsed page, answering the same calls as a WebElement.
+    """
+
+    def __init__(
+        self,
+        tag_name: str,
+        attrs: dict[str, str],
+        parent: "SnapshotElement | None",
+        order: int,
+    ):
+        self.tag_name = tag_name
+        self.attrs = attrs
+        self.parent = parent
+        self.order = order
+        self.children: list["SnapshotElement | SnapshotText"] = []
+        self._text: str | None = None
+        # (display, visibility, white-space, text-transform) as the browser
+        # computed them, None for parsed pages where they are derived from
+        # tags and styles
+        self.computed: tuple[str, ...] | None = None
+        self.base_url = ""
+        self.root = self if parent is None else parent.root
+
+    def __repr__(self):
+        return f"<SnapshotElement {self.tag_name} {self.attrs}>"
+
+    # ---------------- WebElement API ----------------
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = visible_text(self)
+        return self._text
+
+    def get_attribute(self, name: str) -> str | None:
+        value = self.attrs.get(name)
+        if name in ("href", "src") and value is not None:
+            return urljoin(self.root.base_url, value.strip())
+        if name == "class" and value is None:
+            return ""
+        return value
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        return self.attrs.get(name)
+
+    def find_elements(self, by: str, value: str) -> list["SnapshotElement"]:
+        if by == By.XPATH:
+            return [
+                node
+                for node in evaluate_xpath(value, self)
+                if isinstance(node, SnapshotElement)
+            ]
+        if by == By.CSS_SELECTOR:
+            selectors = parse_css(value)
+            return [
+                el
+                for el in self.iter_descendants()
+                if any(match_css(el, selector) for selector in selectors)
+            ]
+        if by == By.TAG_NAME:
+            tag = value.lower()
+            return [el for el in self.iter_descendants() if el.tag_name == tag]
+        if by == By.CLASS_NAME:
+            return [el for el in self.iter_descendants() if value in el.classes]
+        if by == By.ID:
+            return [el for el in self.iter_descendants() if el.attrs.get("id") == value]
+        if by == By.NAME:
+            return [el for el in self.iter_descendants() if el.attrs.get("name") == value]
+        raise ValueError(f"Unsupported locator strategy for snapshots: {by}")
+
+    def find_element(self, by: str, value: str) -> "SnapshotElement":
+        if by == By.ID:
+            # ids are unique in practice, stop at the first one
+            for el in self.iter_descendants():
+                if el.attrs.get("id") == value:
+                    return el
+            elements = []
+        else:
+            elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(
+                f'no such element: Unable to locate element: '
+                f'{{"method":"{by}","selector":"{value}"}}'
+            )
+        return elements[0]
+
+    # ---------------- tree helpers ----------------
+
+    @property
+    def classes(self) -> list[str]:
+        return self.attrs.get("class", "").split()
+
+    def element_children(self) -> list["SnapshotElement"]:
+        return [c for c in self.children if isinstance(c, SnapshotElement)]
+
+    def iter_descendants(self):
+        stack = list(reversed(self.element_children()))
+        while stack:
+            el = stack.pop()
+            yield el
+            stack.extend(reversed(el.element_children()))
+
+    def string_value(self) -> str:
+        """XPath string-value: every descendant text node concatenated."""
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, SnapshotText):
+                parts.append(node.data)
+            else:
+                stack.extend(reversed(node.children))
+        return "".join(parts)
+
+
+# -----------------------------------------------------------------------------
+# Parsing
+# -----------------------------------------------------------------------------
+
+
+class _SnapshotBuilder(HTMLParser):
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.order = 0
+        self.root = SnapshotElement("#document", {}, None, self._next())
+        self.root.base_url = base_url
+        self.stack = [self.root]
+        self.strip_newline = False
+
+    def _next(self) -> int:
+        self.order += 1
+        return self.order
+
+    def _close_until(self, index: int):
+        del self.stack[index:]
+
+    def _implied_end(self, tag: str):
+        if tag in IMPLIED_END:
+            closes, boundary = IMPLIED_END[tag]
+            for i in range(len(self.stack) - 1, 0, -1):
+                open_tag = self.stack[i].tag_name
+                if open_tag in closes:
+                    self._close_until(i)
+                    break
+                if open_tag in boundary:
+                    break
+        if tag in P_CLOSERS:
+            for i in range(len(self.stack) - 1, 0, -1):
+                open_tag = self.stack[i].tag_name
+                if open_tag == "p":
+                    self._close_until(i)
+                    break
+                if open_tag in P_SCOPE_BOUNDARY:
+                    break
+
+    def handle_starttag(self, tag, attrs):
+        self._implied_end(tag)
+        attributes = {k: (v if v is not None else "") for k, v in attrs}
+        element = SnapshotElement(tag, attributes, self.stack[-1], self._next())
+        self.stack[-1].children.append(element)
+        if tag == "base" and "href" in attributes and not self.root.attrs.get("base"):
+            self.root.attrs["base"] = attributes["href"]
+            self.root.base_url = urljoin(self.root.base_url, attributes["href"])
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+        self.strip_newline = tag in PRE_TAGS
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and self.stack[-1].tag_name == tag:
+            self.stack.pop()
+        self.strip_newline = False
+
+    def handle_endtag(self, tag):
+        self.strip_newline = False
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i].tag_name == tag:
+                self._close_until(i)
+                return
+        if tag == "p":
+            # a stray </p> creates an empty paragraph, like browsers do
+            self.handle_starttag("p", [])
+            self.stack.pop()
+
+    def handle_data(self, data):
+        if self.strip_newline:
+            self.strip_newline = False
+            if data.startswith("\r\n"):
+                data = data[2:]
+            elif data.startswith("\n"):
+                data = data[1:]
+        if not data:
+            return
+        parent = self.stack[-1]
+        if parent.children and isinstance(parent.children[-1], SnapshotText):
+            parent.children[-1].data += data
+        else:
+            parent.children.append(SnapshotText(data, parent, self._next()))
+
+
+def parse_page_source(page_source: str, base_url: str = "") -> SnapshotElement:
+    """
+    Parse a page into a snapshot tree, return the document node.
+    Links read through get_attribute("href") are resolved against base_url.
+    """
+    builder = _SnapshotBuilder(base_url)
+    builder.feed(page_source)
+    builder.close()
+    return builder.root
+
+
+# the rendered DOM as [tag, attributes, computed, children] lists, children
+# being such lists or text strings; one execute_script instead of a
+# WebDriver round-trip per element. Script and style contents are left out.
+SERIALIZE_SCRIPT = """
+const skipped = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"]);
+function serialize(element) {
+    const attributes = {};
+    for (const attribute of element.attributes) {
+        attributes[attribute.name] = attribute.value;
+    }
+    const style = getComputedStyle(element);
+    const children = [];
+    if (!skipped.has(element.tagName)) {
+        for (const child of element.childNodes) {
+            if (child.nodeType === Node.TEXT_NODE) {
+                children.push(child.data);
+            } else if (child.nodeType === Node.ELEMENT_NODE) {
+                children.push(serialize(child));
+            }
+        }
+    }
+    return [
+        element.tagName.toLowerCase(),
+        attributes,
+        [style.display, style.visibility, style.whiteSpace, style.textTransform],
+        children,
+    ];
+}
+return {base_url: document.baseURI, tree: serialize(document.documentElement)};
+"""
+
+
+def snapshot_from_tree(serialized: dict) -> SnapshotElement:
+    """
+    Build a snapshot tree from the SERIALIZE_SCRIPT result, return the
+    document node. Visible text follows the styles the browser computed.
+    """
+    order = 0
+    root = SnapshotElement("#document", {}, None, order)
+    root.base_url = serialized["base_url"]
+    # depth first, so order is document order like the parser's
+    stack = [(root, iter([serialized["tree"]]))]
+    while stack:
+        parent, nodes = stack[-1]
+        node = next(nodes, None)
+        if node is None:
+            stack.pop()
+            continue
+        order += 1
+        if isinstance(node, str):
+            if parent.children and isinstance(parent.children[-1], SnapshotText):
+                parent.children[-1].data += node
+            else:
+                parent.children.append(SnapshotText(node, parent, order))
+            continue
+        tag_name, attrs, computed, children = node
+        element = SnapshotElement(tag_name, attrs, parent, order)
+        element.computed = tuple(computed)
+        parent.children.append(element)
+        stack.append((element, iter(children)))
+    return root
+
+
+# -----------------------------------------------------------------------------
+# Visible text
+# -----------------------------------------------------------------------------
+
+
+def _style(element: SnapshotElement) -> dict[str, str]:
+    style = element.attrs.get("style")
+    if not style:
+        return {}
+    declarations = {}
+    for declaration in style.split(";"):
+        if ":" in declaration:
+            key, value = declaration.split(":", 1)
+            declarations[key.strip().lower()] = value.strip().lower()
+    return declarations
+
+
+def _is_shown(element: SnapshotElement) -> bool:
+    if element.computed is not None:
+        display, visibility = element.computed[:2]
+        return display != "none" and visibility != "hidden"
+    if element.tag_name in HIDDEN_TAGS or "hidden" in element.attrs:
+        return False
+    if element.tag_name == "input" and element.attrs.get("type") == "hidden":
+        return False
+    style = _style(element)
+    return style.get("display") != "none" and style.get("visibility") != "hidden"
+
+
+def _display(element: SnapshotElement) -> str:
+    if element.computed is not None:
+        return element.computed[0]
+    display = _style(element).get("display")
+    if display:
+        return display
+    if element.tag_name in TABLE_CELL_TAGS:
+        return "table-cell"
+    return "block" if element.tag_name in BLOCK_TAGS else "inline"
+
+
+INLINE_DISPLAY_BOXES = {
+    "inline", "inline-block", "inline-table", "none", "table-cell",
+    "table-column", "table-column-group",
+}
+
+
+def _whitespace(element: SnapshotElement, inherited: str) -> str:
+    if element.computed is not None:
+        return element.computed[2]
+    return _style(element).get("white-space") or (
+        "pre" if element.tag_name in PRE_TAGS else inherited
+    )
+
+
+def _text_transform(element: SnapshotElement, inherited: str) -> str:
+    if element.computed is not None:
+        # trees serialized before text-transform was recorded
+        return element.computed[3] if len(element.computed) > 3 else "none"
+    return _style(element).get("text-transform") or inherited
+
+
+def _append_text_node(text: str, whitespace: str, transform: str, lines: list[str]):
+    text = _ZERO_WIDTH.sub("", text).replace("\r\n", "\n").replace("\r", "\n")
+    if whitespace in ("normal", "nowrap"):
+        text = text.replace("\n", " ")
+    if whitespace in ("pre", "pre-wrap"):
+        text = _PRESERVED.sub("\xa0", text)
+    else:
+        text = _COLLAPSIBLE.sub(" ", text)
+    if transform == "capitalize":
+        text = _WORD_START.sub(lambda m: m.group(1) + m.group(2).upper(), text)
+    elif transform == "uppercase":
+        text = text.upper()
+    elif transform == "lowercase":
+        text = text.lower()
+    line = lines.pop()
+    if line.endswith(" ") and text.startswith(" "):
+        text = text[1:]
+    lines.append(line + text)
+
+
+def _append_element(
+    element: SnapshotElement, lines: list[str], whitespace: str, transform: str
+):
+    if element.tag_name == "br":
+        lines.append("")
+        return
+    if not _is_shown(element):
+        return
+    display = _display(element)
+    is_cell = element.tag_name in TABLE_CELL_TAGS or display == "table-cell"
+    is_block = not is_cell and display not in INLINE_DISPLAY_BOXES
+    if is_block and lines[-1].strip():
+        lines.append("")
+
+    whitespace = _whitespace(element, whitespace)
+    transform = _text_transform(element, transform)
+    for child in element.children:
+        if isinstance(child, SnapshotText):
+            _append_text_node(child.data, whitespace, transform, lines)
+        else:
+            _append_element(child, lines, whitespace, transform)
+
+    line = lines[-1]
+    if is_cell and line and not line.endswith(" "):
+        lines[-1] = line + " "
+    if is_block and line.strip():
+        lines.append("")
+
+
+def _inherited_style(element: SnapshotElement) -> tuple[str, str] | None:
+    """
+    white-space and text-transform of the parent chain, None if an
+    ancestor is not shown.
+    """
+    whitespace, transform = "normal", "none"
+    ancestors = []
+    parent = element.parent
+    while parent is not None and parent.tag_name != "#document":
+        ancestors.append(parent)
+        parent = parent.parent
+    for ancestor in reversed(ancestors):
+        if not _is_shown(ancestor):
+            return None
+        whitespace = _whitespace(ancestor, whitespace)
+        transform = _text_transform(ancestor, transform)
+    return whitespace, transform
+
+
+def visible_text(element: SnapshotElement) -> str:
+    lines = [""]
+    if element.tag_name == "#document":
+        for child in element.element_children():
+            _append_element(child, lines, "normal", "none")
+    else:
+        inherited = _inherited_style(element)
+        if inherited is None:
+            return ""
+        _append_element(element, lines, *inherited)
+    text = "\n".join(line.strip("\t\n\r ") for line in lines)
+    return text.strip("\t\n\r ").replace("\xa0", " ")
+
+
+# -----------------------------------------------------------------------------
+# CSS selectors (tag, #id, .class, [attr op value], descendant and child)
+# -----------------------------------------------------------------------------
+
+_CSS_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<combinator>>)|
+        (?P<tag>[A-Za-z][\w-]*|\*)|
+        \#(?P<id>[\w-]+)|
+        \.(?P<cls>[\w-]+)|
+        \[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[\^$*~|]?=)\s*
+            (?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+))\s*)?\]
+    )""",
+    re.X,
+)
+
+
+@lru_cache(maxsize=256)
+def parse_css(selector_group: str) -> tuple:
+    """
+    Compile a selector group into tuples of (combinator, compound) steps,
+    ordered right to left.
+    """
+    selectors = []
+    for selector in selector_group.split(","):
+        steps, compound, combinator = [], None, " "
+        pos, selector = 0, selector.strip()
+        while pos < len(selector):
+            m = _CSS_TOKEN.match(selector, pos)
+            if not m or m.end() == pos:
+                raise ValueError(f"Unsupported CSS selector: {selector}")
+            whitespace_before = selector[pos].isspace()
+            if m.group("combinator"):
+                if compound is not None:
+                    steps.append((combinator, compound))
+                compound, combinator = None, ">"
+            else:
+                if whitespace_before and compound is not None:
+                    steps.append((combinator, compound))
+                    compound, combinator = None, " "
+                compound = compound or {"tag": None, "id": None, "cls": [], "attrs": []}
+                if m.group("tag"):
+                    tag = m.group("tag")
+                    compound["tag"] = None if tag == "*" else tag.lower()
+                elif m.group("id"):
+                    compound["id"] = m.group("id")
+                elif m.group("cls"):
+                    compound["cls"].append(m.group("cls"))
+                else:
+                    value = m.group("dq")
+                    if value is None:
+                        value = m.group("sq")
+                    if value is None:
+                        value = m.group("bare")
+                    compound["attrs"].append((m.group("attr"), m.group("op"), value))
+            pos = m.end()
+        if compound is not None:
+            steps.append((combinator, compound))
+        selectors.append(tuple(reversed(steps)))
+    return tuple(selectors)
+
+
+def _match_compound(element: SnapshotElement, compound: dict) -> bool:
+    if compound["tag"] and element.tag_name != compound["tag"]:
+        return False
+    if compound["id"] and element.attrs.get("id") != compound["id"]:
+        return False
+    if compound["cls"] and not all(c in element.classes for c in compound["cls"]):
+        return False
+    for name, op, value in compound["attrs"]:
+        actual = element.attrs.get(name)
+        if actual is None:
+            return False
+        if op is None:
+            continue
+        if op == "=" and actual != value:
+            return False
+        if op == "^=" and not (value and actual.startswith(value)):
+            return False
+        if op == "$=" and not (value and actual.endswith(value)):
+            return False
+        if op == "*=" and not (value and value in actual):
+            return False
+        if op == "~=" and value not in actual.split():
+            return False
+        if op == "|=" and actual != value and not actual.startswith(value + "-"):
+            return False
+    return True
+
+
+def match_css(element: SnapshotElement, selector: tuple) -> bool:
+    """selector: steps from parse_css, rightmost compound first."""
+    if not selector or not _match_compound(element, selector[0][1]):
+        return False
+    combinator = selector[0][0]
+    rest = selector[1:]
+    if not rest:
+        return True
+    parent = element.parent
+    if combinator == ">":
+        return (
+            parent is not None
+            and parent.tag_name != "#document"
+            and match_css(parent, rest)
+        )
+    while parent is not None and parent.tag_name != "#document":
+        if match_css(parent, rest):
+            return True
+        parent = parent.parent
+    return False
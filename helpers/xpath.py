@@ -0,0 +1,489 @@
+"""
+A small XPath 1.0 evaluator for snapshot trees (helpers/snapshot.py).
+
+It covers the expressions the crawlers hand to find_element(s): location
+paths over the child / descendant / parent / ancestor / sibling / self /
+attribute axes, positional and boolean predicates, unions, comparisons and
+the string functions contains, starts-with, translate and normalize-space.
+"""
+
+import re
+from functools import lru_cache
+
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<literal>"[^"]*"|'[^']*')|
+        (?P<number>\d+(?:\.\d*)?|\.\d+)|
+        (?P<op>//|::|\.\.|!=|<=|>=|[/()\[\]@,|=<>.*])|
+        (?P<name>[A-Za-z_][\w-]*)
+    )""",
+    re.X,
+)
+
+NODE_TYPES = {"node", "text"}
+REVERSE_AXES = {"ancestor", "ancestor-or-self", "parent", "preceding-sibling"}
+
+
+class _Attribute:
+    """Attribute node, only produced by the attribute axis."""
+
+    __slots__ = ("name", "value", "parent", "order")
+
+    def __init__(self, name: str, value: str, parent):
+        self.name = name
+        self.value = value
+        self.parent = parent
+        self.order = parent.order + 0.5
+
+
+def _tokenize(expression: str) -> list[tuple[str, str]]:
+    tokens, pos = [], 0
+    expression = expression.rstrip()
+    while pos < len(expression):
+        m = _TOKEN.match(expression, pos)
+        if not m or m.end() == pos:
+            raise ValueError(f"Invalid xpath: {expression!r} at {pos}")
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == "literal":
+            value = value[1:-1]
+        tokens.append((kind, value))
+        pos = m.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.pos = 0
+
+    def peek(self, offset: int = 0) -> tuple[str, str] | None:
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def peek_op(self, *ops: str) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == "op" and token[1] in ops
+
+    def peek_name(self, *names: str) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == "name" and token[1] in names
+
+    def take(self) -> tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of xpath: {self.expression!r}")
+        self.pos += 1
+        return token
+
+    def expect(self, op: str):
+        token = self.take()
+        if token != ("op", op):
+            raise ValueError(f"Expected {op!r} in xpath: {self.expression!r}")
+
+    def parse(self):
+        expr = self.parse_or()
+        if self.peek() is not None:
+            raise ValueError(f"Unexpected {self.peek()[1]!r} in xpath: {self.expression!r}")
+        return expr
+
+    def parse_or(self):
+        expr = self.parse_and()
+        while self.peek_name("or"):
+            self.take()
+            expr = ("or", expr, self.parse_and())
+        return expr
+
+    def parse_and(self):
+        expr = self.parse_compare()
+        while self.peek_name("and"):
+            self.take()
+            expr = ("and", expr, self.parse_compare())
+        return expr
+
+    def parse_compare(self):
+        expr = self.parse_union()
+        while self.peek_op("=", "!=", "<", ">", "<=", ">="):
+            op = self.take()[1]
+            expr = ("compare", op, expr, self.parse_union())
+        return expr
+
+    def parse_union(self):
+        expr = self.parse_path()
+        while self.peek_op("|"):
+            self.take()
+            expr = ("union", expr, self.parse_path())
+        return expr
+
+    def parse_path(self):
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of xpath: {self.expression!r}")
+        if token == ("op", "/"):
+            self.take()
+            steps = []
+            if self._starts_step():
+                steps = self.parse_relative()
+            return ("path", "root", steps)
+        if token == ("op", "//"):
+            self.take()
+            return ("path", "root", [("descendant-or-self", "node()", [])] + self.parse_relative())
+
+        is_call = (
+            token[0] == "name"
+            and self.peek(1) == ("op", "(")
+            and token[1] not in NODE_TYPES
+        )
+        if token[0] in ("literal", "number") or token == ("op", "(") or is_call:
+            primary = self.parse_primary()
+            predicates = self.parse_predicates()
+            if predicates:
+                primary = ("filter", primary, predicates)
+            if self.peek_op("/", "//"):
+                steps = []
+                if self.take()[1] == "//":
+                    steps.append(("descendant-or-self", "node()", []))
+                return ("path", primary, steps + self.parse_relative())
+            return primary
+        return ("path", "context", self.parse_relative())
+
+    def _starts_step(self) -> bool:
+        token = self.peek()
+        if token is None:
+            return False
+        return token[0] == "name" or token in (("op", "."), ("op", ".."), ("op", "@"), ("op", "*"))
+
+    def parse_relative(self) -> list:
+        steps = [self.parse_step()]
+        while self.peek_op("/", "//"):
+            if self.take()[1] == "//":
+                steps.append(("descendant-or-self", "node()", []))
+            steps.append(self.parse_step())
+        return steps
+
+    def parse_step(self):
+        if self.peek_op("."):
+            self.take()
+            return ("self", "node()", [])
+        if self.peek_op(".."):
+            self.take()
+            return ("parent", "node()", [])
+        axis = "child"
+        if self.peek_op("@"):
+            self.take()
+            axis = "attribute"
+        elif self.peek(1) == ("op", "::"):
+            axis = self.take()[1]
+            self.take()
+        kind, value = self.take()
+        if (kind, value) == ("op", "*"):
+            test = "*"
+        elif kind == "name":
+            test = value.lower() if axis != "attribute" else value
+            if value in NODE_TYPES and self.peek_op("("):
+                self.take()
+                self.expect(")")
+                test = f"{value}()"
+        else:
+            raise ValueError(f"Invalid step {value!r} in xpath: {self.expression!r}")
+        return (axis, test, self.parse_predicates())
+
+    def parse_predicates(self) -> list:
+        predicates = []
+        while self.peek_op("["):
+            self.take()
+            predicates.append(self.parse_or())
+            self.expect("]")
+        return predicates
+
+    def parse_primary(self):
+        kind, value = self.take()
+        if kind == "literal":
+            return ("literal", value)
+        if kind == "number":
+            return ("number", float(value))
+        if (kind, value) == ("op", "("):
+            expr = self.parse_or()
+            self.expect(")")
+            return expr
+        self.expect("(")
+        args = []
+        if not self.peek_op(")"):
+            args.append(self.parse_or())
+            while self.peek_op(","):
+                self.take()
+                args.append(self.parse_or())
+        self.expect(")")
+        return ("call", value, args)
+
+
+@lru_cache(maxsize=512)
+def compile_xpath(expression: str):
+    return _Parser(expression).parse()
+
+
+# -----------------------------------------------------------------------------
+# Evaluation
+# -----------------------------------------------------------------------------
+
+
+def _is_element(node) -> bool:
+    return hasattr(node, "tag_name")
+
+
+def _children(node) -> list:
+    return getattr(node, "children", [])
+
+
+def _descendants(node) -> list:
+    result = []
+    stack = list(reversed(_children(node)))
+    while stack:
+        current = stack.pop()
+        result.append(current)
+        stack.extend(reversed(_children(current)))
+    return result
+
+
+def _ancestors(node) -> list:
+    result = []
+    parent = node.parent
+    while parent is not None:
+        result.append(parent)
+        parent = parent.parent
+    return result
+
+
+def _siblings(node, following: bool) -> list:
+    parent = node.parent
+    if parent is None or isinstance(node, _Attribute):
+        return []
+    siblings = parent.children
+    index = next(i for i, sibling in enumerate(siblings) if sibling is node)
+    if following:
+        return siblings[index + 1 :]
+    return list(reversed(siblings[:index]))
+
+
+def _axis(node, axis: str) -> list:
+    if axis == "child":
+        return _children(node)
+    if axis == "descendant":
+        return _descendants(node)
+    if axis == "descendant-or-self":
+        return [node] + _descendants(node)
+    if axis == "self":
+        return [node]
+    if axis == "parent":
+        return [node.parent] if node.parent is not None else []
+    if axis == "ancestor":
+        return _ancestors(node)
+    if axis == "ancestor-or-self":
+        return [node] + _ancestors(node)
+    if axis == "following-sibling":
+        return _siblings(node, following=True)
+    if axis == "preceding-sibling":
+        return _siblings(node, following=False)
+    if axis == "attribute":
+        if not _is_element(node):
+            return []
+        return [_Attribute(k, v, node) for k, v in node.attrs.items()]
+    raise ValueError(f"Unsupported xpath axis: {axis}")
+
+
+def _node_test(node, test: str, axis: str) -> bool:
+    if test == "node()":
+        return True
+    if axis == "attribute":
+        return test == "*" or node.name == test
+    if test == "text()":
+        return not _is_element(node) and not isinstance(node, _Attribute)
+    if not _is_element(node) or node.tag_name == "#document":
+        return False
+    return test == "*" or node.tag_name == test
+
+
+def string_value(node) -> str:
+    if isinstance(node, _Attribute):
+        return node.value
+    if _is_element(node):
+        return node.string_value()
+    return node.data
+
+
+def _to_string(value) -> str:
+    if isinstance(value, list):
+        return string_value(value[0]) if value else ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    return value
+
+
+def _to_number(value) -> float:
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if isinstance(value, float):
+        return value
+    try:
+        return float(_to_string(value).strip())
+    except ValueError:
+        return float("nan")
+
+
+def _to_boolean(value) -> bool:
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, float):
+        return value != 0 and value == value
+    return bool(value)
+
+
+def _sorted(nodes: list) -> list:
+    unique = {id(node): node for node in nodes}
+    return sorted(unique.values(), key=lambda node: node.order)
+
+
+def _compare(op: str, left, right) -> bool:
+    # node-sets compare if any member satisfies the comparison
+    if isinstance(left, list):
+        return any(_compare(op, string_value(node), right) for node in left)
+    if isinstance(right, list):
+        return any(_compare(op, left, string_value(node)) for node in right)
+    if op in ("=", "!="):
+        if isinstance(left, bool) or isinstance(right, bool):
+            equal = _to_boolean(left) == _to_boolean(right)
+        elif isinstance(left, float) or isinstance(right, float):
+            equal = _to_number(left) == _to_number(right)
+        else:
+            equal = left == right
+        return equal if op == "=" else not equal
+    left, right = _to_number(left), _to_number(right)
+    return {
+        "<": left < right,
+        ">": left > right,
+        "<=": left <= right,
+        ">=": left >= right,
+    }[op]
+
+
+def _filter(nodes: list, predicates: list) -> list:
+    for predicate in predicates:
+        size = len(nodes)
+        kept = []
+        for position, node in enumerate(nodes, start=1):
+            value = _evaluate(predicate, node, position, size)
+            if isinstance(value, float):
+                if value == position:
+                    kept.append(node)
+            elif _to_boolean(value):
+                kept.append(node)
+        nodes = kept
+    return nodes
+
+
+def _step(nodes: list, step) -> list:
+    axis, test, predicates = step
+    result = []
+    for node in nodes:
+        candidates = [n for n in _axis(node, axis) if _node_test(n, test, axis)]
+        result.extend(_filter(candidates, predicates))
+    return _sorted(result)
+
+
+def _call(name: str, args: list, node, position: int, size: int):
+    values = [_evaluate(arg, node, position, size) for arg in args]
+    if name == "contains":
+        return _to_string(values[1]) in _to_string(values[0])
+    if name == "starts-with":
+        return _to_string(values[0]).startswith(_to_string(values[1]))
+    if name == "not":
+        return not _to_boolean(values[0])
+    if name == "normalize-space":
+        text = _to_string(values[0]) if values else string_value(node)
+        return " ".join(text.split())
+    if name == "translate":
+        source, src, dst = (_to_string(v) for v in values)
+        table = {}
+        for i, char in enumerate(src):
+            if ord(char) not in table:
+                table[ord(char)] = dst[i] if i < len(dst) else None
+        return source.translate(table)
+    if name == "string":
+        return _to_string(values[0]) if values else string_value(node)
+    if name == "concat":
+        return "".join(_to_string(v) for v in values)
+    if name == "string-length":
+        return float(len(_to_string(values[0]) if values else string_value(node)))
+    if name == "count":
+        return float(len(values[0]))
+    if name == "position":
+        return float(position)
+    if name == "last":
+        return float(size)
+    if name == "boolean":
+        return _to_boolean(values[0])
+    if name == "number":
+        return _to_number(values[0]) if values else _to_number(string_value(node))
+    if name == "true":
+        return True
+    if name == "false":
+        return False
+    raise ValueError(f"Unsupported xpath function: {name}()")
+
+
+def _evaluate(expr, node, position: int = 1, size: int = 1):
+    kind = expr[0]
+    if kind == "path":
+        start, steps = expr[1], expr[2]
+        if start == "root":
+            nodes = [node.root if hasattr(node, "root") else _ancestors(node)[-1]]
+        elif start == "context":
+            nodes = [node]
+        else:
+            nodes = _evaluate(start, node, position, size)
+            if not isinstance(nodes, list):
+                raise ValueError("xpath path step applied to a non node-set")
+        for step in steps:
+            nodes = _step(nodes, step)
+        return nodes
+    if kind == "filter":
+        nodes = _evaluate(expr[1], node, position, size)
+        return _filter(nodes, expr[2])
+    if kind == "union":
+        left = _evaluate(expr[1], node, position, size)
+        right = _evaluate(expr[2], node, position, size)
+        return _sorted(left + right)
+    if kind == "or":
+        return _to_boolean(_evaluate(expr[1], node, position, size)) or _to_boolean(
+            _evaluate(expr[2], node, position, size)
+        )
+    if kind == "and":
+        return _to_boolean(_evaluate(expr[1], node, position, size)) and _to_boolean(
+            _evaluate(expr[2], node, position, size)
+        )
+    if kind == "compare":
+        left = _evaluate(expr[2], node, position, size)
+        right = _evaluate(expr[3], node, position, size)
+        return _compare(expr[1], left, right)
+    if kind == "literal":
+        return expr[1]
+    if kind == "number":
+        return expr[1]
+    if kind == "call":
+        return _call(expr[1], expr[2], node, position, size)
+    raise ValueError(f"Unknown xpath expression: {expr!r}")
+
+
+def evaluate_xpath(expression: str, context) -> list:
+    """
+    Evaluate expression against a snapshot node, returning the matched
+    nodes in document order.
+    """
+    result = _evaluate(compile_xpath(expression), context)
+    if not isinstance(result, list):
+        raise ValueError(f"xpath does not select nodes: {expression!r}")
+    return result
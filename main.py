@@ -26,7 +26,10 @@ if __name__ == "__main__":
 
     # init configs
     dotenv.load_dotenv(dotenv_path=".env.local")
-    token = os.getenv(key="GITHUB_ACCESS_TOKEN")
+    # several tokens in GITHUB_ACCESS_TOKENS are rotated, separated by commas
+    token = os.getenv(key="GITHUB_ACCESS_TOKENS") or os.getenv(
+        key="GITHUB_ACCESS_TOKEN"
+    )
     root_dir = os.path.dirname(__file__)
 
     for platfrom in Platform:
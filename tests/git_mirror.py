@@ -0,0 +1,85 @@
+import os
+import sys
+import tempfile
+import subprocess
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+
+def git(cwd: str, *args: str) -> str:
+    result = subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+    return result.stdout.decode().strip()
+
+
+def make_origin(tmp_dir: str) -> tuple[str, str]:
+    """A local origin owner/repo.git with one commit, return its url and sha."""
+    work_dir = os.path.join(tmp_dir, "work")
+    os.makedirs(os.path.join(work_dir, "contracts"))
+    with open(os.path.join(work_dir, "contracts", "Vault.sol"), "w") as f:
+        f.write("".join(f"// line {i}\n" for i in range(1, 21)))
+    with open(os.path.join(work_dir, "README.md"), "w") as f:
+        f.write("readme\n")
+    git(tmp_dir, "init", "--quiet", "-b", "main", work_dir)
+    git(work_dir, "add", ".")
+    git(work_dir, "commit", "--quiet", "-m", "init")
+    commit = git(work_dir, "rev-parse", "HEAD")
+
+    origin_dir = os.path.join(tmp_dir, "origin")
+    git(tmp_dir, "clone", "--quiet", "--bare", work_dir, f"{origin_dir}/owner/repo.git")
+    return origin_dir + "/{repo}.git", commit
+
+
+if __name__ == "__main__":
+    from crawlers.base.github import GitHubCrawler
+    from crawlers.base.mirror import GitMirror
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        clone_url, commit = make_origin(tmp_dir)
+        crawler = GitHubCrawler(
+            "", os.path.join(tmp_dir, "blobs"), mirror_dir=os.path.join(tmp_dir, "m")
+        )
+        crawler.mirror = GitMirror(os.path.join(tmp_dir, "m"), clone_url)
+        # any API request would fail, everything must come from the mirror
+        crawler.base_api_url = "http://127.0.0.1:9"
+
+        url = f"https://github.com/owner/repo/blob/{commit}/contracts/Vault.sol"
+        data = crawler.fetch_data(url + "#L3-L5")
+        content = crawler.blobs.get(data["sha"]).decode()
+        assert data["path"] == "contracts/Vault.sol"
+        assert content.splitlines()[2:5] == ["// line 3", "// line 4", "// line 5"]
+
+        data = crawler.fetch_data("https://github.com/owner/repo")
+        assert data["ref"] == "main"
+        assert list(data["files"]) == ["contracts/Vault.sol"]
+        assert crawler.blobs.has(data["files"]["contracts/Vault.sol"])
+
+        # a branch moved since the clone is read as of the next run
+        work_dir = os.path.join(tmp_dir, "work")
+        with open(os.path.join(work_dir, "contracts", "Vault.sol"), "a") as f:
+            f.write("// line 21\n")
+        git(work_dir, "commit", "--quiet", "-am", "append")
+        git(work_dir, "push", "--quiet", clone_url.format(repo="owner/repo"), "main")
+        crawler.mirror = GitMirror(os.path.join(tmp_dir, "m"), clone_url)
+        data = crawler.fetch_data("https://github.com/owner/repo/blob/main/contracts/Vault.sol")
+        assert crawler.blobs.get(data["sha"]).decode().endswith("// line 21\n")
+        # a commit sha resolves without fetching
+        crawler.mirror = GitMirror(os.path.join(tmp_dir, "m"), clone_url)
+        crawler.mirror.resolve("owner/repo", commit)
+        assert "owner/repo" not in crawler.mirror._fetched
+
+        # a repository that cannot be cloned falls back to the API
+        try:
+            crawler.fetch_data("https://github.com/owner/missing/blob/main/A.sol")
+        except Exception as e:
+            print(f"fallback to the API: {e!r}")
+        else:
+            raise AssertionError("expected the API fallback to fail offline")
+
+        print("git mirror ok")
@@ -0,0 +1,71 @@
+import os
+import re
+import sys
+import json
+import time
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+from configs.base.types import language_candidates
+from configs.quantstamp.report import REPORT_DATA_PATH
+from helpers.report import get_languages_of_report
+
+
+def get_languages_of_report_by_pattern(report: dict) -> dict[str, int]:
+    """The former detector: str(report) scanned once per language."""
+    languages = {}
+    report_str = str(report)
+    urls = re.findall(r"https?://[^\s]+", report_str)
+    for pattern, lang_name in language_candidates.items():
+        for url in urls:
+            match = re.search(r"github\.com/.+/.+/blob/.+/(.+)#", url)
+            file_path = match.group(1) if match else ""
+            if re.search(pattern, file_path):
+                languages[lang_name] = languages.get(lang_name, 0) + 1
+        matches = re.findall(pattern, report_str)
+        languages[lang_name] = languages.get(lang_name, 0) + len(matches)
+    return languages
+
+
+def biggest_reports(report_dir: str, count: int) -> list[str]:
+    paths = []
+    for root, _, filenames in os.walk(report_dir):
+        paths += [os.path.join(root, filename) for filename in filenames]
+    return sorted(paths, key=os.path.getsize, reverse=True)[:count]
+
+
+def time_detector(detector, reports: list[dict], runs: int) -> float:
+    """Mean seconds of detector on every report."""
+    start = time.perf_counter()
+    for _ in range(runs):
+        for report in reports:
+            detector(report)
+    return (time.perf_counter() - start) / runs
+
+
+if __name__ == "__main__":
+    # python tests/language_benchmark.py [data root] [report count]
+    data_root = sys.argv[1] if len(sys.argv) > 1 else root_dir
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    report_dir = os.path.dirname(REPORT_DATA_PATH.format(root_dir=data_root, name=""))
+    paths = biggest_reports(report_dir, count)
+    if not paths:
+        sys.exit(f"no reports in {report_dir}")
+
+    reports = []
+    for path in paths:
+        with open(path, "r") as f:
+            reports.append(json.load(f))
+    for path, report in zip(paths, reports):
+        assert get_languages_of_report(report) == get_languages_of_report_by_pattern(
+            report
+        ), path
+
+    size = sum(os.path.getsize(path) for path in paths) / 1e6
+    print(f"{len(paths)} biggest Quantstamp reports, {size:.1f} MB")
+    before = time_detector(get_languages_of_report_by_pattern, reports, runs=5)
+    after = time_detector(get_languages_of_report, reports, runs=5)
+    print(f"per-pattern scan: {before * 1000:.1f}ms")
+    print(f"one-pass scan:    {after * 1000:.1f}ms ({before / after:.1f}x faster)")
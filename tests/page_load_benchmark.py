@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+# a report-like page whose images and analytics script are slow to load
+IMAGE_COUNT = 20
+RESOURCE_DELAY = 0.5
+PAGE = (
+    "<html><head>"
+    '<script src="/analytics.js?host=www.google-analytics.com"></script>'
+    "</head><body><main><h1>Report</h1>"
+    + "".join(f'<p>finding {i}</p><img src="/image{i}.png">' for i in range(IMAGE_COUNT))
+    + "</main></body></html>"
+)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == "/":
+            body, content_type = PAGE.encode(), "text/html"
+        else:
+            time.sleep(RESOURCE_DELAY)
+            body, content_type = b"", "application/octet-stream"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def time_page_loads(urls: list[str], light: bool, runs: int) -> float:
+    """Mean seconds of driver.get and the wait for <main>, per page."""
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from crawlers.base.pool import start_chrome
+
+    options = Options()
+    for option in ["--headless", "--no-sandbox", "--disable-dev-shm-usage"]:
+        options.add_argument(option)
+    driver = start_chrome(options, light)
+    try:
+        total = 0.0
+        for _ in range(runs):
+            for url in urls:
+                # drop the cache so every run downloads the page again
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+                start = time.perf_counter()
+                driver.get(url)
+                WebDriverWait(driver, 30).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "main"))
+                )
+                total += time.perf_counter() - start
+        return total / (runs * len(urls))
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    # python tests/page_load_benchmark.py [url ...]
+    # without urls a local fixture page is loaded
+    urls = sys.argv[1:]
+    server = None
+    if not urls:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        urls = [f"http://127.0.0.1:{server.server_port}/"]
+
+    full = time_page_loads(urls, light=False, runs=3)
+    light = time_page_loads(urls, light=True, runs=3)
+    print(f"full profile:  {full:.2f}s per page")
+    print(f"light profile: {light:.2f}s per page ({full / light:.1f}x faster)")
+    if server is not None:
+        server.shutdown()
@@ -0,0 +1,74 @@
+import os
+import sys
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+
+class FakeClock:
+    """Stands in for the time module of rate_limit, sleep advances it."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = 0.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+        self.slept += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict):
+        self.status_code = status_code
+        self.headers = headers
+
+
+if __name__ == "__main__":
+    from crawlers.base import rate_limit
+    from configs.base.github import GITHUB_RATE_LIMIT
+
+    clock = FakeClock()
+    rate_limit.time = clock
+    governor = rate_limit.RateGovernor(["token"])
+    reset_at = clock.now + 600
+
+    # the last request of the window is answered, then the quota is spent
+    token = governor.acquire()
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset_at)}
+    assert not governor.update(token, FakeResponse(200, headers))
+
+    # a throttled request pauses the token until the reset
+    token = governor.acquire()
+    assert governor.update(token, FakeResponse(403, headers))
+
+    # the next request waits for the reset, not forever
+    clock.slept = 0.0
+    assert governor.acquire() == "token"
+    assert reset_at <= clock.now < reset_at + 5, clock.now - reset_at
+    budget = governor._budgets["token"]
+    assert budget.remaining == GITHUB_RATE_LIMIT
+    assert budget.reset_at > clock.now
+
+    # the refilled window sends requests at its spread rate again
+    for _ in range(10):
+        governor.acquire()
+    assert clock.now < reset_at + 15, clock.now - reset_at
+
+    # an exhausted quota without a throttled response also waits for the reset
+    clock = FakeClock()
+    rate_limit.time = clock
+    governor = rate_limit.RateGovernor(["token"])
+    budget = governor._budgets["token"]
+    budget.remaining, budget.bucket = 0, 0.0
+    budget.reset_at = clock.now + 120
+    governor.acquire()
+    assert clock.slept <= 121, clock.slept
+
+    print("rate limit ok")
@@ -0,0 +1,118 @@
+import os
+import sys
+import json
+import tempfile
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+
+class FakeGitHubCrawler:
+    """Answers fetch_many without the network, recording the urls fetched."""
+
+    def __init__(self, blob_dir: str, issue_pages: int = 1):
+        from crawlers.base.blob_store import BlobStore
+        from crawlers.base.github import GitHubCrawler
+
+        self.parse_url = GitHubCrawler.parse_url.__get__(self)
+        self.base_url = "https://github.com"
+        from configs.base.github import GITHUB_URL_PATTERN
+
+        self.url_pattern = GITHUB_URL_PATTERN
+        self.blobs = BlobStore(blob_dir)
+        self.issue_pages = issue_pages
+        self.fetched: list[str] = []
+
+    def count_issue_pages(self, repo: str) -> int:
+        return self.issue_pages
+
+    def fetch_many(self, jobs):
+        for job_url, url in jobs:
+            self.fetched.append(url)
+            parsed_url = self.parse_url(url)
+            if parsed_url["type"] == "issues":
+                issues = {number: {"number": number} for number in range(1, 50)}
+                yield job_url, {"type": "issues", "issues": issues}
+            elif parsed_url["type"] == "file":
+                sha = self.blobs.put(b"line 1\nline 2\n")
+                path = parsed_url["file_path"]
+                yield job_url, {"type": "file", "path": path, "sha": sha}
+            else:
+                yield job_url, {"type": parsed_url["type"]}
+
+
+def make_crawler(tmp_dir: str, report: dict):
+    from crawlers.base.repo import RepoCrawlerBase, RepoCrawlerBaseConfig
+
+    report_dir = os.path.join(tmp_dir, "reports")
+    os.makedirs(report_dir)
+    with open(os.path.join(report_dir, "report.json"), "w") as f:
+        json.dump(report, f)
+    config = RepoCrawlerBaseConfig(
+        token="",
+        root_dir=tmp_dir,
+        report_dir_path=report_dir,
+        repo_data_dir_path=os.path.join(tmp_dir, "repos"),
+        journal_path=os.path.join(tmp_dir, "journal", "repo.jsonl"),
+    )
+    crawler = RepoCrawlerBase(config)
+    crawler.github_crawler = FakeGitHubCrawler(os.path.join(tmp_dir, "blobs"))
+    return crawler
+
+
+def journal_status(crawler) -> dict[str, str]:
+    with open(crawler.journal.path, "r") as f:
+        return {
+            record["unit"]: record["status"] for record in map(json.loads, f)
+        }
+
+
+if __name__ == "__main__":
+    issues = [
+        {"url": f"https://github.com/o/findings/issues/{number}"}
+        for number in range(1, 7)
+    ]
+    # a bare issue list link cites no issue and must not become a job
+    links = issues + [
+        {"url": "https://github.com/o/findings/issues"},
+        {"url": "https://github.com/o/findings/issues?q=is%3Aopen"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        crawler = make_crawler(tmp_dir, {"links": links})
+        crawler.crawl_all()
+        fetched = crawler.github_crawler.fetched
+        assert fetched == ["https://github.com/o/findings/issues"], fetched
+        for link in issues:
+            assert crawler.has_resource(link["url"]), link["url"]
+        # only the cited issues are saved from the bulk list
+        assert not crawler.has_resource("https://github.com/o/findings/issues/7")
+        assert journal_status(crawler) == {"report": "done"}
+
+    # without cited issues to bulk list, the list link was fetched alone
+    links = [
+        {"url": "https://github.com/o/repo/issues"},
+        {"url": "https://github.com/o/repo/issues/3"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        crawler = make_crawler(tmp_dir, {"links": links})
+        crawler.crawl_all()
+        fetched = crawler.github_crawler.fetched
+        assert fetched == ["https://github.com/o/repo/issues/3"], fetched
+        assert journal_status(crawler) == {"report": "done"}
+
+    # links the crawler cannot fetch are not references, the report is done
+    links = [
+        {"url": "https://github.com/o/repo/pull/4"},
+        {"url": "https://github.com/o/repo/commit/" + "a" * 40},
+        {"url": "https://github.com/o/repo/blob/main/audit.pdf"},
+        {"url": "https://github.com/o/repo/blob/main/A.sol#L1-L2"},
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        crawler = make_crawler(tmp_dir, {"links": links})
+        crawler.crawl_all()
+        fetched = crawler.github_crawler.fetched
+        assert fetched == ["https://github.com/o/repo/blob/main/A.sol"], fetched
+        assert journal_status(crawler) == {"report": "done"}
+
+    print("repo crawler ok")
@@ -0,0 +1,280 @@
+import os
+import sys
+
+# Add the project root to the Python path to resolve imports
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+
+REPORT_PAGE = """
+<html><head><title>Report</title><script>window.x = 1;</script></head>
+<body><main><div class="report-contents">
+<aside>Table of contents</aside>
+<h1 id="summary">Summary</h1>
+<p>The   audit covered
+   <a href="/reports/2024-01-foo#scope">scope</a> and <code>Vault.sol</code>.</p>
+<h1 id="high">High Risk Findings (1)</h1>
+<h2>[H-01] Reentrancy in <code>withdraw</code></h2>
+<p><em>Submitted by</em> alice</p>
+<h3>Impact</h3>
+<p>Funds can be drained.</p>
+<blockquote>quoted</blockquote>
+<h3>Proof of Concept</h3>
+<ul><li>step one<ol><li>call</li><li>re-enter</li></ol></li><li>step two</li></ul>
+<table><thead><tr><th>Contract</th><th>Line</th></tr></thead>
+<tbody><tr><td>Vault</td><td>42</td></tr><tr><td></td><td></td></tr></tbody></table>
+<pre><code>function withdraw() {
+    msg.sender.call("");
+}</code></pre>
+</div></main></body></html>
+"""
+
+QUANTSTAMP_PAGE = """
+<html><body><div><div><div>
+<div>navigation</div>
+<div id="container">
+<section id="executive-summary">
+  <div class="x sc-eAKupa">Auditors</div>
+  <div><div><div>cell 1a</div></div><div><div>cell 2a</div><div>cell 2b</div></div></div>
+  <ul><li>one</li></ul>
+</section>
+<section id="suggestions">
+  <h1>Auditor SUGGESTIONS</h1>
+  <h3>S1: Use SafeERC20</h3><p>detail one</p><p>detail two</p>
+  <h4>S2</h4><div>other</div>
+</section>
+<section id="findings">
+  <table><thead><tr><th>ID</th><th>Severity</th></tr></thead>
+  <tbody><tr><th>QSP-1</th><td>High</td></tr><tr><td>QSP-2</td><td>Low</td></tr></tbody></table>
+  <a href="/report#findings-qs1">QSP-1</a><a href="/other">other</a>
+  <div><div><h3>QSP-1 Reentrancy</h3><span>HIGH</span><span>Fixed</span>
+    <div class="sc-khjJjR"><span>Update text</span><code>u()</code></div>
+    <p><strong>Recommendation</strong> use a guard</p>
+    <div class="code-block">guard()</div></div></div>
+  <div id="findings-qs1"><h4>QSP-1 detail</h4><p>body</p></div>
+</section>
+<section id="coverage">
+  <div><span>covered <code>a.sol</code></span><span><table><tr><td><span>in table</span></td></tr></table></span><span><pre><span>in pre</span></pre></span></div>
+  <div><p>title</p><h4>heading</h4><ol><li>item</li></ol></div>
+  <span><ol><li>listed</li></ol></span>
+  <code>inline</code><pre><code>block</code></pre>
+</section>
+</div>
+</div></div></div></body></html>
+"""
+
+
+def crawl_snapshot(page: str) -> dict:
+    from selenium.webdriver.common.by import By
+    from crawlers.code4rena.report import ReportCrawler
+    from helpers.snapshot import parse_page_source
+
+    # skip __init__, no browser is needed to parse a snapshot
+    crawler = ReportCrawler.__new__(ReportCrawler)
+    crawler.set_project_title_tag()
+    crawler.document = parse_page_source(page, "https://code4rena.com/reports/2024-01-foo")
+    report = crawler.find_element(By.CLASS_NAME, "report-contents")
+    sections = crawler._ReportCrawler__split(report, crawler.title_tag)
+    return {"details": [crawler.handle_section(section) for section in sections]}
+
+
+def test_code4rena_report_from_snapshot():
+    details = crawl_snapshot(REPORT_PAGE)["details"]
+    assert [d["title"] for d in details] == ["Summary", "High Risk Findings (1)"]
+
+    summary = details[0]["content"][0]
+    assert summary["content"] == ["The audit covered scope and Vault.sol."]
+    assert summary["links"] == [
+        {"hypertext": "scope", "url": "https://code4rena.com/reports/2024-01-foo#scope"}
+    ]
+    assert summary["codes"] == ["Vault.sol"]
+
+    finding = details[1]["content"][0]
+    assert finding["subtitle"] == "[H-01] Reentrancy in withdraw"
+    impact, poc = finding["content"][1], finding["content"][2]
+    assert impact["smtitle"] == "Impact"
+    # like WebElement.find_elements, only nested blockquotes are collected
+    assert impact["blockquotes"] == []
+    assert poc["content"][0] == {
+        "1": "step one",
+        "1-1": "call",
+        "1-2": "re-enter",
+        "2": "step two",
+    }
+    assert poc["content"][1] == {"column": ["Contract", "Line"], "rows": [["Vault", "42"]]}
+    assert poc["content"][2:] == []
+    assert poc["codes"] == ['function withdraw() {\n    msg.sender.call("");\n}']
+
+
+def test_xpath_and_css_locators():
+    from selenium.webdriver.common.by import By
+    from helpers.snapshot import parse_page_source
+
+    document = parse_page_source(REPORT_PAGE)
+    report = document.find_element(By.CSS_SELECTOR, "main > div.report-contents")
+    assert [e.tag_name for e in report.find_elements(By.XPATH, "./ol | ./ul")] == ["ul"]
+    assert len(report.find_elements(By.XPATH, ".//li[not(ancestor::ol)]")) == 2
+    assert report.find_element(By.XPATH, ".//h3/following-sibling::*[1]").text == (
+        "Funds can be drained."
+    )
+    assert document.find_element(By.XPATH, "//code/ancestor::pre[1]").tag_name == "pre"
+    assert [e.text for e in document.find_elements(By.CSS_SELECTOR, "h1[id^='hi']")] == [
+        "High Risk Findings (1)"
+    ]
+
+
+def test_quantstamp_locators():
+    """Every locator the report crawlers evaluate on a snapshot."""
+    from selenium.webdriver.common.by import By
+    from configs.quantstamp.report import REPORT_CONTAINER_XPATH, REPORT_SECTION_XPATH
+    from helpers.snapshot import parse_page_source
+
+    document = parse_page_source(QUANTSTAMP_PAGE)
+
+    def texts(elements):
+        return [e.text for e in elements]
+
+    def tags(elements):
+        return [e.tag_name for e in elements]
+
+    # absolute paths with positions
+    container = document.find_element(By.XPATH, REPORT_CONTAINER_XPATH)
+    assert container.get_attribute("id") == "container"
+    section = document.find_element(By.XPATH, REPORT_SECTION_XPATH.format(number=2))
+    assert section.get_attribute("id") == "suggestions"
+
+    summary = document.find_element(By.ID, "executive-summary")
+    assert texts(summary.find_elements(By.XPATH, ".//div[contains(@class,'sc-eAKupa')]")) == [
+        "Auditors"
+    ]
+    assert texts(summary.find_elements(By.XPATH, "./div/div[1]/div")) == ["cell 1a"]
+    assert texts(summary.find_elements(By.XPATH, "./div/div[2]/div")) == [
+        "cell 2a",
+        "cell 2b",
+    ]
+    assert summary.find_element(By.XPATH, ".//ul | .//ol").tag_name == "ul"
+    assert texts(summary.find_element(By.TAG_NAME, "ul").find_elements(By.XPATH, "./li")) == [
+        "one"
+    ]
+
+    # translate(), text(), ancestor, following-sibling and CSS groups
+    h1 = document.find_element(
+        By.XPATH,
+        "//h1[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ',"
+        "'abcdefghijklmnopqrstuvwxyz'), 'auditor suggestions')]",
+    )
+    suggestions = h1.find_element(By.XPATH, "ancestor::section")
+    assert suggestions.get_attribute("id") == "suggestions"
+    assert tags(suggestions.find_elements(By.CSS_SELECTOR, "h3, h4")) == ["h3", "h4"]
+    h3 = suggestions.find_element(By.TAG_NAME, "h3")
+    sibling = h3.find_element(By.XPATH, "following-sibling::*[1]")
+    assert sibling.text == "detail one"
+    assert sibling.find_element(By.XPATH, "following-sibling::*[1]").text == "detail two"
+
+    findings = document.find_element(By.ID, "findings")
+    table = document.find_element(
+        By.XPATH, "//table[.//th[contains(.,'Severity')] and .//th[contains(.,'ID')]]"
+    )
+    rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+    assert [texts(tr.find_elements(By.XPATH, "./th|./td")) for tr in rows] == [
+        ["QSP-1", "High"],
+        ["QSP-2", "Low"],
+    ]
+    assert texts(findings.find_elements(By.CSS_SELECTOR, "a[href*='#findings-qs']")) == [
+        "QSP-1"
+    ]
+    (detail,) = document.find_elements(By.CSS_SELECTOR, "[id^='findings-qs']")
+    assert detail.find_element(By.CSS_SELECTOR, "h2, h3, h4").text == "QSP-1 detail"
+
+    # a finding card, found from its title up the nearest div
+    (card,) = findings.find_elements(By.XPATH, ".//h3/ancestor::div[1]")
+    assert card.find_element(By.CSS_SELECTOR, "h3").text == "QSP-1 Reentrancy"
+    lower = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz')"
+    severity = " or ".join(
+        f"contains({lower},'{word}')"
+        for word in ["critical", "high", "medium", "low", "informational"]
+    )
+    assert card.find_element(By.XPATH, f".//*[{severity}]").text == "HIGH"
+    status = " or ".join(
+        f"contains({lower},'{word}')"
+        for word in ["fix", "mitigat", "acknowledg", "open"]
+    )
+    assert card.find_element(By.XPATH, f".//*[{status}]").text == "Fixed"
+    update = card.find_element(By.CSS_SELECTOR, "div.sc-khjJjR")
+    assert update.find_element(By.TAG_NAME, "span").text == "Update text"
+    assert texts(update.find_elements(By.TAG_NAME, "code")) == ["u()"]
+    assert tags(card.find_elements(By.XPATH, "./*/*")) == ["span", "code", "strong"]
+    paragraph = card.find_element(By.TAG_NAME, "p")
+    assert paragraph.find_element(By.XPATH, ".//strong").text == "Recommendation"
+    assert texts(card.find_elements(By.CLASS_NAME, "code-block")) == ["guard()"]
+
+    coverage = document.find_element(By.ID, "coverage")
+    divs = coverage.find_elements(By.XPATH, "./div")
+    assert len(divs) == 2
+    assert divs[1].find_element(By.XPATH, "./*[not(self::h4)]").text == "title"
+    assert divs[1].find_element(By.XPATH, "./p").text == "title"
+    assert tags(coverage.find_elements(By.XPATH, "./*/*[not(self::pre)]")) == [
+        "span", "span", "span", "p", "h4", "ol", "ol", "code"
+    ]
+    assert texts(coverage.find_elements(By.XPATH, ".//code[not(ancestor::pre)]")) == [
+        "a.sol",
+        "inline",
+    ]
+    xpath = ".//{tag}[not(ancestor::pre) and not(ancestor::table)]"
+    contents = coverage.find_elements(
+        By.XPATH, xpath.format(tag="span") + "|" + xpath.format(tag="li")
+    )
+    assert tags(contents) == ["span", "span", "span", "li", "span", "li"]
+    assert texts(contents)[0] == "covered a.sol"
+    assert tags(
+        coverage.find_elements(By.XPATH, "./div/span/table | ./div/span/pre")
+    ) == ["table", "pre"]
+    assert texts(coverage.find_elements(By.XPATH, "./span/ul | ./span/ol")) == ["listed"]
+    assert tags(divs[1].find_elements(By.XPATH, "./ol | ./ul")) == ["ol"]
+    assert tags(container.find_elements(By.XPATH, "./*")) == ["section"] * 4
+
+
+def test_text_transform():
+    """Computed text-transform applies to visible text, as in WebDriver."""
+    from selenium.webdriver.common.by import By
+    from helpers.snapshot import parse_page_source, snapshot_from_tree
+
+    def cell(text: str, transform: str) -> list:
+        return ["td", {}, ["table-cell", "visible", "normal", transform], [text]]
+
+    tree = {
+        "base_url": "https://example.com/",
+        "tree": [
+            "html", {}, ["block", "visible", "normal", "none"], [
+                ["tr", {}, ["table-row", "visible", "normal", "uppercase"], [
+                    cell("high", "uppercase"),
+                    cell("fixed", "none"),
+                    cell("partially fixed", "capitalize"),
+                    cell("MEDIUM", "lowercase"),
+                ]],
+            ],
+        ],
+    }
+    cells = snapshot_from_tree(tree).find_elements(By.TAG_NAME, "td")
+    assert [td.text.strip() for td in cells] == [
+        "HIGH", "fixed", "Partially Fixed", "medium"
+    ]
+
+    # trees cached before text-transform was serialized leave text as is
+    tree["tree"][3][0][3][0][2] = ["table-cell", "visible", "normal"]
+    cell = snapshot_from_tree(tree).find_element(By.TAG_NAME, "td")
+    assert cell.text == "high"
+
+    # parsed pages follow inline styles, inherited like the computed value
+    document = parse_page_source(
+        '<div style="text-transform: uppercase"><p>high <b>risk</b></p></div>'
+    )
+    assert document.find_element(By.TAG_NAME, "b").text == "RISK"
+    assert document.find_element(By.TAG_NAME, "p").text == "HIGH RISK"
+
+
+if __name__ == "__main__":
+    test_code4rena_report_from_snapshot()
+    test_xpath_and_css_locators()
+    test_quantstamp_locators()
+    test_text_transform()
+    print("snapshot parser OK")